@@ -75,6 +75,9 @@ async def lifespan(app: FastAPI):
 
     logger.info("application_shutdown", message="FastAPI application shutting down")
 
+    from pipeline.asset_manager import AssetManager
+    await AssetManager.close_http_session()
+
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -34,7 +34,10 @@ class Job(Base):
     video_url = Column(String, nullable=True)  # Cloud storage URL for final video
 
     # Cloud storage and versioning
-    cloud_urls = Column(JSON, nullable=True)  # Dict of all cloud URLs (scenes, audio, etc.)
+    # Cloud paths of persisted assets (scenes, audio, etc.) as returned by
+    # persist_job_assets(); rows written before paths were stored hold
+    # presigned URLs. Presign with AssetPersistenceService.presign_job_assets().
+    cloud_urls = Column(JSON, nullable=True)
     version = Column(Integer, default=1, nullable=False)  # Version number for edits
     previous_version_url = Column(String, nullable=True)  # Backup of previous final video
     edit_history = Column(JSON, nullable=True, default=list)  # List of edit operations
@@ -51,8 +54,14 @@ class Job(Base):
     def __repr__(self):
         return f"<Job(id={self.id}, status={self.status}, product={self.product_name})>"
 
-    def to_dict(self):
-        """Convert job to dictionary"""
+    def to_dict(self, cloud_urls=None):
+        """
+        Convert job to dictionary
+
+        The stored cloud_urls column holds cloud paths, not URLs, so it is
+        only reported when the caller passes presigned cloud_urls (see
+        AssetPersistenceService.presign_job_assets()).
+        """
         return {
             "id": self.id,
             "status": self.status,
@@ -63,7 +72,7 @@ class Job(Base):
             "cta_text": self.cta_text,
             "product_image_path": self.product_image_path,
             "video_url": self.video_url,
-            "cloud_urls": self.cloud_urls,
+            "cloud_urls": cloud_urls,
             "version": self.version,
             "previous_version_url": self.previous_version_url,
             "edit_history": self.edit_history,
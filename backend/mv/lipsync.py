@@ -239,8 +239,10 @@ def clip_audio(audio_path: str, start_time: float, end_time: float) -> tuple[str
 
     except Exception as e:
         # Clean up temp file on error
-        if os.path.exists(temp_path):
+        try:
             os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
         raise RuntimeError(f"Audio clipping failed: {str(e)}")
 
 
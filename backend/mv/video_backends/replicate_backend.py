@@ -72,7 +72,7 @@ def generate_video_replicate(
         input_params["seed"] = seed
 
     # Handle reference image
-    temp_file = None
+    temp_path = None
     file_handle = None
 
     try:
@@ -89,15 +89,15 @@ def generate_video_replicate(
         elif reference_image_base64:
             # Deprecated: Decode base64 image and write to temp file
             image_data = base64.b64decode(reference_image_base64)
-            temp_file = tempfile.NamedTemporaryFile(
-                suffix=".png", delete=False
-            )
-            temp_file.write(image_data)
-            temp_file.flush()
-            temp_file.close()  # Close to allow other processes to read
+            # Write through the raw descriptor; no file object is needed
+            fd, temp_path = tempfile.mkstemp(suffix=".png")
+            try:
+                os.write(fd, image_data)
+            finally:
+                os.close(fd)
 
             # Open for reading and pass to API
-            file_handle = open(temp_file.name, "rb")
+            file_handle = open(temp_path, "rb")
             input_params["reference_images"] = [file_handle]
 
         # Run the model
@@ -119,5 +119,8 @@ def generate_video_replicate(
         if file_handle:
             file_handle.close()
         # Only delete temp file if we created one (base64 path)
-        if temp_file and os.path.exists(temp_file.name):
-            os.unlink(temp_file.name)
+        if temp_path:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
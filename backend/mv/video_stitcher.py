@@ -21,6 +21,7 @@ from moviepy import VideoFileClip, concatenate_videoclips
 from pydantic import BaseModel, Field
 
 from config import settings
+from services.audio_trimmer import get_audio_duration, get_audio_file_path
 
 logger = logging.getLogger(__name__)
 
@@ -64,20 +65,7 @@ def _get_audio_file_path(audio_id: str) -> Optional[Path]:
     Returns:
         Path to audio file if found, None otherwise
     """
-    audio_dir = Path(__file__).parent / "outputs" / "audio"
-
-    # Check for .mp3 extension (primary format)
-    audio_path = audio_dir / f"{audio_id}.mp3"
-    if audio_path.exists():
-        return audio_path
-
-    # Fallback to other formats
-    for ext in ['.m4a', '.opus', '.webm', '.ogg', '.aac']:
-        audio_path = audio_dir / f"{audio_id}{ext}"
-        if audio_path.exists():
-            return audio_path
-
-    return None
+    return get_audio_file_path(audio_id)
 
 
 def _get_local_video_path(video_id: str) -> Optional[Path]:
@@ -393,10 +381,9 @@ def stitch_videos(
                 from moviepy import VideoFileClip
                 total_video_duration = sum(VideoFileClip(path).duration for path in video_paths)
 
-                # Check if audio needs trimming
-                from pydub import AudioSegment
-                audio = AudioSegment.from_file(str(audio_path))
-                audio_duration = len(audio) / 1000.0  # Convert to seconds
+                # Check if audio needs trimming (duration read from the
+                # container header, without decoding the audio)
+                audio_duration = get_audio_duration(audio_path)
 
                 if audio_duration > total_video_duration:
                     # Trim audio to match video duration
@@ -470,9 +457,9 @@ def stitch_videos(
             if audio_overlay_applied and audio_overlay_path:
                 # Get audio duration
                 try:
-                    from pydub import AudioSegment
-                    audio = AudioSegment.from_file(audio_overlay_path)
-                    metadata["audio_overlay_duration_seconds"] = round(len(audio) / 1000.0, 2)
+                    metadata["audio_overlay_duration_seconds"] = round(
+                        get_audio_duration(Path(audio_overlay_path)), 2
+                    )
                 except Exception:
                     pass
 
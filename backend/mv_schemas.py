@@ -400,3 +400,23 @@ class SceneReorderResponse(BaseModel):
                 ]
             }
         }
+
+
+class CharacterReferenceUploadUrlRequest(BaseModel):
+    """Request model for a direct browser-to-S3 character reference upload."""
+    content_type: str = Field(..., description="MIME type of the image to upload (image/png, image/jpeg, image/webp)")
+
+    @field_validator('content_type')
+    @classmethod
+    def validate_content_type(cls, v):
+        v = v.lower()
+        if v not in ('image/png', 'image/jpeg', 'image/jpg', 'image/webp'):
+            raise ValueError("content_type must be image/png, image/jpeg or image/webp")
+        return v
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "content_type": "image/png"
+            }
+        }
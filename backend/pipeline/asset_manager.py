@@ -19,6 +19,20 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Connection pool limits for the shared download session
+HTTP_POOL_LIMIT = 100
+HTTP_POOL_LIMIT_PER_HOST = 20
+HTTP_KEEPALIVE_TIMEOUT = 30
+HTTP_DNS_CACHE_TTL = 300
+
+# Name of the composed video under a job's final/ directory; persistence
+# uploads it unchanged, so it is also the canonical cloud object name
+FINAL_VIDEO_NAME = "video.mp4"
+
+# Download chunk size; each aiofiles write is a thread-pool hop, so chunks
+# are large enough to keep that overhead small while bounding memory
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 
 class AssetManager:
     """
@@ -37,6 +51,38 @@ class AssetManager:
         >>> await am.cleanup()
     """
 
+    # One pooled session shared by every job, so repeated downloads from
+    # the same host reuse keep-alive connections instead of a new TCP+TLS
+    # handshake per file. Sessions are bound to an event loop, so it's
+    # recreated if the loop changes; callers that run a short-lived loop
+    # (the worker's per-job asyncio.run()) must await close_http_session()
+    # before it ends.
+    _http_session: Optional[aiohttp.ClientSession] = None
+    _http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def _get_http_session(cls) -> aiohttp.ClientSession:
+        """Return the shared download session, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        session = cls._http_session
+        if session is None or session.closed or cls._http_session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_POOL_LIMIT,
+                limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=HTTP_DNS_CACHE_TTL
+            )
+            session = cls._http_session = aiohttp.ClientSession(connector=connector)
+            cls._http_session_loop = loop
+        return session
+
+    @classmethod
+    async def close_http_session(cls) -> None:
+        """Close the shared download session (called on application shutdown)."""
+        session, cls._http_session, cls._http_session_loop = cls._http_session, None, None
+        if session is not None and not session.closed:
+            await session.close()
+
     def __init__(self, job_id: str, base_path: str = "/tmp/video_jobs"):
         """
         Initialize asset manager for a specific job.
@@ -127,14 +173,14 @@ class AssetManager:
         file_path = target_dir / filename
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=timeout) as response:
-                    response.raise_for_status()
+            session = self._get_http_session()
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                response.raise_for_status()
 
-                    # Download file in chunks to handle large files
-                    async with aiofiles.open(file_path, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(8192):
-                            await f.write(chunk)
+                # Stream to disk in chunks so large files are never held in memory
+                async with aiofiles.open(file_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        await f.write(chunk)
 
             logger.info(f"Downloaded {filename} to {file_path}")
             return str(file_path)
@@ -142,14 +188,12 @@ class AssetManager:
         except aiohttp.ClientError as e:
             logger.error(f"Failed to download {url}: {e}")
             # Clean up partial download
-            if file_path.exists():
-                file_path.unlink()
+            file_path.unlink(missing_ok=True)
             raise
         except asyncio.TimeoutError as e:
             logger.error(f"Download timeout for {url}")
             # Clean up partial download
-            if file_path.exists():
-                file_path.unlink()
+            file_path.unlink(missing_ok=True)
             raise
 
     async def download_with_retry(
@@ -32,7 +32,7 @@ from moviepy import (
     concatenate_videoclips,
     vfx
 )
-from pipeline.asset_manager import AssetManager
+from pipeline.asset_manager import FINAL_VIDEO_NAME, AssetManager
 
 logger = structlog.get_logger(__name__)
 
@@ -248,13 +248,12 @@ class VideoComposer:
 
         # Determine output path
         if output_path is None:
-            timestamp = int(time.time())
-            filename = f"final_video_{timestamp}.mp4"
-
             if self.asset_manager:
-                output_path = str(self.asset_manager.final_dir / filename)
+                # Fixed name: final/ is per job, and backups look it up directly
+                output_path = str(self.asset_manager.final_dir / FINAL_VIDEO_NAME)
             else:
-                output_path = f"/tmp/{filename}"
+                timestamp = int(time.time())
+                output_path = f"/tmp/final_video_{timestamp}.mp4"
 
         # Export video
         self.logger.info(
@@ -53,12 +53,22 @@ from services.s3_storage import (
     validate_s3_key,
     S3StorageService,
 )
+from mv_schemas import CharacterReferenceUploadUrlRequest
 from pynamodb.exceptions import DoesNotExist, PutError
 
 logger = structlog.get_logger()
 
 router = APIRouter(prefix="/api/mv", tags=["Music Video"])
 
+# Character reference uploads: size limit and content type -> file extension
+CHARACTER_REFERENCE_MAX_SIZE = 10 * 1024 * 1024  # 10MB
+CHARACTER_REFERENCE_EXTENSIONS = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/jpg": "jpg",
+    "image/webp": "webp",
+}
+
 
 @router.get(
     "/get_config_flavors",
@@ -1297,7 +1307,7 @@ async def upload_character_reference(
             )
         
         # Validate file size (10MB max)
-        MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+        MAX_FILE_SIZE = CHARACTER_REFERENCE_MAX_SIZE
         file_content = await file.read()
         if len(file_content) > MAX_FILE_SIZE:
             raise HTTPException(
@@ -1423,6 +1433,117 @@ async def upload_character_reference(
         )
 
 
+@router.post(
+    "/character_reference_upload_url",
+    status_code=200,
+    responses={
+        200: {"description": "Presigned POST created"},
+        400: {"description": "Invalid request"},
+        501: {"description": "Storage backend does not support direct uploads"},
+        503: {"description": "Cloud storage not configured"},
+        500: {"description": "Internal server error"}
+    },
+    summary="Create Direct Character Reference Upload",
+    description="""
+Create a presigned S3 POST so the client can upload a character reference
+image straight to S3, without sending the bytes through the API server.
+
+The client POSTs a multipart form to `upload_url` containing every entry in
+`fields` followed by the file as `file`. The object lands at
+`character_references/{image_id}.{ext}`, the same location used by
+`/upload_character_reference`, so `image_id` can be used as
+`characterReferenceImageId` once the upload succeeds.
+
+Only available with `STORAGE_BACKEND=s3`; other backends return 501 and
+should use `/upload_character_reference`.
+
+**Constraints enforced by S3:**
+- Content-Type must match the requested `content_type`
+- Maximum size: 10MB
+
+**Example Request:**
+```json
+{
+    "content_type": "image/png"
+}
+```
+"""
+)
+async def create_character_reference_upload_url(request: CharacterReferenceUploadUrlRequest):
+    """
+    Create a presigned POST for a direct browser-to-S3 character reference upload.
+
+    Args:
+        request: Requested upload content type
+
+    Returns:
+        JSON with image_id, s3_key, upload_url, fields and expires_in
+    """
+    if settings.STORAGE_BACKEND.lower() != "s3":
+        raise HTTPException(
+            status_code=501,
+            detail={
+                "error": "NotImplemented",
+                "message": f"Direct uploads are not supported by the {settings.STORAGE_BACKEND} storage backend",
+                "details": "Use /upload_character_reference instead"
+            }
+        )
+
+    if not settings.STORAGE_BUCKET:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "ConfigurationError",
+                "message": "Cloud storage is not configured",
+                "details": "Use /upload_character_reference instead"
+            }
+        )
+
+    try:
+        image_id = str(uuid.uuid4())
+        ext = CHARACTER_REFERENCE_EXTENSIONS[request.content_type]
+        s3_key = f"character_references/{image_id}.{ext}"
+
+        post = get_s3_storage_service().generate_presigned_post(
+            s3_key,
+            content_type=request.content_type,
+            max_size=CHARACTER_REFERENCE_MAX_SIZE
+        )
+
+        logger.info(
+            "character_reference_upload_url_created",
+            image_id=image_id,
+            s3_key=s3_key,
+            content_type=request.content_type
+        )
+
+        return JSONResponse(
+            content={
+                "image_id": image_id,
+                "s3_key": s3_key,
+                "upload_url": post["url"],
+                "fields": post["fields"],
+                "expires_in": settings.PRESIGNED_URL_EXPIRY
+            },
+            status_code=200
+        )
+
+    except Exception as e:
+        logger.error(
+            "character_reference_upload_url_error",
+            error=str(e),
+            exc_info=True
+        )
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "InternalError",
+                "message": "Failed to create character reference upload URL",
+                "details": str(e)
+            }
+        )
+
+
 @router.get(
     "/get_character_reference/{image_id}",
     responses={
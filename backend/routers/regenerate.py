@@ -123,7 +123,7 @@ async def regenerate_scene(
             "scene_id": request.scene_id,
             "new_prompt": request.new_prompt,
             "preserve_duration": request.preserve_duration,
-            "cloud_urls": job.cloud_urls
+            "cloud_urls": await AssetPersistenceService().presign_job_assets(job.cloud_urls)
         }
         
         # Queue the regeneration job
@@ -178,7 +178,7 @@ async def regenerate_voiceover(
             "parent_job_id": job_id,
             "voice_id": request.voice_id,
             "scenes": request.scenes,
-            "cloud_urls": job.cloud_urls
+            "cloud_urls": await AssetPersistenceService().presign_job_assets(job.cloud_urls)
         }
         
         regen_job_id = f"{job_id}_regen_voice"
@@ -235,7 +235,7 @@ async def recompose_video(
             "timing_adjustments": request.timing_adjustments,
             "add_logo": request.add_logo,
             "logo_position": request.logo_position,
-            "cloud_urls": job.cloud_urls
+            "cloud_urls": await AssetPersistenceService().presign_job_assets(job.cloud_urls)
         }
         
         regen_job_id = f"{job_id}_recompose"
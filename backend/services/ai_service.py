@@ -84,12 +84,12 @@ class AIService:
             Dict containing structured script with scenes, voiceovers, etc.
         """
         model = self.registry.get_model(ModelTask.SCRIPT_GENERATION, model_name)
+        log = logger.bind(model=model.model_id, task="script")
 
-        logger.info(
+        log.info(
             "generating_script",
             product=product_name,
             style=style,
-            model=model.model_id,
             has_image=product_image_path is not None
         )
 
@@ -119,11 +119,11 @@ class AIService:
             # Parse and structure the output
             script = self._parse_script_output(output, product_name, cta_text)
 
-            logger.info("script_generated", scenes=len(script.get("scenes", [])))
+            log.info("script_generated", scenes=len(script.get("scenes", [])))
             return script
 
         except Exception as e:
-            logger.error("script_generation_failed", error=str(e), model=model.model_id)
+            log.error("script_generation_failed", error=str(e))
             raise
 
     async def generate_voiceover(
@@ -146,12 +146,12 @@ class AIService:
             Path to generated audio file
         """
         model = self.registry.get_model(ModelTask.VOICEOVER, model_name)
+        log = logger.bind(model=model.model_id, task="voiceover")
 
-        logger.info(
+        log.info(
             "generating_voiceover",
             text_length=len(text),
-            voice_style=voice_style,
-            model=model.model_id
+            voice_style=voice_style
         )
 
         # Prepare input based on model
@@ -180,11 +180,11 @@ class AIService:
 
             audio_path = await self.client.download_output(output, output_path)
 
-            logger.info("voiceover_generated", path=audio_path)
+            log.info("voiceover_generated", path=audio_path)
             return audio_path
 
         except Exception as e:
-            logger.error("voiceover_generation_failed", error=str(e), model=model.model_id)
+            log.error("voiceover_generation_failed", error=str(e))
             raise
 
     async def generate_video_scene(
@@ -209,12 +209,12 @@ class AIService:
             Path to generated video file
         """
         model = self.registry.get_model(ModelTask.VIDEO_SCENE, model_name)
+        log = logger.bind(model=model.model_id, task="video_scene")
 
-        logger.info(
+        log.info(
             "generating_video_scene",
             prompt=prompt[:50],
-            duration=duration,
-            model=model.model_id
+            duration=duration
         )
 
         # Prepare input
@@ -243,11 +243,11 @@ class AIService:
             video_path = f"/tmp/scene_{hash(prompt)}.mp4"
             video_file = await self.client.download_output(output, video_path)
 
-            logger.info("video_scene_generated", path=video_file)
+            log.info("video_scene_generated", path=video_file)
             return video_file
 
         except Exception as e:
-            logger.error("video_scene_generation_failed", error=str(e), model=model.model_id)
+            log.error("video_scene_generation_failed", error=str(e))
             raise
 
     async def generate_cta_image(
@@ -268,12 +268,9 @@ class AIService:
             Path to generated image file
         """
         model = self.registry.get_model(ModelTask.CTA_IMAGE, model_name)
+        log = logger.bind(model=model.model_id, task="cta_image")
 
-        logger.info(
-            "generating_cta_image",
-            prompt=prompt[:50],
-            model=model.model_id
-        )
+        log.info("generating_cta_image", prompt=prompt[:50])
 
         # Prepare input
         input_params = {
@@ -297,11 +294,11 @@ class AIService:
             image_path = f"/tmp/cta_{hash(prompt)}.png"
             image_file = await self.client.download_output(output[0], image_path)
 
-            logger.info("cta_image_generated", path=image_file)
+            log.info("cta_image_generated", path=image_file)
             return image_file
 
         except Exception as e:
-            logger.error("cta_image_generation_failed", error=str(e), model=model.model_id)
+            log.error("cta_image_generation_failed", error=str(e))
             raise
 
     def _build_script_prompt(self, product_name: str, style: str, cta_text: str) -> str:
@@ -439,11 +436,11 @@ Return as JSON:
             Generated text response
         """
         model = self.registry.get_model(ModelTask.SCRIPT_GENERATION, model_name)
+        log = logger.bind(model=model.model_id, task="text")
 
-        logger.info(
+        log.info(
             "generating_text",
             prompt_length=len(prompt),
-            model=model.model_id,
             max_tokens=max_tokens
         )
 
@@ -470,7 +467,7 @@ Return as JSON:
                 return str(output)
 
         except Exception as e:
-            logger.error("text_generation_failed", error=str(e), model=model.model_id)
+            log.error("text_generation_failed", error=str(e))
             raise
 
     async def analyze_image_with_text(
@@ -493,12 +490,12 @@ Return as JSON:
             Generated analysis text
         """
         model = self.registry.get_model(ModelTask.SCRIPT_GENERATION, model_name)
+        log = logger.bind(model=model.model_id, task="image_analysis")
 
-        logger.info(
+        log.info(
             "analyzing_image",
             image_path=image_path,
-            prompt_length=len(prompt),
-            model=model.model_id
+            prompt_length=len(prompt)
         )
 
         # Read and encode image
@@ -530,5 +527,5 @@ Return as JSON:
                 return str(output)
 
         except Exception as e:
-            logger.error("image_analysis_failed", error=str(e), model=model.model_id)
+            log.error("image_analysis_failed", error=str(e))
             raise
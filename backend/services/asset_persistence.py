@@ -12,17 +12,138 @@ Supports hybrid versioning with backup of replaced assets.
 """
 
 import os
+import hashlib
 import logging
-import json
+import shutil
+import warnings
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Dict, Iterable, List, Optional
 import asyncio
+import aiofiles
+import orjson
 
-from .storage_backend import StorageBackend, get_storage_backend
+from .storage_backend import MULTIPART_CHUNKSIZE, StorageBackend, get_storage_backend
 from config import settings
+from pipeline.asset_manager import FINAL_VIDEO_NAME
 
 logger = logging.getLogger(__name__)
 
+# Cloud subdirectories under videos/{job_id}/ that hold job assets
+JOB_ASSET_SUBDIRS = (
+    "final",
+    "intermediate/scenes",
+    "intermediate/audio",
+    "intermediate/uploads",
+    "intermediate/character_reference",
+)
+
+# Local job workspace directories persisted by persist_job_assets:
+# (result key, local directory name, cloud subpath under videos/{job_id}/)
+JOB_WORKSPACE_DIRS = (
+    ("final_video", "final", "final"),
+    ("scenes", "scenes", "intermediate/scenes"),
+    ("audio", "audio", "intermediate/audio"),
+    ("uploads", "uploads", "intermediate/uploads"),
+    ("character_references", "character_reference", "intermediate/character_reference"),
+)
+
+# Keys of a persist_job_assets() result that hold cloud paths
+JOB_ASSET_PATH_KEYS = frozenset(
+    [result_key for result_key, _, _ in JOB_WORKSPACE_DIRS] + ["metadata", "script"]
+)
+
+# Sidecar in the job directory recording files already persisted, so a
+# retried persist_job_assets only uploads what changed
+UPLOAD_MANIFEST_NAME = ".upload_manifest.json"
+
+# Files queued ahead of the upload workers in _upload_directory
+UPLOAD_QUEUE_SIZE = 64
+
+# Extensions tried for character reference images, in priority order
+CHARACTER_IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+
+
+def _fast_clone(src: Path, dst: Path) -> None:
+    """
+    Copy src to dst as cheaply as the filesystem allows.
+    
+    Tries a hardlink first (O(1) on the same filesystem), then an in-kernel
+    copy_file_range (reflink on XFS/Btrfs), and finally shutil.copy2.
+    Blocking; run via asyncio.to_thread from async code.
+    """
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        shutil.copystat(src, dst)
+        return
+    except (AttributeError, OSError):
+        # copy_file_range is Linux-only and not supported by every filesystem
+        pass
+    
+    shutil.copy2(src, dst)
+
+
+def _index_character_images(source_dir: Path) -> Dict[str, Path]:
+    """
+    Map image_id -> path for character images in source_dir with one scandir.
+    
+    When an image exists with several extensions, the one listed first in
+    CHARACTER_IMAGE_EXTENSIONS wins.
+    """
+    found: Dict[str, Path] = {}
+    try:
+        with os.scandir(source_dir) as entries:
+            for entry in entries:
+                image_id, ext = os.path.splitext(entry.name)
+                if ext not in CHARACTER_IMAGE_EXTENSIONS or not entry.is_file():
+                    continue
+                current = found.get(image_id)
+                if current is None or (
+                    CHARACTER_IMAGE_EXTENSIONS.index(ext)
+                    < CHARACTER_IMAGE_EXTENSIONS.index(current.suffix)
+                ):
+                    found[image_id] = Path(entry.path)
+    except FileNotFoundError:
+        pass
+    return found
+
+
+def _file_etag(path: str, etag: str) -> str:
+    """
+    Compute the S3-style ETag of a local file in the same form as etag.
+    
+    Single-part ETags are the MD5 of the content; multipart ETags
+    ("<md5-of-part-md5s>-<parts>") are computed with MULTIPART_CHUNKSIZE
+    parts, the part size both S3 put_file() and put_large_file() upload
+    with. Reads in chunks, so call from a worker thread.
+    """
+    multipart = "-" in etag
+    whole = hashlib.md5()
+    parts = []
+    with open(path, "rb") as f:
+        while chunk := f.read(MULTIPART_CHUNKSIZE):
+            if multipart:
+                parts.append(hashlib.md5(chunk).digest())
+            else:
+                whole.update(chunk)
+    if not multipart:
+        return whole.hexdigest()
+    return f"{hashlib.md5(b''.join(parts)).hexdigest()}-{len(parts)}"
+
 
 class AssetPersistenceService:
     """
@@ -33,9 +154,10 @@ class AssetPersistenceService:
     
     Example:
         >>> service = AssetPersistenceService()
-        >>> urls = await service.persist_job_assets("job-123", "/tmp/video_jobs/job-123")
-        >>> print(urls["final_video"])
-        'https://storage.googleapis.com/bucket/videos/job-123/final.mp4'
+        >>> paths = await service.persist_job_assets("job-123", "/tmp/video_jobs/job-123")
+        >>> print(paths["final_video"])
+        'videos/job-123/final/video.mp4'
+        >>> url = await service.presign(paths["final_video"])
     """
     
     def __init__(self, storage_backend: Optional[StorageBackend] = None):
@@ -46,6 +168,8 @@ class AssetPersistenceService:
             storage_backend: Optional custom storage backend. If None, uses factory.
         """
         self.storage = storage_backend or get_storage_backend()
+        # Caps in-flight transfers so large jobs don't exhaust sockets/memory
+        self._transfer_sem = asyncio.Semaphore(settings.S3_MAX_CONCURRENCY)
         logger.info("AssetPersistenceService initialized")
     
     async def persist_job_assets(
@@ -63,30 +187,39 @@ class AssetPersistenceService:
         - Script and metadata JSONs
         - Product images
         
+        No URLs are generated here; presigned URLs expire and most callers
+        only need one or two of them. Use presign()/presign_many() on the
+        returned cloud paths at the point of use.
+        
         Args:
             job_id: Unique job identifier
             local_base_path: Base path to job directory (e.g., "/tmp/video_jobs/job-123")
             
         Returns:
-            Dict with cloud URLs for all assets:
+            Dict with cloud paths for all assets:
             {
-                "final_video": "https://...",
-                "scenes": ["https://...", ...],
-                "audio": ["https://...", ...],
-                "metadata": "https://...",
-                "script": "https://...",
-                "uploads": ["https://...", ...]
+                "final_video": "videos/job-123/final/video.mp4",
+                "scenes": ["videos/job-123/intermediate/scenes/...", ...],
+                "audio": ["videos/job-123/intermediate/audio/...", ...],
+                "metadata": "videos/job-123/intermediate/metadata.json",
+                "script": "videos/job-123/intermediate/script.json",
+                "uploads": ["videos/job-123/intermediate/uploads/...", ...]
             }
             
         Example:
-            >>> urls = await service.persist_job_assets(
+            >>> paths = await service.persist_job_assets(
             ...     "job-123",
             ...     "/tmp/video_jobs/job-123"
             ... )
         """
         base_path = Path(local_base_path)
         
-        if not base_path.exists():
+        # One directory read tells us which workspace entries exist, instead
+        # of an exists() stat per expected directory/file
+        try:
+            with os.scandir(base_path) as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
             raise FileNotFoundError(f"Job directory not found: {local_base_path}")
         
         logger.info(f"Persisting assets for job {job_id} from {local_base_path}")
@@ -101,68 +234,53 @@ class AssetPersistenceService:
             "character_references": []
         }
         
+        # Files committed by a previous, partially failed run are skipped
+        manifest_path = base_path / UPLOAD_MANIFEST_NAME
+        manifest = await self._load_manifest(manifest_path)
+        # Decided once, before uploads start adding entries: only a resumed
+        # run has anything to compare ETags against
+        resuming = bool(manifest)
+        
+        # Collect every upload, then run them as a single wave so the
+        # slowest subdirectory (not the sum of all of them) sets wall-clock time
+        uploads = []
+        for result_key, local_name, cloud_subpath in JOB_WORKSPACE_DIRS:
+            if local_name in present:
+                uploads.append((
+                    result_key,
+                    self._upload_directory(
+                        job_id,
+                        base_path / local_name,
+                        cloud_subpath,
+                        single_file=(result_key == "final_video"),
+                        sign_lazy=True,
+                        manifest=manifest,
+                        resuming=resuming
+                    )
+                ))
+        
+        # Upload metadata and script if they exist
+        for result_key, filename in (("metadata", "metadata.json"), ("script", "script.json")):
+            if filename in present:
+                uploads.append((
+                    result_key,
+                    self._put_file(
+                        str(base_path / filename),
+                        f"videos/{job_id}/intermediate/{filename}",
+                        manifest=manifest,
+                        resuming=resuming
+                    )
+                ))
+        
         try:
-            # Upload final video
-            final_dir = base_path / "final"
-            if final_dir.exists():
-                result["final_video"] = await self._upload_directory(
-                    job_id,
-                    final_dir,
-                    "final",
-                    single_file=True
-                )
-            
-            # Upload scenes
-            scenes_dir = base_path / "scenes"
-            if scenes_dir.exists():
-                result["scenes"] = await self._upload_directory(
-                    job_id,
-                    scenes_dir,
-                    "intermediate/scenes"
-                )
-            
-            # Upload audio
-            audio_dir = base_path / "audio"
-            if audio_dir.exists():
-                result["audio"] = await self._upload_directory(
-                    job_id,
-                    audio_dir,
-                    "intermediate/audio"
-                )
-            
-            # Upload product images
-            uploads_dir = base_path / "uploads"
-            if uploads_dir.exists():
-                result["uploads"] = await self._upload_directory(
-                    job_id,
-                    uploads_dir,
-                    "intermediate/uploads"
-                )
-            
-            # Upload character reference images
-            character_ref_dir = base_path / "character_reference"
-            if character_ref_dir.exists():
-                result["character_references"] = await self._upload_directory(
-                    job_id,
-                    character_ref_dir,
-                    "intermediate/character_reference"
-                )
-            
-            # Upload metadata if exists
-            metadata_file = base_path / "metadata.json"
-            if metadata_file.exists():
-                result["metadata"] = await self.storage.upload_file(
-                    str(metadata_file),
-                    f"videos/{job_id}/intermediate/metadata.json"
-                )
-            
-            # Upload script if exists
-            script_file = base_path / "script.json"
-            if script_file.exists():
-                result["script"] = await self.storage.upload_file(
-                    str(script_file),
-                    f"videos/{job_id}/intermediate/script.json"
-                )
+            results = await asyncio.gather(
+                *(coro for _, coro in uploads),
+                return_exceptions=True
+            )
+            for (result_key, _), value in zip(uploads, results):
+                if isinstance(value, BaseException):
+                    raise value
+                result[result_key] = value
             
             logger.info(f"Successfully persisted all assets for job {job_id}")
             return result
@@ -170,44 +288,145 @@ class AssetPersistenceService:
         except Exception as e:
             logger.error(f"Failed to persist assets for job {job_id}: {e}")
             raise
+        
+        finally:
+            await self._save_manifest(manifest_path, manifest)
+    
+    async def _load_manifest(self, manifest_path: Path) -> Dict[str, List[int]]:
+        """Read the upload manifest (cloud path -> [size, mtime_ns]), or {} if absent."""
+        try:
+            async with aiofiles.open(manifest_path, "rb") as f:
+                return orjson.loads(await f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return {}
+    
+    async def _save_manifest(self, manifest_path: Path, manifest: Dict[str, List[int]]) -> None:
+        """Write the upload manifest; failures only cost a re-upload on retry."""
+        try:
+            async with aiofiles.open(manifest_path, "wb") as f:
+                await f.write(orjson.dumps(manifest))
+        except OSError as e:
+            logger.warning(f"Could not write upload manifest {manifest_path}: {e}")
+    
+    async def _should_upload(self, local_path: str, cloud_path: str) -> bool:
+        """
+        Check whether a local file differs from the copy in cloud storage.
+        
+        Compares the object's ETag with one computed from the local file.
+        Backends that don't expose ETags always upload.
+        """
+        etag = await self.storage.get_etag(cloud_path)
+        if etag is None:
+            return True
+        local_etag = await asyncio.to_thread(_file_etag, local_path, etag)
+        return local_etag != etag
+    
+    async def _upload_if_changed(
+        self,
+        put: Any,
+        local_path: str,
+        cloud_path: str,
+        manifest: Optional[Dict[str, List[int]]],
+        resuming: bool = False
+    ) -> None:
+        """
+        Upload a file unless the manifest or the stored ETag shows it's already there.
+        
+        ETags are only checked when resuming (the manifest had entries when
+        the run started), so a first run doesn't pay a HEAD per file.
+        """
+        if manifest is None:
+            await put(local_path, cloud_path)
+            return
+        
+        stat = await asyncio.to_thread(os.stat, local_path)
+        stamp = [stat.st_size, stat.st_mtime_ns]
+        if manifest.get(cloud_path) == stamp:
+            logger.debug(f"Skipping {cloud_path} (in upload manifest)")
+            return
+        
+        if resuming and not await self._should_upload(local_path, cloud_path):
+            logger.debug(f"Skipping {cloud_path} (ETag matches)")
+        else:
+            await put(local_path, cloud_path)
+        manifest[cloud_path] = stamp
     
     async def _upload_directory(
         self,
         job_id: str,
         local_dir: Path,
         cloud_subpath: str,
-        single_file: bool = False
+        single_file: bool = False,
+        sign_lazy: bool = False,
+        manifest: Optional[Dict[str, List[int]]] = None,
+        resuming: bool = False
     ) -> any:
         """
         Upload all files from a directory to cloud storage.
         
+        Scanning and uploading overlap: a producer queues files as the
+        directory is read and S3_MAX_CONCURRENCY workers upload them. URLs
+        are built afterwards in a single batch, keeping per-file presigning
+        off the event loop.
+        
         Args:
             job_id: Job identifier
             local_dir: Local directory to upload
             cloud_subpath: Subpath in cloud (e.g., "intermediate/scenes")
             single_file: If True, return single URL instead of list
+            sign_lazy: If True, return cloud paths and skip URL generation
+                (useful for directories with many files)
+            manifest: Upload manifest; files it (or their ETag) shows as
+                already persisted are skipped and new uploads are recorded
+            resuming: Whether the manifest had entries before this run;
+                ETags are only compared when it did
             
         Returns:
             List of URLs or single URL if single_file=True
         """
-        urls = []
-        
-        # Get all files in directory (non-recursive)
-        files = [f for f in local_dir.iterdir() if f.is_file()]
+        # The final video is the largest artifact, so it goes up as a
+        # multipart upload with concurrent parts
+        put = self.storage.put_large_file if single_file else self.storage.put_file
+        workers = settings.S3_MAX_CONCURRENCY
+        queue: asyncio.Queue = asyncio.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+        cloud_paths: List[str] = []
+        
+        async def produce() -> None:
+            # Non-recursive scan; scandir's DirEntry caches the file type from
+            # readdir, avoiding a stat per entry. Uploads start as soon as the
+            # first file is queued instead of after the whole scan.
+            with os.scandir(local_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        cloud_path = f"videos/{job_id}/{cloud_subpath}/{entry.name}"
+                        cloud_paths.append(cloud_path)
+                        await queue.put((entry.path, cloud_path))
+            for _ in range(workers):
+                await queue.put(None)
+        
+        async def consume() -> None:
+            while (item := await queue.get()) is not None:
+                async with self._transfer_sem:
+                    await self._upload_if_changed(put, *item, manifest, resuming)
+        
+        tasks = [asyncio.ensure_future(produce())]
+        tasks.extend(asyncio.ensure_future(consume()) for _ in range(workers))
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
         
-        if not files:
+        if not cloud_paths:
             logger.warning(f"No files found in {local_dir}")
             return None if single_file else []
         
-        # Upload files in parallel for speed
-        upload_tasks = []
-        for file in files:
-            cloud_path = f"videos/{job_id}/{cloud_subpath}/{file.name}"
-            upload_tasks.append(
-                self.storage.upload_file(str(file), cloud_path)
-            )
-        
-        urls = await asyncio.gather(*upload_tasks)
+        if sign_lazy:
+            urls = cloud_paths
+        else:
+            urls = await self.storage.get_urls(cloud_paths)
         
         if single_file:
             # For final video, return just the first (only) URL
@@ -215,6 +434,132 @@ class AssetPersistenceService:
         
         return urls
     
+    async def _put_file(
+        self,
+        local_path: str,
+        cloud_path: str,
+        manifest: Optional[Dict[str, List[int]]] = None,
+        resuming: bool = False
+    ) -> str:
+        """Upload a single file and return its cloud path."""
+        await self._upload_if_changed(
+            self.storage.put_file, local_path, cloud_path, manifest, resuming
+        )
+        return cloud_path
+    
+    async def presign(self, cloud_path: str) -> str:
+        """
+        Get an access URL for a persisted asset.
+        
+        Args:
+            cloud_path: Cloud path as returned by persist_job_assets()
+            
+        Returns:
+            Presigned URL (S3) or public URL (Firebase)
+        """
+        urls = await self.storage.get_urls([cloud_path])
+        return urls[0]
+    
+    async def presign_many(self, cloud_paths: List[str]) -> List[str]:
+        """
+        Get access URLs for several persisted assets in one batch.
+        
+        Args:
+            cloud_paths: Cloud paths as returned by persist_job_assets()
+            
+        Returns:
+            URLs in the same order as cloud_paths
+        """
+        if not cloud_paths:
+            return []
+        return await self.storage.get_urls(cloud_paths)
+    
+    async def presign_job_assets(
+        self,
+        job_assets: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get access URLs for a stored persist_job_assets() result in one batch.
+        
+        Jobs persisted before cloud paths were stored (Job.cloud_urls) hold
+        presigned URLs; values that are already URLs are passed through.
+        
+        Args:
+            job_assets: Dict as returned by persist_job_assets(), or None
+            
+        Returns:
+            Same dict shape with every cloud path replaced by its URL
+        """
+        if not job_assets:
+            return job_assets
+        
+        def needs_url(value: Any) -> bool:
+            return isinstance(value, str) and not value.startswith(("http://", "https://"))
+        
+        paths = []
+        for key, value in job_assets.items():
+            if key in JOB_ASSET_PATH_KEYS:
+                values = value if isinstance(value, list) else [value]
+                paths.extend(v for v in values if needs_url(v))
+        urls = dict(zip(paths, await self.presign_many(paths)))
+        
+        result = dict(job_assets)
+        for key in JOB_ASSET_PATH_KEYS.intersection(result):
+            value = result[key]
+            if isinstance(value, list):
+                result[key] = [urls.get(v, v) for v in value]
+            else:
+                result[key] = urls.get(value, value)
+        return result
+    
+    async def _run_bounded(self, coros: Iterable[Awaitable[Any]]) -> List[Any]:
+        """
+        Run transfer coroutines with bounded concurrency.
+        
+        At most S3_MAX_CONCURRENCY coroutines run at once; a new one starts
+        as soon as any finishes, so a single slow transfer doesn't hold back
+        the rest of the batch. Results keep the input order.
+        
+        Args:
+            coros: Coroutines to run
+            
+        Returns:
+            Results in the same order as coros
+        """
+        async def run(index: int, coro: Awaitable[Any]):
+            async with self._transfer_sem:
+                return index, await coro
+        
+        tasks = [asyncio.ensure_future(run(i, c)) for i, c in enumerate(coros)]
+        results = [None] * len(tasks)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, value = await next_done
+                results[index] = value
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return results
+    
+    async def _list_prefixes_parallel(self, prefixes: List[str]) -> List[str]:
+        """
+        List several cloud prefixes concurrently and merge the results.
+        
+        Each prefix is listed independently so paginated LIST latency overlaps
+        instead of stacking. Duplicates are dropped, order is preserved.
+        
+        Args:
+            prefixes: Cloud path prefixes to list
+            
+        Returns:
+            Combined list of file paths
+        """
+        listings = await asyncio.gather(
+            *(self.storage.list_files(prefix) for prefix in prefixes)
+        )
+        return list(dict.fromkeys(f for listing in listings for f in listing))
+    
     async def download_job_assets(
         self,
         job_id: str,
@@ -239,8 +584,16 @@ class AssetPersistenceService:
         logger.info(f"Downloading assets for job {job_id} to {local_base_path}")
         
         try:
-            # List all files for this job
-            files = await self.storage.list_files(f"videos/{job_id}/")
+            # List each known asset subdirectory (plus top-level intermediate
+            # files like metadata.json) concurrently instead of walking the job
+            job_prefix = f"videos/{job_id}/"
+            prefixes = [f"{job_prefix}{subdir}/" for subdir in JOB_ASSET_SUBDIRS]
+            prefixes.append(f"{job_prefix}intermediate/")
+            files = await self._list_prefixes_parallel(prefixes)
+            
+            # Drop directory entries returned by the intermediate/ listing
+            subdir_paths = {f"{job_prefix}{subdir}" for subdir in JOB_ASSET_SUBDIRS}
+            files = [f for f in files if f.rstrip("/") not in subdir_paths]
             
             if not files:
                 raise FileNotFoundError(f"No assets found for job {job_id}")
@@ -261,11 +614,14 @@ class AssetPersistenceService:
                 local_path = base_path / rel_path
                 local_path.parent.mkdir(parents=True, exist_ok=True)
                 
-                download_tasks.append(
-                    self.storage.download_file(cloud_path, str(local_path))
-                )
+                # Final videos can be multi-GB; fetch them as ranged parts
+                if rel_path.startswith("final/"):
+                    download = self.storage.download_large_file
+                else:
+                    download = self.storage.download_file
+                download_tasks.append(download(cloud_path, str(local_path)))
             
-            await asyncio.gather(*download_tasks)
+            await self._run_bounded(download_tasks)
             
             logger.info(f"Successfully downloaded {len(files)} assets for job {job_id}")
             
@@ -332,8 +688,13 @@ class AssetPersistenceService:
         Returns:
             URL of backup, or None if no final video exists
         """
-        # Find the final video (could be video.mp4, final_video.mp4, etc.)
-        files = await self.storage.list_files(f"videos/{job_id}/final/")
+        # The composer writes the final video as FINAL_VIDEO_NAME, so a
+        # single HEAD usually finds it without listing the prefix
+        if await self.storage.exists(f"videos/{job_id}/final/{FINAL_VIDEO_NAME}"):
+            return await self.backup_asset(job_id, "final", FINAL_VIDEO_NAME)
+        
+        # Fall back to listing for older jobs (final_video.mp4, etc.)
+        files = await self._list_prefixes_parallel([f"videos/{job_id}/final/"])
         
         # Find the main video file (not a backup)
         video_file = None
@@ -361,25 +722,13 @@ class AssetPersistenceService:
         """
         metadata_path = f"videos/{job_id}/intermediate/metadata.json"
         
-        if not await self.storage.exists(metadata_path):
+        # Read straight into memory; no exists() probe or temp file needed
+        try:
+            raw = await self.storage.download_bytes(metadata_path)
+        except FileNotFoundError:
             return None
         
-        # Download to temp location
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False) as tmp:
-            tmp_path = tmp.name
-        
-        try:
-            await self.storage.download_file(metadata_path, tmp_path)
-            
-            with open(tmp_path, 'r') as f:
-                metadata = json.load(f)
-            
-            return metadata
-        finally:
-            # Clean up temp file
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        return orjson.loads(raw)
     
     async def update_metadata(
         self,
@@ -398,29 +747,18 @@ class AssetPersistenceService:
         Returns:
             Cloud URL of updated metadata
         """
-        import tempfile
+        body = orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
         
-        # If local path provided, save there
+        # If local path provided, save there too
         if local_path:
-            with open(local_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
-            upload_path = local_path
-        else:
-            # Otherwise use temp file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-                json.dump(metadata, tmp, indent=2)
-                upload_path = tmp.name
+            async with aiofiles.open(local_path, 'wb') as f:
+                await f.write(body)
         
-        try:
-            cloud_path = f"videos/{job_id}/intermediate/metadata.json"
-            url = await self.storage.upload_file(upload_path, cloud_path)
-            
-            logger.info(f"Updated metadata for job {job_id}")
-            return url
-        finally:
-            # Clean up temp file if we created one
-            if not local_path and os.path.exists(upload_path):
-                os.remove(upload_path)
+        cloud_path = f"videos/{job_id}/intermediate/metadata.json"
+        url = await self.storage.upload_bytes(body, cloud_path, content_type="application/json")
+        
+        logger.info(f"Updated metadata for job {job_id}")
+        return url
     
     async def cleanup_old_backups(self, job_id: str) -> None:
         """
@@ -436,8 +774,8 @@ class AssetPersistenceService:
         logger.info(f"Cleaning up old backups for job {job_id} (limit: {limit})")
         
         try:
-            # List all files for job
-            files = await self.storage.list_files(f"videos/{job_id}/")
+            # Backups only live under final/, so skip the rest of the job tree
+            files = await self._list_prefixes_parallel([f"videos/{job_id}/final/"])
             
             # Find backup files (contain _v2, _v3, etc. or _original)
             # Only delete if we have more than the limit
@@ -450,9 +788,8 @@ class AssetPersistenceService:
             if len(final_backups) > limit:
                 to_delete = final_backups[limit:]
                 
-                for file in to_delete:
-                    logger.info(f"Deleting old backup: {file}")
-                    await self.storage.delete_file(file)
+                logger.info(f"Deleting old backups: {to_delete}")
+                await self.storage.delete_files(to_delete)
                 
                 logger.info(f"Cleaned up {len(to_delete)} old backups")
         
@@ -467,7 +804,12 @@ class AssetPersistenceService:
         job_id: Optional[str] = None
     ) -> str:
         """
-        Persist a single character reference image to cloud storage.
+        DEPRECATED: Persist a single character reference image to cloud storage.
+        
+        Kept for internal/legacy callers that already hold the file locally.
+        New uploads should go straight from the client to S3 via
+        POST /api/mv/character_reference_upload_url, which keeps the image
+        bytes off the API server.
         
         Args:
             image_id: UUID of the image
@@ -485,6 +827,13 @@ class AssetPersistenceService:
             ...     job_id="job-456"
             ... )
         """
+        warnings.warn(
+            "persist_character_reference is deprecated. Upload directly to S3 "
+            "via /api/mv/character_reference_upload_url instead.",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        
         if not os.path.exists(local_image_path):
             raise FileNotFoundError(f"Image file not found: {local_image_path}")
         
@@ -515,7 +864,11 @@ class AssetPersistenceService:
         Copy character reference images into job directory and upload to cloud.
         
         This method copies images from the standalone character_reference directory
-        into a job-specific directory, then uploads them to cloud storage.
+        into a job-specific directory, then associates them with the job in cloud
+        storage. Images already persisted standalone (see
+        persist_character_reference) are copied server-side within the bucket;
+        the rest are uploaded from the local copy. Images are processed
+        concurrently.
         
         Args:
             job_id: Job identifier
@@ -533,8 +886,6 @@ class AssetPersistenceService:
             ...     "/tmp/video_jobs/job-456"
             ... )
         """
-        import shutil
-        
         base_path = Path(local_base_path)
         job_char_ref_dir = base_path / "character_reference"
         job_char_ref_dir.mkdir(parents=True, exist_ok=True)
@@ -542,51 +893,96 @@ class AssetPersistenceService:
         # Source directory where standalone character images are stored
         source_dir = Path(__file__).parent.parent / "mv" / "outputs" / "character_reference"
         
-        urls = []
-        
         logger.info(f"Associating {len(image_ids)} character images with job {job_id}")
         
-        for image_id in image_ids:
-            # Try to find the image with different extensions
-            image_found = False
-            for ext in [".png", ".jpg", ".jpeg", ".webp"]:
-                source_path = source_dir / f"{image_id}{ext}"
-                if source_path.exists():
-                    # Copy to job directory
-                    dest_path = job_char_ref_dir / f"{image_id}{ext}"
-                    shutil.copy2(source_path, dest_path)
-                    
-                    # Upload to cloud
-                    cloud_path = f"videos/{job_id}/intermediate/character_reference/{image_id}{ext}"
-                    url = await self.storage.upload_file(str(dest_path), cloud_path)
-                    urls.append(url)
-                    
-                    logger.info(f"Associated character reference {image_id} with job {job_id}")
-                    image_found = True
-                    break
+        # One directory scan instead of an exists() probe per extension per image
+        source_images = await asyncio.to_thread(_index_character_images, source_dir)
+        
+        async def associate_image(image_id: str) -> Optional[str]:
+            source_path = source_images.get(image_id)
+            if source_path is None:
+                # Uploaded straight to S3 by the client: nothing local to copy
+                return await self._associate_cloud_only_image(job_id, image_id)
+            
+            ext = source_path.suffix
+            
+            # Copy to job directory (hardlink/reflink when possible)
+            dest_path = job_char_ref_dir / f"{image_id}{ext}"
+            await asyncio.to_thread(_fast_clone, source_path, dest_path)
             
-            if not image_found:
-                logger.warning(f"Character reference image {image_id} not found in {source_dir}")
+            cloud_path = f"videos/{job_id}/intermediate/character_reference/{image_id}{ext}"
+            standalone_path = f"character_references/{image_id}{ext}"
+            if await self.storage.exists(standalone_path):
+                # Server-side copy, no bytes leave the bucket
+                await self.storage.copy_file(standalone_path, cloud_path)
+            else:
+                await self.storage.put_file(str(dest_path), cloud_path)
+            
+            logger.info(f"Associated character reference {image_id} with job {job_id}")
+            return cloud_path
+        
+        cloud_paths = await self._run_bounded(
+            associate_image(image_id) for image_id in image_ids
+        )
+        urls = await self.presign_many([p for p in cloud_paths if p])
         
         logger.info(f"Successfully associated {len(urls)} character images with job {job_id}")
         return urls
     
+    async def _first_existing(self, cloud_paths: List[str]) -> Optional[str]:
+        """
+        Return the first of cloud_paths that exists, checking all concurrently.
+        
+        Args:
+            cloud_paths: Candidate paths in priority order
+            
+        Returns:
+            First existing path, or None
+        """
+        found = await asyncio.gather(*(self.storage.exists(p) for p in cloud_paths))
+        return next((p for p, exists in zip(cloud_paths, found) if exists), None)
+    
+    async def _associate_cloud_only_image(self, job_id: str, image_id: str) -> Optional[str]:
+        """
+        Copy a standalone cloud character image into the job prefix server-side.
+        
+        Used for images that were uploaded directly to cloud storage and
+        have no local copy.
+        
+        Returns:
+            Job cloud path, or None if no standalone image exists
+        """
+        standalone_path = await self._first_existing(
+            [f"character_references/{image_id}{ext}" for ext in CHARACTER_IMAGE_EXTENSIONS]
+        )
+        if standalone_path is None:
+            logger.warning(f"Character reference image {image_id} not found locally or in cloud storage")
+            return None
+        
+        filename = standalone_path.rsplit("/", 1)[-1]
+        cloud_path = f"videos/{job_id}/intermediate/character_reference/{filename}"
+        await self.storage.copy_file(standalone_path, cloud_path)
+        
+        logger.info(f"Associated cloud-only character reference {image_id} with job {job_id}")
+        return cloud_path
+    
     async def get_character_reference_url(
         self,
         image_id: str,
         job_id: Optional[str] = None,
-        extension: str = "png"
+        extension: Optional[str] = None
     ) -> Optional[str]:
         """
         Generate presigned URL (S3) or public URL (Firebase) for character reference image.
         
-        Reuses storage backend's generate_presigned_url() for S3 
-        and _get_public_url() for Firebase.
+        Reuses storage backend's get_urls(), which presigns for S3 and
+        builds a public URL for Firebase.
         
         Args:
             image_id: UUID of the image
             job_id: Optional job ID if image is associated with a job
-            extension: Image file extension (png, jpg, webp)
+            extension: Image file extension (png, jpg, webp). If None, all
+                supported extensions are probed concurrently.
         
         Returns:
             Presigned/public URL or None if image doesn't exist
@@ -595,32 +991,22 @@ class AssetPersistenceService:
             >>> service = AssetPersistenceService()
             >>> url = await service.get_character_reference_url(
             ...     "abc-123",
-            ...     job_id="job-456",
-            ...     extension="png"
+            ...     job_id="job-456"
             ... )
         """
-        from services.storage_backend import S3StorageBackend, FirebaseStorageBackend
-        
         # Determine cloud path
         if job_id:
-            cloud_path = f"videos/{job_id}/intermediate/character_reference/{image_id}.{extension}"
+            prefix = f"videos/{job_id}/intermediate/character_reference/"
         else:
-            cloud_path = f"character_references/{image_id}.{extension}"
+            prefix = "character_references/"
         
-        # Check if exists
-        if not await self.storage.exists(cloud_path):
-            return None
+        if extension:
+            candidates = [f"{prefix}{image_id}.{extension}"]
+        else:
+            candidates = [f"{prefix}{image_id}{ext}" for ext in CHARACTER_IMAGE_EXTENSIONS]
         
-        # Generate URL based on backend type
-        if isinstance(self.storage, S3StorageBackend):
-            return self.storage.generate_presigned_url(
-                cloud_path, 
-                expiry=settings.PRESIGNED_URL_EXPIRY
-            )
-        elif isinstance(self.storage, FirebaseStorageBackend):
-            return self.storage._get_public_url(cloud_path)
+        cloud_path = await self._first_existing(candidates)
+        if cloud_path is None:
+            return None
         
-        return None
-
-
-
+        return await self.presign(cloud_path)
@@ -2,29 +2,228 @@
 Audio Download Service
 
 Downloads audio from YouTube URLs and converts to MP3 format.
-Uses yt-dlp for downloading and FFmpeg for audio extraction/conversion.
+Uses yt-dlp for downloading and FFmpeg for MP3 conversion. Downloads and
+encodes run in separate pools, so a new download doesn't wait for an earlier
+request's encode to finish and vice versa.
 """
 
 import asyncio
+import concurrent.futures
+import contextvars
+import json
+import logging
+import os
+import queue
+import re
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
 import structlog
 import shutil
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Literal, Tuple, Union
 import uuid
 from datetime import datetime
+from functools import lru_cache
 
+import aiofiles.os
 import yt_dlp
 
-# pydub is optional - only needed if FFmpeg is available for conversion
-try:
-    from pydub import AudioSegment
-    PYDUB_AVAILABLE = True
-except ImportError:
-    PYDUB_AVAILABLE = False
-    AudioSegment = None
-
 logger = structlog.get_logger()
 
+# 11-character YouTube video ID from watch, youtu.be, /shorts/ and /embed/ URLs
+YOUTUBE_VIDEO_ID_RE = re.compile(
+    r'(?:youtube(?:-nocookie)?\.com/(?:watch\?(?:[^#]*&)?v=|shorts/|embed/|live/)|youtu\.be/)'
+    r'([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])'
+)
+
+# get_audio_info results are cached per video for this long
+INFO_CACHE_TTL_SECONDS = 600
+INFO_CACHE_MAXSIZE = 2048
+
+# Full yt-dlp info dicts from get_audio_info, kept briefly so a download
+# that follows can skip extraction. These hold every format, so far fewer
+# are kept than AudioInfo entries.
+PREFETCHED_INFO_MAXSIZE = 32
+
+# Default number of yt-dlp calls (downloads or info lookups) run at once
+DEFAULT_MAX_CONCURRENT_DOWNLOADS = 4
+
+# DASH/HLS fragments fetched in parallel per download, and the Range
+# request size for single-file streams
+CONCURRENT_FRAGMENT_DOWNLOADS = 8
+HTTP_CHUNK_SIZE = 10 * 1024 * 1024
+
+# LAME VBR level used for the "vbr" encoding profile (V2, ~190 kbps average)
+MP3_VBR_QUALITY = "2"
+
+# Extra FFmpeg output args for speech-only audio: mono at 22.05 kHz
+SPEECH_FFMPEG_ARGS = ['-ac', '1', '-ar', '22050']
+
+# yt-dlp format for M4A output: YouTube usually offers an AAC-in-M4A
+# stream, which is kept as downloaded instead of being re-encoded
+M4A_FORMAT = 'bestaudio[ext=m4a]/bestaudio/best'
+
+# Preference order when several files for one download are on disk
+_AUDIO_EXT_RANK = {ext: rank for rank, ext in enumerate(('mp3', 'm4a', 'opus', 'webm', 'ogg', 'aac'))}
+
+# In-progress files (yt-dlp's and our encodes'), never a finished download
+_PARTIAL_SUFFIXES = ('.part', '.ytdl', '.tmp')
+
+# FFmpeg muxer per output format; encodes write to a .tmp name, so the
+# container can't be inferred from the extension
+_MUXERS = {'mp3': 'mp3', 'm4a': 'ipod'}
+
+# Per-download state read by the progress hook registered on pooled
+# YoutubeDL instances: (info dict to fill, on_metadata callback)
+_download_state: contextvars.ContextVar[
+    Optional[Tuple[Dict[str, Any], Optional[Callable[[Dict[str, Any]], None]]]]
+] = contextvars.ContextVar("audio_download_state", default=None)
+
+# Options used for metadata-only extraction
+INFO_YDL_OPTS: Dict[str, Any] = {
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': False,
+    'noplaylist': True,
+}
+
+# Options for listing playlist entries: 'in_playlist' returns ids/titles
+# from the playlist page without fetching each video
+PLAYLIST_YDL_OPTS: Dict[str, Any] = {
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': 'in_playlist',
+}
+
+
+@lru_cache(maxsize=8)
+def _detect_ffmpeg(ffmpeg_path: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Resolve FFmpeg once per process (and custom path).
+
+    ffmpeg_path may be the executable or the directory holding it; if it
+    doesn't exist, ffmpeg and ffprobe are looked up on PATH.
+
+    Returns:
+        (ffmpeg executable, location to pass to yt-dlp), or (None, None)
+        if FFmpeg isn't available
+    """
+    if ffmpeg_path:
+        custom = Path(ffmpeg_path)
+        if custom.exists():
+            return str(custom / "ffmpeg" if custom.is_dir() else custom), ffmpeg_path
+
+    ffmpeg_cmd, ffprobe_cmd = shutil.which("ffmpeg"), shutil.which("ffprobe")
+    if ffmpeg_cmd and ffprobe_cmd:
+        # yt-dlp takes the directory holding ffmpeg/ffprobe
+        return ffmpeg_cmd, str(Path(ffmpeg_cmd).parent)
+    return None, None
+
+
+@lru_cache(maxsize=8)
+def _detect_aac_encoder(ffmpeg_exe: str) -> str:
+    """
+    Pick the AAC encoder for ffmpeg_exe once per process.
+
+    libfdk_aac is faster and better than FFmpeg's native encoder at the
+    same bitrate, but only non-free builds include it.
+    """
+    try:
+        proc = subprocess.run(
+            [ffmpeg_exe, '-hide_banner', '-encoders'],
+            capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return 'aac'
+    return 'libfdk_aac' if 'libfdk_aac' in proc.stdout else 'aac'
+
+
+@lru_cache(maxsize=32)
+def _codec_args(
+    output_format: str,
+    encoding_profile: str,
+    quality: str,
+    speech_only: bool,
+    aac_encoder: str = 'aac'
+) -> Tuple[str, ...]:
+    """FFmpeg output codec args for an encode, built once per combination."""
+    if output_format == "m4a":
+        args = ('-c:a', aac_encoder, '-b:a', f"{quality}k")
+    elif encoding_profile == "vbr":
+        args = ('-c:a', 'libmp3lame', '-q:a', quality)
+    else:
+        args = ('-c:a', 'libmp3lame', '-b:a', f"{quality}k")
+    if speech_only:
+        args += tuple(SPEECH_FFMPEG_ARGS)
+    return args
+
+
+@dataclass(slots=True)
+class AudioDownloadMetadata:
+    """Source details for a downloaded audio file."""
+    uploader: Optional[str] = None
+    upload_date: Optional[str] = None
+    view_count: Optional[int] = None
+    thumbnail: Optional[str] = None
+    original_format: Optional[str] = None
+    converted_to_mp3: bool = False
+
+
+@dataclass(slots=True)
+class AudioDownloadResult:
+    """Result of AudioDownloader.download_audio()."""
+    audio_path: str
+    filename: str
+    format: str
+    title: str
+    duration: Optional[float]
+    file_size_bytes: int
+    metadata: AudioDownloadMetadata = field(default_factory=AudioDownloadMetadata)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form, as returned before results were dataclasses."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AudioDownloadResult":
+        """Rebuild a result from to_dict() output."""
+        return cls(**{**data, 'metadata': AudioDownloadMetadata(**data.get('metadata', {}))})
+
+
+@dataclass(frozen=True, slots=True)
+class AudioInfo:
+    """Video metadata returned by AudioDownloader.get_audio_info()."""
+    title: Optional[str] = None
+    duration: Optional[float] = None
+    uploader: Optional[str] = None
+    thumbnail: Optional[str] = None
+    view_count: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form, as returned before results were dataclasses."""
+        return asdict(self)
+
+
+def _video_id(url: str) -> Optional[str]:
+    """Return the YouTube video ID in url, or None for other URLs."""
+    match = YOUTUBE_VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def _canonicalize_url(url: str) -> str:
+    """
+    Normalize a YouTube video URL to https://www.youtube.com/watch?v=<id>.
+
+    Drops tracking and playback parameters (si, pp, t, list, ...) so the
+    same video always reaches yt-dlp and the caches as the same URL.
+    Non-YouTube URLs are returned unchanged.
+    """
+    video_id = _video_id(url)
+    return f"https://www.youtube.com/watch?v={video_id}" if video_id else url
+
 
 class AudioDownloadError(Exception):
     """Raised when audio download fails"""
@@ -37,7 +236,7 @@ class AudioDownloader:
 
     Features:
     - Downloads best quality audio from YouTube
-    - Converts to MP3 format
+    - Converts to MP3 format (when FFmpeg is available)
     - Extracts metadata (title, duration, etc.)
     - Handles errors gracefully
 
@@ -47,67 +246,134 @@ class AudioDownloader:
         ...     url="https://www.youtube.com/watch?v=...",
         ...     output_path="/tmp/audio"
         ... )
-        >>> print(result["audio_path"])
+        >>> print(result.audio_path)
     """
 
-    def __init__(self, ffmpeg_path: Optional[str] = None):
+    def __init__(
+        self,
+        ffmpeg_path: Optional[str] = None,
+        max_concurrent_downloads: int = DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+        max_concurrent_encodes: Optional[int] = None
+    ):
         """
         Initialize the audio downloader service.
         
         Args:
             ffmpeg_path: Optional path to ffmpeg executable. If not provided,
                         will check system PATH.
+            max_concurrent_downloads: Maximum yt-dlp calls running at once
+            max_concurrent_encodes: Maximum encodes running at once
+                (default: number of CPUs)
         """
         self.ffmpeg_path = ffmpeg_path
+        # Bind once; every event from this service carries the component
+        self.log = logger.bind(component="AudioDownloader")
+        # yt-dlp calls run on their own pool so they neither starve nor are
+        # starved by other asyncio.to_thread users, and are capped to avoid
+        # YouTube rate limits
+        self.max_concurrent_downloads = max_concurrent_downloads
+        self._download_sem = asyncio.Semaphore(max_concurrent_downloads)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrent_downloads,
+            thread_name_prefix="ytdlp"
+        )
+        # Encodes are FFmpeg child processes awaited on the event loop,
+        # capped separately from downloads and sized to the machine; a
+        # download slot is released as soon as its file is on disk
+        self.max_concurrent_encodes = max_concurrent_encodes or os.cpu_count() or 1
+        self._encode_sem = asyncio.Semaphore(self.max_concurrent_encodes)
+        # Idle YoutubeDL instances keyed by their options (minus outtmpl).
+        # Building one registers every extractor, and each keeps its own
+        # HTTP session, so reusing them also reuses keep-alive connections
+        # to YouTube. Each instance is only used by one thread at a time.
+        self._ydl_pool: Dict[str, "queue.SimpleQueue[yt_dlp.YoutubeDL]"] = {}
+        # get_audio_info cache: video ID -> (stored at, info), oldest first
+        self._info_cache: "OrderedDict[str, Tuple[float, AudioInfo]]" = OrderedDict()
+        # Lookups in progress, so concurrent requests for one video share it
+        self._info_inflight: Dict[str, asyncio.Task] = {}
+        # Raw info dicts from _extract_info: video ID -> (stored at, info).
+        # Written from worker threads, hence the lock.
+        self._prefetched_info: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._prefetched_lock = threading.Lock()
+        # Output directories already created by download_audio, mapped to
+        # their resolved path string for building output templates
+        self._known_dirs: Dict[str, str] = {}
         self._check_ffmpeg()
-        logger.info("AudioDownloader initialized", ffmpeg_available=self.ffmpeg_available)
+        self._base_ydl_opts = self._build_base_ydl_opts()
+        self.log.info("AudioDownloader initialized", ffmpeg_available=self.ffmpeg_available)
 
     def _check_ffmpeg(self) -> None:
         """
         Check if FFmpeg is available. If not, we'll download in original format.
         
-        Sets self.ffmpeg_available flag instead of raising error.
+        Sets self.ffmpeg_available flag instead of raising error, along with
+        self._ffmpeg_exe (used for encoding) and self._ffmpeg_location
+        (passed to yt-dlp). Detection is cached per process by
+        _detect_ffmpeg(), so creating more downloaders doesn't search PATH
+        again.
         """
-        self.ffmpeg_available = False
-        
-        # Check if custom path provided
-        if self.ffmpeg_path:
-            ffmpeg_exe = Path(self.ffmpeg_path)
-            if ffmpeg_exe.exists():
-                self.ffmpeg_available = True
-                logger.info("ffmpeg_found_at_custom_path", path=self.ffmpeg_path)
-                return
-
-        # Check system PATH
-        ffmpeg_cmd = shutil.which("ffmpeg")
-        ffprobe_cmd = shutil.which("ffprobe")
-        
-        if ffmpeg_cmd and ffprobe_cmd:
-            self.ffmpeg_available = True
-            logger.info("ffmpeg_found_in_path", ffmpeg=ffmpeg_cmd, ffprobe=ffprobe_cmd)
-        else:
-            logger.warning(
+        self._ffmpeg_exe, self._ffmpeg_location = _detect_ffmpeg(self.ffmpeg_path)
+        self.ffmpeg_available = self._ffmpeg_exe is not None
+        self._aac_encoder = _detect_aac_encoder(self._ffmpeg_exe) if self.ffmpeg_available else 'aac'
+
+        if not self.ffmpeg_available:
+            self.log.warning(
                 "ffmpeg_not_found",
                 message="FFmpeg not found. Will download audio in original format (m4a/opus). "
                         "To enable MP3 conversion, install FFmpeg."
             )
+        elif self._ffmpeg_location == self.ffmpeg_path:
+            self.log.info("ffmpeg_found_at_custom_path", path=self.ffmpeg_path)
+        else:
+            self.log.info("ffmpeg_found_in_path", ffmpeg=self._ffmpeg_exe)
+
+    def _build_base_ydl_opts(self) -> Dict[str, Any]:
+        """Build the yt-dlp options shared by every download."""
+        opts = {
+            'format': 'bestaudio/best',
+            'quiet': True,  # Suppress yt-dlp output
+            'no_warnings': True,
+            'extract_flat': False,
+            'noplaylist': True,  # Only download single video, not playlists
+            # Segmented streams are fetched several fragments at a time
+            'concurrent_fragment_downloads': CONCURRENT_FRAGMENT_DOWNLOADS,
+            'http_chunk_size': HTTP_CHUNK_SIZE,
+        }
+        # FFmpeg location is resolved once in _check_ffmpeg()
+        if self._ffmpeg_location:
+            opts['ffmpeg_location'] = self._ffmpeg_location
+        return opts
 
     async def download_audio(
         self,
         url: str,
         output_path: str,
-        audio_quality: str = "192"
-    ) -> Dict[str, Any]:
+        audio_quality: str = "192",
+        encoding_profile: Literal["cbr", "vbr"] = "cbr",
+        speech_only: bool = False,
+        output_format: Literal["mp3", "m4a"] = "mp3"
+    ) -> AudioDownloadResult:
         """
-        Download audio from YouTube URL and convert to MP3.
+        Download audio from YouTube URL and convert to MP3 (or M4A).
 
         Args:
             url: YouTube video URL
             output_path: Directory where MP3 file should be saved
-            audio_quality: Audio quality in kbps (default: "192")
+            audio_quality: Audio quality in kbps (default: "192"); used by
+                the "cbr" profile
+            encoding_profile: "cbr" encodes at audio_quality kbps; "vbr" uses
+                LAME VBR (MP3_VBR_QUALITY), which gives similar quality at a
+                lower average bitrate
+            speech_only: Downmix to mono at 22.05 kHz, which cuts encode
+                time and file size for voice content
+            output_format: "mp3", or "m4a" for AAC. For "m4a" an AAC source
+                stream is preferred and kept without re-encoding; other
+                sources are encoded to AAC at audio_quality kbps (with
+                libfdk_aac when FFmpeg has it) and encoding_profile is
+                ignored
 
         Returns:
-            Dictionary containing:
+            AudioDownloadResult (use to_dict() for a plain dict) with:
             - audio_path: Path to downloaded MP3 file
             - filename: Name of the MP3 file
             - title: Video title
@@ -124,269 +390,580 @@ class AudioDownloader:
             ...     output_path="/tmp/audio"
             ... )
         """
-        logger.info("audio_download_started", url=url[:100], output_path=output_path)
-
-        # Ensure output directory exists
-        output_dir = Path(output_path)
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate unique filename to avoid conflicts
+        if encoding_profile not in ("cbr", "vbr"):
+            raise ValueError(f"Unknown encoding_profile: {encoding_profile!r} (expected 'cbr' or 'vbr')")
+        if output_format not in ("mp3", "m4a"):
+            raise ValueError(f"Unknown output_format: {output_format!r} (expected 'mp3' or 'm4a')")
+
+        url = _canonicalize_url(url)
+        # Bind the URL once; every event for this download carries it
+        log = self.log.bind(url=url[:100])
+        log.info("audio_download_started", output_path=output_path)
+
+        # Ensure output directory exists (once per directory; callers reuse
+        # the same one, and yt-dlp recreates it if it's removed later)
+        output_dir = self._known_dirs.get(output_path)
+        if output_dir is None:
+            await aiofiles.os.makedirs(output_path, exist_ok=True)
+            output_dir = self._known_dirs[output_path] = str(Path(output_path).resolve())
+
+        # Downloads are cached on disk per video and encoding variant
+        vbr = encoding_profile == "vbr" and output_format == "mp3"
+        quality = MP3_VBR_QUALITY if vbr else audio_quality
+        video_id = _video_id(url)
+        cache_stem = None
+        if video_id:
+            variant = f"v{quality}" if vbr else quality
+            if output_format != "mp3":
+                variant += f"_{output_format}"
+            cache_stem = f"{video_id}_{variant}{'_speech' if speech_only else ''}"
+            cached = await asyncio.to_thread(self._load_cached_download, output_dir, cache_stem)
+            if cached:
+                log.info("audio_cache_hit", audio_path=cached.audio_path)
+                return cached
+
+        # Download under a unique name so concurrent requests can't clash;
+        # the file is renamed to its cache name afterwards
         audio_id = str(uuid.uuid4())
-        output_template = str(output_dir / f"{audio_id}.%(ext)s")
+        output_template = f"{output_dir}/{audio_id}.%(ext)s"
+
+        # Base options are built once in __init__; only the template varies
+        # per call. yt-dlp only downloads: encoding happens afterwards,
+        # outside the download slot.
+        ydl_opts = {**self._base_ydl_opts, 'outtmpl': output_template}
+        if output_format == "m4a":
+            ydl_opts['format'] = M4A_FORMAT
+
+        # Log metadata as soon as the download finishes. The callback hops
+        # back to the loop thread, so skip it unless debug logs are emitted.
+        on_metadata = None
+        if log.is_enabled_for(logging.DEBUG):
+            loop = asyncio.get_running_loop()
+
+            def on_metadata(meta: Dict[str, Any]) -> None:
+                loop.call_soon_threadsafe(
+                    lambda: log.debug(
+                        "audio_metadata_ready",
+                        title=meta.get('title'),
+                        duration=meta.get('duration')
+                    )
+                )
 
-        # Configure yt-dlp options
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'outtmpl': output_template,
-            'quiet': True,  # Suppress yt-dlp output
-            'no_warnings': True,
-            'extract_flat': False,
-            'noplaylist': True,  # Only download single video, not playlists
-        }
-        
-        # Add FFmpeg path if specified
-        if self.ffmpeg_path:
-            ydl_opts['ffmpeg_location'] = self.ffmpeg_path
-        elif self.ffmpeg_available:
-            # If FFmpeg is in PATH, yt-dlp will find it automatically
-            # But we can also explicitly set it if needed
-            ffmpeg_cmd = shutil.which("ffmpeg")
-            if ffmpeg_cmd:
-                # Extract directory from full path (remove ffmpeg.exe)
-                ffmpeg_dir = str(Path(ffmpeg_cmd).parent)
-                ydl_opts['ffmpeg_location'] = ffmpeg_dir
-        
-        # Always try to convert to MP3 if FFmpeg is available
-        # If not available, we'll try pydub conversion after download
-        if self.ffmpeg_available:
-            ydl_opts['postprocessors'] = [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': audio_quality,
-            }]
+        # If get_audio_info just looked this video up, download from that
+        # result instead of extracting it again
+        prefetched = self._take_prefetched_info(video_id) if video_id else None
 
         try:
-            # Run yt-dlp in thread pool to avoid blocking
-            result = await asyncio.to_thread(self._download_with_ytdlp, url, ydl_opts)
-
-            # Find the downloaded audio file (check MP3 first, then other formats)
-            # Priority: MP3 first (if yt-dlp converted it), then other formats
-            audio_extensions = ['mp3', 'm4a', 'opus', 'webm', 'ogg', 'aac']
-            audio_path = None
-            downloaded_format = None
-            
-            # Check for MP3 first (preferred)
-            mp3_files = list(output_dir.glob(f"{audio_id}.mp3"))
-            if mp3_files:
-                audio_path = mp3_files[0]
-                downloaded_format = 'mp3'
-                logger.info("mp3_file_found_after_download", audio_path=str(audio_path))
+            # Run yt-dlp on the dedicated pool to avoid blocking
+            result = await self._run_ytdlp(
+                self._download_with_ytdlp, url, ydl_opts, on_metadata, prefetched
+            )
+
+            # yt-dlp reports the downloaded path; only scan the directory if
+            # it didn't
+            filepath = result.get('filepath')
+            if filepath and await aiofiles.os.path.exists(filepath):
+                audio_path = Path(filepath)
             else:
-                # Check other formats
-                for ext in ['m4a', 'opus', 'webm', 'ogg', 'aac']:
-                    files = list(output_dir.glob(f"{audio_id}.{ext}"))
-                    if files:
-                        audio_path = files[0]
-                        downloaded_format = ext
-                        logger.info("audio_downloaded_in_format", format=ext, audio_path=str(audio_path))
-                        break
-            
-            if not audio_path:
-                raise AudioDownloadError(f"Audio file not found after download. Expected: {audio_id}.[mp3|m4a|opus|webm]")
-
-            # ALWAYS convert to MP3 if not already MP3 (and FFmpeg is available)
-            if downloaded_format != 'mp3':
-                original_format = downloaded_format
-                if self.ffmpeg_available and PYDUB_AVAILABLE:
-                    logger.info("converting_audio_to_mp3", format=original_format, audio_path=str(audio_path))
-                    audio_path = await self._convert_to_mp3(audio_path, audio_id, output_dir, audio_quality)
-                    if audio_path.suffix == '.mp3':
-                        downloaded_format = 'mp3'
-                        logger.info("successfully_converted_to_mp3", original_format=original_format)
-                    else:
-                        logger.error(
-                            "conversion_failed_keeping_original",
-                            format=original_format,
-                            message="MP3 conversion failed, keeping original format"
-                        )
-                        # Raise error if conversion failed - we want MP3!
-                        raise AudioDownloadError(
-                            f"Failed to convert audio to MP3. Downloaded format: {original_format}. "
-                            "Please ensure FFmpeg and pydub are properly installed."
+                found = await asyncio.to_thread(self._find_downloaded_file, output_dir, audio_id)
+                if not found:
+                    raise AudioDownloadError(f"Audio file not found after download. Expected: {audio_id}.[mp3|m4a|opus|webm]")
+                audio_path, result['file_size_bytes'] = found
+                result['download_filepath'] = str(audio_path)
+
+            original_format = audio_path.suffix.lstrip('.')
+            converted = False
+            if original_format != output_format:
+                if self.ffmpeg_available:
+                    audio_path = await self._convert_audio(
+                        audio_path,
+                        output_format,
+                        _codec_args(
+                            output_format, encoding_profile, quality, speech_only, self._aac_encoder
                         )
+                    )
+                    converted = True
                 else:
-                    # If FFmpeg/pydub not available, raise error - we require MP3
-                    raise AudioDownloadError(
-                        "FFmpeg or pydub not available. MP3 conversion is required. "
-                        "Please install FFmpeg to enable MP3 conversion."
+                    log.warning(
+                        "audio_kept_in_original_format",
+                        format=original_format,
+                        message=f"FFmpeg not available, skipping {output_format.upper()} conversion"
                     )
+            downloaded_format = output_format if converted else original_format
+            # Reused for the size check, the log event and the result
+            audio_path_str = str(audio_path)
 
-            file_size = audio_path.stat().st_size
+            # The hook reports the downloaded size; only a converted file
+            # needs a stat
+            file_size = result.get('file_size_bytes')
+            if not file_size or audio_path_str != result.get('download_filepath'):
+                file_size = (await aiofiles.os.stat(audio_path_str)).st_size
 
-            logger.info(
+            log.info(
                 "audio_download_completed",
-                url=url[:100],
-                audio_path=str(audio_path),
+                audio_path=audio_path_str,
                 file_size_bytes=file_size,
                 title=result.get('title', 'Unknown')
             )
 
-            return {
-                'audio_path': str(audio_path),
-                'filename': audio_path.name,
-                'format': downloaded_format or 'mp3',
-                'title': result.get('title', 'Unknown'),
-                'duration': result.get('duration'),
-                'file_size_bytes': file_size,
-                'metadata': {
-                    'uploader': result.get('uploader'),
-                    'upload_date': result.get('upload_date'),
-                    'view_count': result.get('view_count'),
-                    'thumbnail': result.get('thumbnail'),
-                    'original_format': downloaded_format,
-                    'converted_to_mp3': downloaded_format != 'mp3' and self.ffmpeg_available
-                }
-            }
+            response = AudioDownloadResult(
+                audio_path=audio_path_str,
+                filename=audio_path.name,
+                format=downloaded_format,
+                title=result.get('title', 'Unknown'),
+                duration=result.get('duration'),
+                file_size_bytes=file_size,
+                metadata=AudioDownloadMetadata(
+                    uploader=result.get('uploader'),
+                    upload_date=result.get('upload_date'),
+                    view_count=result.get('view_count'),
+                    thumbnail=result.get('thumbnail'),
+                    original_format=original_format,
+                    converted_to_mp3=converted and output_format == "mp3"
+                )
+            )
+
+            if cache_stem:
+                await asyncio.to_thread(
+                    self._store_cached_download, audio_path, output_dir, cache_stem, response
+                )
+            return response
 
         except Exception as e:
-            logger.error("audio_download_failed", url=url[:100], error=str(e), exc_info=True)
+            log.error("audio_download_failed", error=str(e), exc_info=True)
             raise AudioDownloadError(f"Failed to download audio: {str(e)}")
 
-    async def _convert_to_mp3(
+    async def _convert_audio(
         self,
         input_path: Path,
-        audio_id: str,
-        output_dir: Path,
-        quality: str
+        output_format: str,
+        codec_args: Tuple[str, ...]
     ) -> Path:
         """
-        Convert audio file to MP3 using pydub.
-        
+        Encode a downloaded file to output_format next to it and remove the original.
+
+        FFmpeg decodes and encodes in a single pass and streams to disk, so
+        no intermediate PCM is held in memory. The process is awaited
+        without a thread, bounded by the encode semaphore rather than a
+        download slot. Output goes to a .tmp sibling that is renamed into
+        place once complete, so a crash never leaves a truncated file
+        under the final name.
+
         Args:
-            input_path: Path to input audio file
-            audio_id: Audio ID for output filename
-            output_dir: Output directory
-            quality: Audio quality (bitrate)
-            
+            input_path: Downloaded audio file
+            output_format: Target extension ("mp3" or "m4a")
+            codec_args: FFmpeg output args from _codec_args()
+
         Returns:
-            Path to converted MP3 file (or original if conversion fails)
+            Path to the encoded file
+
+        Raises:
+            AudioDownloadError: If FFmpeg exits with an error
         """
-        if not PYDUB_AVAILABLE:
-            logger.warning("pydub_not_available", message="Cannot convert to MP3 - pydub not installed")
-            return input_path
-        
-        if not self.ffmpeg_available:
-            logger.warning("ffmpeg_not_available", message="Cannot convert to MP3 - FFmpeg not installed")
-            return input_path
-            
-        output_path = output_dir / f"{audio_id}.mp3"
-        
+        output_path = input_path.with_suffix(f'.{output_format}')
+        tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+        # -threads 0 lets FFmpeg size decoder (and multithreaded encoder)
+        # threads to the machine
+        argv = [
+            self._ffmpeg_exe, '-y', '-loglevel', 'error', '-i', str(input_path),
+            '-vn', '-threads', '0', *codec_args, '-f', _MUXERS[output_format], str(tmp_path)
+        ]
+        self.log.debug("audio_conversion_started", input_path=str(input_path))
+        async with self._encode_sem:
+            proc = await asyncio.create_subprocess_exec(
+                *argv, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                _, stderr = await proc.communicate()
+            except asyncio.CancelledError:
+                proc.kill()
+                await proc.wait()
+                await self._remove_quietly(tmp_path)
+                raise
+        if proc.returncode != 0 or not await aiofiles.os.path.getsize(tmp_path):
+            await self._remove_quietly(tmp_path)
+            message = stderr.decode(errors='replace').strip()[-500:] or "empty output"
+            raise AudioDownloadError(f"FFmpeg conversion failed: {message}")
+        await aiofiles.os.replace(tmp_path, output_path)
+        await aiofiles.os.remove(input_path)
+        return output_path
+
+    @staticmethod
+    async def _remove_quietly(path: Path) -> None:
+        """Delete path, ignoring a file that was never created."""
         try:
-            # Load audio file
-            logger.info("loading_audio_for_conversion", input_path=str(input_path))
-            audio = await asyncio.to_thread(AudioSegment.from_file, str(input_path))
-            
-            # Convert to MP3
-            bitrate = f"{quality}k"
-            logger.info("exporting_audio_to_mp3", output_path=str(output_path), bitrate=bitrate)
-            await asyncio.to_thread(audio.export, str(output_path), format="mp3", bitrate=bitrate)
-            
-            # Verify MP3 file was created
-            if output_path.exists() and output_path.stat().st_size > 0:
-                # Delete original file only if conversion succeeded
-                input_path.unlink()
-                logger.info(
-                    "audio_converted_to_mp3",
-                    input_format=input_path.suffix,
-                    output_path=str(output_path),
-                    file_size_bytes=output_path.stat().st_size
-                )
-                return output_path
-            else:
-                logger.error("mp3_file_not_created", output_path=str(output_path))
-                return input_path
-            
-        except Exception as e:
-            logger.error("audio_conversion_failed", error=str(e), exc_info=True)
-            # If conversion fails, return original file
-            return input_path
+            await aiofiles.os.remove(path)
+        except FileNotFoundError:
+            pass
 
-    def _download_with_ytdlp(self, url: str, ydl_opts: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _find_downloaded_file(output_dir: str, audio_id: str) -> Optional[Tuple[Path, int]]:
+        """
+        Locate {audio_id}.* in output_dir with a single directory scan.
+
+        If several formats are present the best one by _AUDIO_EXT_RANK is
+        picked (MP3 first).
+
+        Returns:
+            (path, size in bytes), or None if nothing was downloaded
+        """
+        prefix = f"{audio_id}."
+        best = None
+        best_rank = len(_AUDIO_EXT_RANK)
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(prefix) or name.endswith(_PARTIAL_SUFFIXES):
+                    continue
+                rank = _AUDIO_EXT_RANK.get(name[len(prefix):], len(_AUDIO_EXT_RANK))
+                if (best is None or rank < best_rank) and entry.is_file():
+                    best, best_rank = entry, rank
+                    if rank == 0:
+                        break
+        if best is None:
+            return None
+        # is_file() came from the directory listing; this is the only stat,
+        # and it saves download_audio from another one
+        return Path(best.path), best.stat().st_size
+
+    @staticmethod
+    def _load_cached_download(output_dir: str, cache_stem: str) -> Optional[AudioDownloadResult]:
+        """Return the stored download_audio() result for cache_stem if its audio file still exists."""
+        try:
+            with open(f"{output_dir}/{cache_stem}.json", "rb") as f:
+                cached = AudioDownloadResult.from_dict(json.load(f))
+        except (FileNotFoundError, ValueError, TypeError):
+            return None
+        if not os.path.exists(cached.audio_path):
+            return None
+        return cached
+
+    @staticmethod
+    def _store_cached_download(
+        audio_path: Path,
+        output_dir: str,
+        cache_stem: str,
+        response: AudioDownloadResult
+    ) -> None:
+        """
+        Rename a finished download to its cache name and write its metadata sidecar.
+
+        Updates response in place with the new path. Both the rename and the
+        sidecar write are atomic (os.replace), so readers never see partial
+        files. Failures only cost a cache miss later.
+        """
+        try:
+            output_dir = Path(output_dir)
+            cached_path = output_dir / f"{cache_stem}{audio_path.suffix}"
+            os.replace(audio_path, cached_path)
+            response.audio_path = str(cached_path)
+            response.filename = cached_path.name
+
+            sidecar = output_dir / f"{cache_stem}.json"
+            tmp_path = output_dir / f".{cache_stem}.{uuid.uuid4().hex}.json.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(response.to_dict(), f)
+            os.replace(tmp_path, sidecar)
+        except OSError as e:
+            logger.warning("audio_cache_store_failed", cache_stem=cache_stem, error=str(e))
+
+    async def download_many(
+        self,
+        urls: List[str],
+        output_path: str,
+        audio_quality: str = "192"
+    ) -> List[Union[AudioDownloadResult, AudioDownloadError]]:
+        """
+        Download audio for several URLs concurrently.
+
+        Workers pull URLs from a queue and call download_audio(). There are
+        enough workers to keep every download slot busy while earlier files
+        are still encoding; at most max_concurrent_downloads downloads run at
+        once, and pooled YoutubeDL instances are reused across the batch.
+
+        Args:
+            urls: YouTube video URLs
+            output_path: Directory where audio files should be saved
+            audio_quality: Audio quality in kbps (default: "192")
+
+        Returns:
+            One entry per URL, in order: the download_audio() result, or the
+            AudioDownloadError if that download failed
+
+        Example:
+            >>> results = await downloader.download_many(urls, "/tmp/audio")
+            >>> ok = [r for r in results if not isinstance(r, AudioDownloadError)]
+        """
+        results: List[Union[AudioDownloadResult, AudioDownloadError]] = [None] * len(urls)
+        pending: asyncio.Queue = asyncio.Queue()
+        for index, url in enumerate(urls):
+            pending.put_nowait((index, url))
+
+        async def worker() -> None:
+            while not pending.empty():
+                index, url = pending.get_nowait()
+                try:
+                    results[index] = await self.download_audio(url, output_path, audio_quality)
+                except AudioDownloadError as e:
+                    results[index] = e
+
+        workers = min(len(urls), self.max_concurrent_downloads + self.max_concurrent_encodes)
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return results
+
+    async def _run_ytdlp(self, func, *args) -> Any:
+        """
+        Run a blocking yt-dlp call on the dedicated executor, bounded by the semaphore.
+
+        Like asyncio.to_thread, the caller's context is copied into the worker.
+        """
+        async with self._download_sem:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, contextvars.copy_context().run, func, *args
+            )
+
+    def _acquire_ydl(self, ydl_opts: Dict[str, Any]) -> Tuple[str, yt_dlp.YoutubeDL]:
+        """
+        Take an idle YoutubeDL for these options from the pool, or build one.
+
+        The output template is per call, so it's left out of the pool key
+        and set on the instance before each download.
+
+        Returns:
+            (pool key, instance); hand both back with _release_ydl()
+        """
+        opts = {k: v for k, v in ydl_opts.items() if k != 'outtmpl'}
+        key = json.dumps(opts, sort_keys=True, default=str)
+        try:
+            ydl = self._ydl_pool[key].get_nowait()
+        except (KeyError, queue.Empty):
+            ydl = yt_dlp.YoutubeDL(opts)
+            ydl.add_progress_hook(self._progress_hook)
+        if 'outtmpl' in ydl_opts:
+            ydl.params['outtmpl']['default'] = ydl_opts['outtmpl']
+        return key, ydl
+
+    def _release_ydl(self, key: str, ydl: yt_dlp.YoutubeDL) -> None:
+        """Return a YoutubeDL instance to the pool for reuse."""
+        self._ydl_pool.setdefault(key, queue.SimpleQueue()).put(ydl)
+
+    def _progress_hook(self, d: Dict[str, Any]) -> None:
+        """
+        Collect metadata for the current download once it finishes.
+
+        Registered once per pooled YoutubeDL; the download it reports on is
+        identified by the _download_state context variable. The 'finished'
+        payload carries the full info_dict, so metadata is available before
+        any postprocessing runs.
+        """
+        if d['status'] != 'finished':
+            return
+        state = _download_state.get()
+        if state is None:
+            return
+        info, on_metadata = state
+        info.update(d.get('info_dict') or {})
+        info['filepath'] = info['download_filepath'] = d.get('filename')
+        info['file_size_bytes'] = d.get('total_bytes') or d.get('downloaded_bytes')
+        if on_metadata is not None:
+            on_metadata(info)
+
+    def _download_with_ytdlp(
+        self,
+        url: str,
+        ydl_opts: Dict[str, Any],
+        on_metadata: Optional[Callable[[Dict[str, Any]], None]] = None,
+        prefetched: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Download audio using yt-dlp (runs in thread pool).
 
         Args:
             url: YouTube URL
             ydl_opts: yt-dlp configuration options
+            on_metadata: Called from the worker thread with the metadata as
+                soon as the download finishes, before postprocessing
+            prefetched: Info dict from an earlier extraction of url; formats
+                are selected and downloaded from it without re-extracting
 
         Returns:
             Dictionary with video metadata
         """
         info = {}
-        
-        def progress_hook(d):
-            """Progress hook for yt-dlp (currently unused but can be extended)"""
-            if d['status'] == 'finished':
-                info.update(d)
-
-        ydl_opts['progress_hooks'] = [progress_hook]
-
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            # Extract info first to get metadata
-            video_info = ydl.extract_info(url, download=True)
-            
-            # Update info with video metadata
-            info.update({
-                'title': video_info.get('title'),
-                'duration': video_info.get('duration'),
-                'uploader': video_info.get('uploader'),
-                'upload_date': video_info.get('upload_date'),
-                'view_count': video_info.get('view_count'),
-                'thumbnail': video_info.get('thumbnail'),
-            })
+        # Runs in a copied context (see _run_ytdlp), so this doesn't leak
+        # into other downloads on the same worker thread
+        token = _download_state.set((info, on_metadata))
+
+        key, ydl = self._acquire_ydl(ydl_opts)
+        try:
+            if prefetched is not None:
+                video_info = ydl.process_ie_result(prefetched, download=True)
+            else:
+                video_info = ydl.extract_info(url, download=True)
+        except Exception:
+            # Don't reuse an instance left in an unknown state
+            ydl.close()
+            raise
+        finally:
+            _download_state.reset(token)
+        self._release_ydl(key, ydl)
+
+        if not info:
+            # Hook didn't fire (nothing was downloaded); use the extraction result
+            info.update(video_info)
+
+        # Final path after any postprocessing (e.g. container fixups)
+        requested = video_info.get('requested_downloads') or [{}]
+        info['filepath'] = requested[0].get('filepath') or info.get('filepath')
 
         return info
 
-    async def get_audio_info(self, url: str) -> Dict[str, Any]:
+    def _extract_info(self, url: str) -> AudioInfo:
+        """Extract metadata without downloading (runs in thread pool)."""
+        key, ydl = self._acquire_ydl(INFO_YDL_OPTS)
+        try:
+            info = ydl.extract_info(url, download=False)
+        except Exception:
+            ydl.close()
+            raise
+        self._release_ydl(key, ydl)
+
+        video_id = _video_id(url)
+        if video_id:
+            with self._prefetched_lock:
+                self._prefetched_info[video_id] = (time.monotonic(), info)
+                self._prefetched_info.move_to_end(video_id)
+                if len(self._prefetched_info) > PREFETCHED_INFO_MAXSIZE:
+                    self._prefetched_info.popitem(last=False)
+
+        return AudioInfo(
+            title=info.get('title'),
+            duration=info.get('duration'),
+            uploader=info.get('uploader'),
+            thumbnail=info.get('thumbnail'),
+            view_count=info.get('view_count'),
+        )
+
+    def _take_prefetched_info(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Remove and return the stored info dict for video_id if it's still fresh.
+
+        Each dict is used for one download only, since yt-dlp updates it
+        while processing.
+        """
+        with self._prefetched_lock:
+            entry = self._prefetched_info.pop(video_id, None)
+        if entry and time.monotonic() - entry[0] < INFO_CACHE_TTL_SECONDS:
+            return entry[1]
+        return None
+
+    def _extract_playlist(self, url: str) -> List[Dict[str, Any]]:
+        """List playlist entries without visiting each video (runs in thread pool)."""
+        key, ydl = self._acquire_ydl(PLAYLIST_YDL_OPTS)
+        try:
+            info = ydl.extract_info(url, download=False)
+        except Exception:
+            ydl.close()
+            raise
+        self._release_ydl(key, ydl)
+        entries = info.get('entries') if info.get('_type') == 'playlist' else [info]
+        return [
+            {
+                'id': entry.get('id'),
+                'title': entry.get('title'),
+                'url': entry.get('url') or entry.get('webpage_url'),
+                'duration': entry.get('duration'),
+            }
+            for entry in entries or []
+            if entry
+        ]
+
+    async def get_playlist_entries(self, url: str) -> List[Dict[str, Any]]:
+        """
+        List the videos in a playlist with a single page fetch.
+
+        Only ids, titles, URLs and (when listed) durations are returned; use
+        get_audio_info() for full metadata, or pass the URLs to
+        download_many().
+
+        Args:
+            url: YouTube playlist URL
+
+        Returns:
+            List of dictionaries with id, title, url and duration
+
+        Example:
+            >>> entries = await downloader.get_playlist_entries("https://www.youtube.com/playlist?list=...")
+            >>> results = await downloader.download_many([e["url"] for e in entries], "/tmp/audio")
+        """
+        self.log.info("playlist_entries_requested", url=url[:100])
+
+        try:
+            entries = await self._run_ytdlp(self._extract_playlist, url)
+            self.log.info("playlist_entries_retrieved", url=url[:100], count=len(entries))
+            return entries
+
+        except Exception as e:
+            self.log.error("playlist_entries_failed", url=url[:100], error=str(e))
+            raise AudioDownloadError(f"Failed to list playlist: {str(e)}")
+
+    async def get_audio_info(self, url: str) -> AudioInfo:
         """
         Get audio metadata without downloading.
 
+        Results are cached per video ID for INFO_CACHE_TTL_SECONDS, and
+        concurrent requests for the same video share one extraction.
+
         Args:
             url: YouTube video URL
 
         Returns:
-            Dictionary with video metadata (title, duration, etc.)
+            AudioInfo with video metadata (title, duration, etc.); use
+            to_dict() for a plain dict
 
         Example:
             >>> info = await downloader.get_audio_info("https://www.youtube.com/watch?v=...")
-            >>> print(info["title"])
+            >>> print(info.title)
         """
-        logger.info("audio_info_requested", url=url[:100])
+        self.log.debug("audio_info_requested", url=url[:100])
+        url = _canonicalize_url(url)
+        cache_key = _video_id(url) or url
+
+        cached = self._info_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < INFO_CACHE_TTL_SECONDS:
+            self._info_cache.move_to_end(cache_key)
+            self.log.debug("audio_info_cache_hit", url=url[:100])
+            return cached[1]
+
+        # The extraction runs as its own task that every caller (the first
+        # included) awaits through shield(), so a cancelled caller stops
+        # waiting without cancelling it for the others
+        task = self._info_inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_audio_info(url, cache_key))
+            # Mark retrieved so a failure nobody awaits isn't logged by asyncio
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._info_inflight[cache_key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch_audio_info(self, url: str, cache_key: str) -> AudioInfo:
+        """Extract and cache metadata for get_audio_info(); runs as a shared task."""
+        try:
+            info = await self._run_ytdlp(self._extract_info, url)
+            self.log.info("audio_info_retrieved", url=url[:100], title=info.title)
 
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,
-            'noplaylist': True,
-        }
+            self._info_cache[cache_key] = (time.monotonic(), info)
+            self._info_cache.move_to_end(cache_key)
+            if len(self._info_cache) > INFO_CACHE_MAXSIZE:
+                self._info_cache.popitem(last=False)
 
-        try:
-            def extract_info():
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    return {
-                        'title': info.get('title'),
-                        'duration': info.get('duration'),
-                        'uploader': info.get('uploader'),
-                        'thumbnail': info.get('thumbnail'),
-                        'view_count': info.get('view_count'),
-                    }
-
-            info = await asyncio.to_thread(extract_info)
-            logger.info("audio_info_retrieved", url=url[:100], title=info.get('title'))
             return info
 
         except Exception as e:
-            logger.error("audio_info_failed", url=url[:100], error=str(e))
+            self.log.error("audio_info_failed", url=url[:100], error=str(e))
             raise AudioDownloadError(f"Failed to get audio info: {str(e)}")
 
+        finally:
+            del self._info_inflight[cache_key]
+
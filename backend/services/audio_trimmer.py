@@ -3,21 +3,65 @@ Audio Trimming Service
 
 Provides functionality for trimming audio files to specific time ranges.
 Used primarily for matching audio duration to video duration in stitching operations.
+
+Trimming runs FFmpeg directly: it seeks to the start time and re-encodes
+only the requested range, so the source is never decoded into memory.
+MP3 sources already at the requested bitrate are cut without re-encoding.
+Several cuts from one source are made by a single ffmpeg run.
 """
 
-import json
+import concurrent.futures
 import logging
+import os
+import subprocess
+import tempfile
+import time
 import uuid
-from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, NamedTuple, Optional, Sequence, Tuple
 
-from pydub import AudioSegment
+import orjson
 
 from config import settings
 
+# Debug logging is bound once: a no-op unless MV_DEBUG_MODE is on. Call
+# sites also check the setting so debug kwargs aren't built when it's off.
+if settings.MV_DEBUG_MODE:
+    from mv.debug import debug_log
+else:
+    def debug_log(event: str, **kwargs) -> None:
+        pass
+
 logger = logging.getLogger(__name__)
 
+# Directory holding downloaded and trimmed audio files. Kept as a str:
+# output paths are joined with os.path in the trim loop and passed straight
+# to ffmpeg argv and os.stat, with no pathlib objects built per range.
+AUDIO_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mv", "outputs", "audio")
+
+# Preference order when one audio ID exists in several formats
+_AUDIO_EXT_RANK = {ext: rank for rank, ext in enumerate(('mp3', 'm4a', 'opus', 'webm', 'ogg', 'aac'))}
+
+# Timeout for a single ffmpeg trim (seconds)
+FFMPEG_TIMEOUT = 300
+
+# Samples per MP3 (MPEG-1 Layer III) frame; stream-copied cuts land on
+# frame boundaries
+MP3_FRAME_SAMPLES = 1152
+
+# How far the source bitrate may be from output_quality for an MP3 to be
+# cut by copying frames instead of re-encoding
+STREAM_COPY_BITRATE_TOLERANCE = 0.05
+
+# Worker threads for trim_audio_async(). Each job mostly waits on an ffmpeg
+# subprocess, so threads are enough; one per core keeps the ffmpeg
+# processes from oversubscribing the CPU.
+_TRIM_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4,
+    thread_name_prefix="audio-trim",
+)
+
 
 class AudioTrimError(Exception):
     """Raised when audio trimming fails"""
@@ -34,20 +78,187 @@ def get_audio_file_path(audio_id: str) -> Optional[Path]:
     Returns:
         Path to audio file if found, None otherwise
     """
-    audio_dir = Path(__file__).parent.parent / "mv" / "outputs" / "audio"
+    # The directory's mtime changes whenever a file is added or removed,
+    # so keying the lookup cache on it keeps cached hits current. Misses
+    # aren't cached: on filesystems with coarse mtimes a file written right
+    # after a miss could leave the mtime unchanged.
+    try:
+        dir_mtime_ns = os.stat(AUDIO_DIR).st_mtime_ns
+        return _find_audio_file(audio_id, dir_mtime_ns)
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _find_audio_file(audio_id: str, dir_mtime_ns: int) -> Path:
+    """
+    Scan AUDIO_DIR once for {audio_id}.<ext>, preferring .mp3.
+
+    dir_mtime_ns only keys the cache (see get_audio_file_path()). Raises
+    FileNotFoundError when there is no match, which lru_cache doesn't store.
+    """
+    prefix = f"{audio_id}."
+    best = None
+    best_rank = len(_AUDIO_EXT_RANK)
+    with os.scandir(AUDIO_DIR) as entries:
+        for entry in entries:
+            if not entry.name.startswith(prefix):
+                continue
+            rank = _AUDIO_EXT_RANK.get(entry.name[len(prefix):])
+            if rank is not None and rank < best_rank:
+                best, best_rank = entry.path, rank
+                if rank == 0:
+                    break
+    if best is None:
+        raise FileNotFoundError(f"No audio file for {audio_id}")
+    return Path(best)
+
+
+class AudioProbe(NamedTuple):
+    """Container and first audio stream details read by ffprobe."""
+    duration: float
+    codec_name: Optional[str] = None
+    bit_rate: Optional[int] = None
+    sample_rate: Optional[int] = None
+
+
+def _probe_audio(path: Path) -> AudioProbe:
+    """
+    Read an audio file's duration and codec details with ffprobe.
+
+    Everything comes from the container and stream headers; no audio is
+    decoded.
+
+    Raises:
+        AudioTrimError: If ffprobe fails or reports no duration
+    """
+    cmd = [
+        'ffprobe', '-v', 'error',
+        '-select_streams', 'a:0',
+        '-show_entries', 'format=duration:stream=codec_name,bit_rate,sample_rate',
+        '-of', 'json',
+        str(path)
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.SubprocessError) as e:
+        raise AudioTrimError(f"ffprobe failed: {e}")
+    if result.returncode != 0:
+        raise AudioTrimError(f"ffprobe failed: {result.stderr.strip()}")
+    try:
+        info = orjson.loads(result.stdout)
+        duration = float(info['format']['duration'])
+    except (orjson.JSONDecodeError, ValueError, KeyError, TypeError):
+        raise AudioTrimError(f"Could not read duration of {path}")
+
+    stream = (info.get('streams') or [{}])[0]
+
+    def _int(value) -> Optional[int]:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    return AudioProbe(
+        duration=duration,
+        codec_name=stream.get('codec_name'),
+        bit_rate=_int(stream.get('bit_rate')),
+        sample_rate=_int(stream.get('sample_rate')),
+    )
+
+
+def get_audio_duration(path: Path) -> float:
+    """
+    Get an audio file's duration in seconds without decoding it.
+
+    Args:
+        path: Path to audio file
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        AudioTrimError: If the file can't be probed
+    """
+    return _probe_audio(path).duration
+
+
+def _can_stream_copy(probe: AudioProbe, output_quality: str) -> bool:
+    """Whether the source is an MP3 already at output_quality (within tolerance)."""
+    if probe.codec_name != 'mp3' or not probe.bit_rate or not probe.sample_rate:
+        return False
+    try:
+        requested = int(output_quality.lower().rstrip('k')) * 1000
+    except ValueError:
+        return False
+    return abs(probe.bit_rate - requested) <= requested * STREAM_COPY_BITRATE_TOLERANCE
+
+
+class _Cut(NamedTuple):
+    """One output of an ffmpeg trim run."""
+    output_path: str
+    start_time: float
+    duration: float
+    codec_args: Tuple[str, ...]
+
+
+class _PlannedTrim(NamedTuple):
+    """A validated range in a trim_audio_many() batch."""
+    new_audio_id: str
+    output_path: str
+    start_time: float
+    end_time: float
+    output_quality: str
+    stream_copy: bool
+    actual_start_time: float
+
 
-    # Check for .mp3 extension (primary format)
-    audio_path = audio_dir / f"{audio_id}.mp3"
-    if audio_path.exists():
-        return audio_path
+def _run_ffmpeg_trims(source_path: Path, cuts: Sequence[_Cut]) -> subprocess.CompletedProcess:
+    """
+    Write every cut from source_path in one ffmpeg run.
 
-    # Fallback to other formats
-    for ext in ['.m4a', '.opus', '.webm', '.ogg', '.aac']:
-        audio_path = audio_dir / f"{audio_id}{ext}"
-        if audio_path.exists():
-            return audio_path
+    The input is opened and demuxed once and feeds all outputs. -ss before
+    -i seeks the input to the earliest start instead of decoding up to it;
+    each output then starts at its offset from there. With re-encoding the
+    cuts are still sample-accurate.
+    """
+    seek = min(cut.start_time for cut in cuts)
+    cmd = [
+        'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+        '-ss', f"{seek}",
+        '-i', str(source_path),
+    ]
+    for cut in cuts:
+        offset = cut.start_time - seek
+        if offset:
+            cmd += ['-ss', f"{offset}"]
+        cmd += ['-t', f"{cut.duration}", '-map', '0:a:0', *cut.codec_args, os.fspath(cut.output_path)]
+    return subprocess.run(cmd, capture_output=True, text=True, timeout=FFMPEG_TIMEOUT)
+
+
+def _write_metadata(metadata_path: str, metadata: dict) -> None:
+    """
+    Atomically write metadata as indented JSON.
 
-    return None
+    The bytes go to a temp file in the same directory with one write, are
+    fsynced, then renamed over metadata_path, so readers never see a
+    partial file even if the process dies mid-write.
+    """
+    data = orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(metadata_path), suffix=".tmp")
+    try:
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, metadata_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def trim_audio(
@@ -78,11 +289,75 @@ def trim_audio(
         >>> new_id, path, meta = trim_audio("abc-123", 0.0, 30.5)
         >>> print(f"Trimmed audio: {new_id}")
     """
-    # Validate time range
-    if start_time < 0:
-        raise ValueError(f"start_time must be >= 0, got {start_time}")
-    if end_time <= start_time:
-        raise ValueError(f"end_time ({end_time}) must be > start_time ({start_time})")
+    return trim_audio_many(audio_id, [(start_time, end_time, output_quality)])[0]
+
+
+def trim_audio_async(
+    audio_id: str,
+    start_time: float,
+    end_time: float,
+    output_quality: str = "192k"
+) -> concurrent.futures.Future:
+    """
+    Submit trim_audio() to the shared trim worker pool.
+
+    Many trims submitted together run in parallel, up to one per CPU core,
+    instead of one after another. From asyncio code, await the result with
+    asyncio.wrap_future().
+
+    Args:
+        audio_id: UUID of source audio file
+        start_time: Start time in seconds (float)
+        end_time: End time in seconds (float)
+        output_quality: Audio quality/bitrate (default: "192k")
+
+    Returns:
+        Future resolving to trim_audio()'s (new_audio_id, new_audio_path,
+        metadata), or raising its AudioTrimError/ValueError
+
+    Example:
+        >>> futures = [trim_audio_async("abc-123", s, s + 10.0) for s in (0.0, 10.0, 20.0)]
+        >>> results = [f.result() for f in futures]
+    """
+    return _TRIM_POOL.submit(trim_audio, audio_id, start_time, end_time, output_quality)
+
+
+def trim_audio_many(
+    audio_id: str,
+    ranges: Sequence[Tuple[float, float, str]]
+) -> List[Tuple[str, str, dict]]:
+    """
+    Trim several time ranges from one audio file, each into a new file.
+
+    The source is probed once and all ranges are cut by a single ffmpeg
+    run, so process startup and demuxing are paid once per batch rather
+    than once per range.
+
+    Args:
+        audio_id: UUID of source audio file
+        ranges: (start_time, end_time, output_quality) per output, with
+            times in seconds and quality as a bitrate such as "192k"
+
+    Returns:
+        One (new_audio_id, new_audio_path, metadata) tuple per range, in order
+
+    Raises:
+        AudioTrimError: If audio file not found or trimming fails
+        ValueError: If any time range is invalid
+
+    Example:
+        >>> results = trim_audio_many("abc-123", [(0.0, 10.0, "192k"), (10.0, 20.0, "192k")])
+        >>> print([new_id for new_id, _, _ in results])
+    """
+    if not ranges:
+        return []
+
+    # Validate time ranges
+    for start_time, end_time, _ in ranges:
+        if start_time < 0:
+            raise ValueError(f"start_time must be >= 0, got {start_time}")
+        if end_time <= start_time:
+            raise ValueError(f"end_time ({end_time}) must be > start_time ({start_time})")
 
     # Locate source audio file
     source_path = get_audio_file_path(audio_id)
@@ -90,101 +365,123 @@ def trim_audio(
         raise AudioTrimError(f"Audio file with ID '{audio_id}' not found")
 
     if settings.MV_DEBUG_MODE:
-        from mv.debug import debug_log
         debug_log(
             "audio_trim_started",
             audio_id=audio_id,
             source_path=str(source_path),
-            start_time=start_time,
-            end_time=end_time,
-            output_quality=output_quality
+            ranges=[list(r) for r in ranges]
         )
 
     try:
-        # Load audio file
-        logger.info(f"Loading audio file: {source_path}")
-        audio = AudioSegment.from_file(str(source_path))
-
-        # Get audio duration in seconds
-        audio_duration_seconds = len(audio) / 1000.0
-
-        # Validate times are within audio duration
-        if start_time > audio_duration_seconds:
-            raise ValueError(
-                f"start_time ({start_time}s) exceeds audio duration ({audio_duration_seconds}s)"
-            )
-        if end_time > audio_duration_seconds:
-            # Clamp end_time to audio duration instead of failing
-            logger.warning(
-                f"end_time ({end_time}s) exceeds audio duration ({audio_duration_seconds}s), "
-                f"clamping to {audio_duration_seconds}s"
-            )
-            end_time = audio_duration_seconds
-
-        # Convert to milliseconds for pydub
-        start_ms = int(start_time * 1000)
-        end_ms = int(end_time * 1000)
-
-        # Extract segment
-        logger.info(f"Extracting audio segment: {start_time}s to {end_time}s")
-        trimmed_audio = audio[start_ms:end_ms]
-
-        # Generate new UUID for trimmed audio
-        new_audio_id = str(uuid.uuid4())
-
-        # Save trimmed audio
-        audio_dir = Path(__file__).parent.parent / "mv" / "outputs" / "audio"
-        audio_dir.mkdir(parents=True, exist_ok=True)
-
-        output_path = audio_dir / f"{new_audio_id}.mp3"
-
-        logger.info(f"Saving trimmed audio to: {output_path}")
-        trimmed_audio.export(
-            str(output_path),
-            format="mp3",
-            bitrate=output_quality
-        )
-
-        # Verify file was created
-        if not output_path.exists():
-            raise AudioTrimError(f"Failed to create trimmed audio file: {output_path}")
-
-        file_size = output_path.stat().st_size
-
-        # Build metadata
-        metadata = {
-            "source_audio_id": audio_id,
-            "trimmed_audio_id": new_audio_id,
-            "start_time": start_time,
-            "end_time": end_time,
-            "duration": end_time - start_time,
-            "source_duration": audio_duration_seconds,
-            "output_quality": output_quality,
-            "file_size_bytes": file_size,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-        }
-
-        # Save metadata to JSON file
-        metadata_path = audio_dir / f"{new_audio_id}_metadata.json"
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
-
-        if settings.MV_DEBUG_MODE:
-            from mv.debug import debug_log
-            debug_log(
-                "audio_trim_completed",
-                new_audio_id=new_audio_id,
-                output_path=str(output_path),
-                file_size_bytes=file_size,
-                duration=metadata["duration"]
+        # Get audio duration in seconds (from the container header)
+        probe = _probe_audio(source_path)
+        audio_duration_seconds = probe.duration
+
+        os.makedirs(AUDIO_DIR, exist_ok=True)
+
+        planned = []
+        for start_time, end_time, output_quality in ranges:
+            # Validate times are within audio duration
+            if start_time > audio_duration_seconds:
+                raise ValueError(
+                    f"start_time ({start_time}s) exceeds audio duration ({audio_duration_seconds}s)"
+                )
+            if end_time > audio_duration_seconds:
+                # Clamp end_time to audio duration instead of failing
+                logger.warning(
+                    f"end_time ({end_time}s) exceeds audio duration ({audio_duration_seconds}s), "
+                    f"clamping to {audio_duration_seconds}s"
+                )
+                end_time = audio_duration_seconds
+
+            # Generate new UUID for trimmed audio
+            new_audio_id = str(uuid.uuid4())
+            output_path = os.path.join(AUDIO_DIR, f"{new_audio_id}.mp3")
+
+            # Fast path: an MP3 already at the requested bitrate is cut by
+            # copying whole frames, with no decode or LAME encode. The cut
+            # snaps to the frame containing start_time.
+            stream_copy = _can_stream_copy(probe, output_quality)
+            actual_start_time = start_time
+            if stream_copy:
+                frame_seconds = MP3_FRAME_SAMPLES / probe.sample_rate
+                actual_start_time = int(start_time / frame_seconds) * frame_seconds
+            planned.append(_PlannedTrim(
+                new_audio_id, output_path, start_time, end_time, output_quality,
+                stream_copy, actual_start_time
+            ))
+
+        def build_cuts(allow_copy: bool) -> List[_Cut]:
+            cuts = []
+            for trim in planned:
+                if trim.stream_copy and allow_copy:
+                    cuts.append(_Cut(
+                        trim.output_path, trim.actual_start_time,
+                        trim.end_time - trim.actual_start_time, ('-c:a', 'copy')
+                    ))
+                else:
+                    cuts.append(_Cut(
+                        trim.output_path, trim.start_time, trim.end_time - trim.start_time,
+                        ('-c:a', 'libmp3lame', '-b:a', trim.output_quality)
+                    ))
+            return cuts
+
+        logger.info(f"Trimming {len(planned)} range(s) from {source_path}")
+        copied = any(trim.stream_copy for trim in planned)
+        result = _run_ffmpeg_trims(source_path, build_cuts(allow_copy=True))
+        if result.returncode != 0 and copied:
+            logger.warning(f"Stream copy trim failed, re-encoding: {result.stderr.strip()}")
+            copied = False
+            result = _run_ffmpeg_trims(source_path, build_cuts(allow_copy=False))
+        if result.returncode != 0:
+            raise AudioTrimError(f"ffmpeg failed: {result.stderr.strip()}")
+
+        results = []
+        for new_audio_id, output_path, start_time, end_time, output_quality, stream_copy, actual_start in planned:
+            # A failed copy run is redone with every range re-encoded
+            stream_copied = stream_copy and copied
+
+            # Verify file was created (one stat also gives the size)
+            try:
+                file_size = os.stat(output_path).st_size
+            except FileNotFoundError:
+                raise AudioTrimError(f"Failed to create trimmed audio file: {output_path}")
+
+            # Build metadata
+            metadata = {
+                "source_audio_id": audio_id,
+                "trimmed_audio_id": new_audio_id,
+                "start_time": start_time,
+                "end_time": end_time,
+                "duration": end_time - start_time,
+                "source_duration": audio_duration_seconds,
+                "output_quality": output_quality,
+                "stream_copied": stream_copied,
+                "actual_start_time": actual_start if stream_copied else start_time,
+                "file_size_bytes": file_size,
+                "created_at_ns": time.time_ns(),
+            }
+
+            # Save metadata to JSON file
+            _write_metadata(os.path.join(AUDIO_DIR, f"{new_audio_id}_metadata.json"), metadata)
+
+            if settings.MV_DEBUG_MODE:
+                debug_log(
+                    "audio_trim_completed",
+                    new_audio_id=new_audio_id,
+                    output_path=output_path,
+                    file_size_bytes=file_size,
+                    duration=metadata["duration"]
+                )
+
+            logger.info(
+                f"Audio trimming completed: {audio_id} -> {new_audio_id} "
+                f"({start_time}s to {end_time}s, {file_size} bytes)"
             )
 
-        logger.info(
-            f"Audio trimming completed: {audio_id} -> {new_audio_id} "
-            f"({start_time}s to {end_time}s, {file_size} bytes)"
-        )
+            results.append((new_audio_id, output_path, metadata))
 
-        return new_audio_id, str(output_path), metadata
+        return results
 
     except Exception as e:
         logger.error(f"Audio trimming failed: {e}", exc_info=True)
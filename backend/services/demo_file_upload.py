@@ -8,22 +8,20 @@ import asyncio
 from pathlib import Path
 from PIL import Image
 import io
+import numpy as np
 from services.file_upload import FileUploadService
 
 
 def create_sample_image(format="JPEG", size=(1920, 1080)):
     """Create a sample image for testing"""
-    # Create a gradient image
-    img = Image.new('RGB', size)
-    pixels = img.load()
-
-    for i in range(size[0]):
-        for j in range(size[1]):
-            # Create a nice gradient
-            r = int(255 * i / size[0])
-            g = int(255 * j / size[1])
-            b = 128
-            pixels[i, j] = (r, g, b)
+    # Create a gradient image: red across, green down, constant blue.
+    # Built as whole arrays rather than pixel by pixel.
+    width, height = size
+    arr = np.empty((height, width, 3), dtype=np.uint8)
+    arr[..., 0] = (np.arange(width) * 255 // width)[None, :]
+    arr[..., 1] = (np.arange(height) * 255 // height)[:, None]
+    arr[..., 2] = 128
+    img = Image.fromarray(arr, 'RGB')
 
     # Save to bytes
     img_bytes = io.BytesIO()
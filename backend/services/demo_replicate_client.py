@@ -70,13 +70,20 @@ async def demo_async_usage():
     output_dir = Path("./demo_outputs")
     output_dir.mkdir(exist_ok=True)
 
-    for i, output in enumerate(outputs):
-        if output:
-            path = client.download_output(
-                output[0],
-                str(output_dir / f"async_image_{i}.webp")
-            )
-            print(f"  [{i+1}] Saved: {path}")
+    # download_output is blocking, so fan the downloads out to threads
+    downloads = {
+        i: asyncio.to_thread(
+            client.download_output,
+            output[0],
+            str(output_dir / f"async_image_{i}.webp")
+        )
+        for i, output in enumerate(outputs)
+        if output
+    }
+    paths = await asyncio.gather(*downloads.values())
+
+    for i, path in zip(downloads, paths):
+        print(f"  [{i+1}] Saved: {path}")
 
 
 def demo_background_prediction():
@@ -7,7 +7,9 @@ Supports PNG, JPG, and WebP image formats with size limits up to 10MB.
 
 import os
 import asyncio
+import shutil
 import aiofiles
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Tuple
 from PIL import Image
@@ -54,10 +56,20 @@ class FileUploadService:
 
     # Subtask 2: Thumbnail Generation - Thumbnail configuration
     THUMBNAIL_SIZE = (300, 300)  # Width x Height
-    THUMBNAIL_QUALITY = 85  # JPEG quality for thumbnails
+    THUMBNAIL_QUALITY = 82  # JPEG quality for thumbnails
+    # Progressive JPEG only pays off above roughly 10KB; for 300px thumbnails
+    # baseline is 1-2% smaller, so it stays off unless larger sizes are used
+    THUMBNAIL_PROGRESSIVE = False
+    # 3-tap filter; at 300px it looks the same as LANCZOS for far less work
+    THUMBNAIL_FILTER = Image.Resampling.HAMMING
 
     # Subtask 4: Temporary Storage Management
     DEFAULT_UPLOAD_DIR = "/tmp/uploads"
+    # Uploads remembered by content hash so repeats can be copied
+    CONTENT_CACHE_SIZE = 1024
+
+    # Characters replaced with '_' in stored filenames
+    _SANITIZE_TABLE = str.maketrans({c: '_' for c in '/\\\0\n\r'})
 
     def __init__(self, upload_dir: str = DEFAULT_UPLOAD_DIR):
         """
@@ -68,6 +80,9 @@ class FileUploadService:
         """
         self.upload_dir = Path(upload_dir)
         self.upload_dir.mkdir(parents=True, exist_ok=True)
+        # content hash -> (file_path, (size, mtime_ns), thumbnail_path,
+        # (size, mtime_ns) or None, format), in LRU order
+        self._content_cache: OrderedDict[str, tuple] = OrderedDict()
         logger.info(f"FileUploadService initialized with upload_dir: {self.upload_dir}")
 
     # Subtask 1: Implement File Format Validation
@@ -89,42 +104,143 @@ class FileUploadService:
         """
         try:
             # Check file extension
-            file_ext = Path(filename).suffix.lower()
-            if file_ext not in self.SUPPORTED_EXTENSIONS:
-                return False, None, (
-                    f"Unsupported file extension: {file_ext}. "
-                    f"Supported extensions: {', '.join(self.SUPPORTED_EXTENSIONS)}"
-                )
+            extension_error = self._check_extension(filename)
+            if extension_error:
+                return False, None, extension_error
 
-            # Verify actual image format using Pillow
-            image_stream = io.BytesIO(file_content)
-            try:
-                with Image.open(image_stream) as img:
-                    # Verify the image format
-                    img_format = img.format
-
-                    if img_format not in self.SUPPORTED_FORMATS:
-                        return False, None, (
-                            f"Unsupported image format: {img_format}. "
-                            f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
-                        )
+            # Verify actual image format using Pillow, off the event loop
+            return await asyncio.to_thread(self._verify_image, file_content, filename)
+
+        except Exception as e:
+            logger.error(f"Format validation error for {filename}: {e}")
+            return False, None, f"Format validation failed: {str(e)}"
 
-                    # Additional validation: check if image can be loaded
-                    img.verify()
+    def _verify_image(self, file_content: bytes, filename: str) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Pillow half of validate_format(); blocking, so run in a thread."""
+        image_stream = io.BytesIO(file_content)
+        try:
+            with Image.open(image_stream) as img:
+                # Verify the image format
+                img_format = img.format
 
-                    logger.info(
-                        f"File format validated: {filename} - "
-                        f"Format: {img_format}, Size: {img.size}, Mode: {img.mode}"
+                if img_format not in self.SUPPORTED_FORMATS:
+                    return False, None, (
+                        f"Unsupported image format: {img_format}. "
+                        f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
                     )
 
-                    return True, img_format, None
+                # Additional validation: check if image can be loaded
+                img.verify()
+
+                logger.info(
+                    f"File format validated: {filename} - "
+                    f"Format: {img_format}, Size: {img.size}, Mode: {img.mode}"
+                )
 
-            except Exception as e:
-                return False, None, f"Invalid or corrupted image file: {str(e)}"
+                return True, img_format, None
 
         except Exception as e:
-            logger.error(f"Format validation error for {filename}: {e}")
-            return False, None, f"Format validation failed: {str(e)}"
+            return False, None, f"Invalid or corrupted image file: {str(e)}"
+
+    def _check_extension(self, filename: str) -> Optional[str]:
+        """Return an error message if filename's extension is not supported."""
+        file_ext = Path(filename).suffix.lower()
+        if file_ext not in self.SUPPORTED_EXTENSIONS:
+            return (
+                f"Unsupported file extension: {file_ext}. "
+                f"Supported extensions: {', '.join(self.SUPPORTED_EXTENSIONS)}"
+            )
+        return None
+
+    def _decode_once(
+        self,
+        file_content: bytes,
+        filename: str,
+        draft_size: Optional[Tuple[int, int]] = None
+    ) -> Tuple[Optional[Image.Image], Optional[str], Optional[str]]:
+        """
+        Validate and fully decode an image in a single Image.open pass.
+
+        Used by process_upload() when a thumbnail is wanted, instead of
+        validate_format() followed by a second open in generate_thumbnail().
+        load() decodes every pixel, so truncated or corrupt data is caught
+        just as verify() would, and the decoded image is then handed to
+        generate_thumbnail_from_image(). The caller must close the image.
+        Blocking, so process_upload() runs it in a worker thread.
+
+        With draft_size, JPEGs are decoded by libjpeg at a reduced scale
+        (1/2, 1/4 or 1/8) that still covers twice the thumbnail that fits in
+        draft_size, which skips most of the IDCT work for large photos.
+
+        Args:
+            file_content: Binary content of the uploaded file
+            filename: Original filename
+            draft_size: Thumbnail size the decoded image will be reduced to
+
+        Returns:
+            Tuple of (image, format, error_message); image is None on error
+        """
+        extension_error = self._check_extension(filename)
+        if extension_error:
+            return None, None, extension_error
+
+        try:
+            img = Image.open(io.BytesIO(file_content))
+        except Exception as e:
+            return None, None, f"Invalid or corrupted image file: {str(e)}"
+
+        try:
+            img_format = img.format
+            if img_format not in self.SUPPORTED_FORMATS:
+                img.close()
+                return None, None, (
+                    f"Unsupported image format: {img_format}. "
+                    f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
+                )
+
+            logger.info(
+                f"File format validated: {filename} - "
+                f"Format: {img_format}, Size: {img.size}, Mode: {img.mode}"
+            )
+
+            if draft_size and img_format == "JPEG":
+                # Same target as Image.thumbnail()'s own draft (reducing_gap=2)
+                # which no longer applies once the image is loaded here
+                scale = min(draft_size[0] / img.width, draft_size[1] / img.height)
+                if scale < 0.5:
+                    img.draft(None, (int(img.width * scale * 2), int(img.height * scale * 2)))
+
+            img.load()
+        except Exception as e:
+            img.close()
+            return None, None, f"Invalid or corrupted image file: {str(e)}"
+
+        return img, img_format, None
+
+    @staticmethod
+    def validate_magic(header: bytes) -> Optional[str]:
+        """
+        Identify a supported image format from its leading signature bytes.
+
+        A cheap pre-check that rejects non-images before any Pillow decode.
+
+        Args:
+            header: At least the first 12 bytes of the file
+
+        Returns:
+            "PNG", "JPEG" or "WEBP", or None if the signature isn't one of them
+
+        Example:
+            >>> FileUploadService.validate_magic(image_bytes[:12])
+            'JPEG'
+        """
+        if header.startswith(b"\x89PNG\r\n\x1a\n"):
+            return "PNG"
+        if header.startswith(b"\xff\xd8\xff"):
+            return "JPEG"
+        if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+            return "WEBP"
+        return None
 
     # Subtask 3: Implement File Size Validation
     async def validate_size(self, file_content: bytes, filename: str) -> Tuple[bool, Optional[str]]:
@@ -189,52 +305,123 @@ class FileUploadService:
             ... )
         """
         try:
-            # Open image from bytes
-            image_stream = io.BytesIO(file_content)
+            return await asyncio.to_thread(
+                self._thumbnail_from_bytes, file_content, thumbnail_path, size
+            )
 
-            with Image.open(image_stream) as img:
-                # Convert RGBA to RGB if needed (for JPEG compatibility)
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    # Create a white background
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                    img = background
-                elif img.mode not in ('RGB', 'L'):
-                    img = img.convert('RGB')
-
-                # Create thumbnail (maintains aspect ratio)
-                img.thumbnail(size, Image.Resampling.LANCZOS)
-
-                # Save thumbnail
-                thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Save as JPEG for consistent format
-                img.save(
-                    thumbnail_path,
-                    format='JPEG',
-                    quality=self.THUMBNAIL_QUALITY,
-                    optimize=True
-                )
+        except Exception as e:
+            logger.error(f"Thumbnail generation failed: {e}")
+            raise FileUploadError(f"Failed to generate thumbnail: {str(e)}")
 
-                logger.info(
-                    f"Thumbnail generated: {thumbnail_path} - "
-                    f"Size: {img.size}, Original requested: {size}"
-                )
+    async def generate_thumbnail_from_image(
+        self,
+        img: Image.Image,
+        thumbnail_path: Path,
+        size: Tuple[int, int] = THUMBNAIL_SIZE
+    ) -> str:
+        """
+        Generate a thumbnail from an already opened image.
+
+        Same as generate_thumbnail() without re-reading the bytes, for callers
+        that already decoded the image (see process_upload()). RGB and L
+        images are resized in place; pass a copy to keep the original.
+
+        Args:
+            img: Opened Pillow image
+            thumbnail_path: Path where thumbnail should be saved
+            size: Thumbnail dimensions (width, height)
+
+        Returns:
+            Absolute path to the generated thumbnail
 
-                return str(thumbnail_path)
+        Raises:
+            FileUploadError: If thumbnail generation fails
+        """
+        try:
+            return await asyncio.to_thread(self._save_thumbnail, img, thumbnail_path, size)
 
         except Exception as e:
             logger.error(f"Thumbnail generation failed: {e}")
             raise FileUploadError(f"Failed to generate thumbnail: {str(e)}")
 
+    def _thumbnail_from_bytes(self, file_content: bytes, thumbnail_path: Path, size: Tuple[int, int]) -> str:
+        """Open the bytes and save their thumbnail; blocking, so run in a thread."""
+        image_stream = io.BytesIO(file_content)
+        with Image.open(image_stream) as img:
+            return self._save_thumbnail(img, thumbnail_path, size)
+
+    def _save_thumbnail(self, img: Image.Image, thumbnail_path: Path, size: Tuple[int, int]) -> str:
+        """
+        Resize img and save it as a JPEG thumbnail.
+
+        Pillow releases the GIL while decoding, resampling and encoding, so
+        the async callers run this in a worker thread.
+        """
+        # Convert RGBA to RGB if needed (for JPEG compatibility)
+        if img.mode in ('RGBA', 'LA', 'P'):
+            # Create a white background
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+            background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+            img = background
+        elif img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+
+        # Create thumbnail (maintains aspect ratio)
+        img.thumbnail(size, self.THUMBNAIL_FILTER)
+
+        # Save thumbnail
+        thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Save as JPEG for consistent format
+        img.save(
+            thumbnail_path,
+            format='JPEG',
+            quality=self.THUMBNAIL_QUALITY,
+            optimize=True,
+            progressive=self.THUMBNAIL_PROGRESSIVE
+        )
+
+        logger.info(
+            f"Thumbnail generated: {thumbnail_path} - "
+            f"Size: {img.size}, Original requested: {size}"
+        )
+
+        return str(thumbnail_path)
+
+    @staticmethod
+    def _content_hash(file_content: bytes) -> str:
+        """
+        Hash the whole file content.
+
+        SHA-256 is hardware accelerated (SHA-NI / ARMv8 crypto) in OpenSSL on
+        current CPUs, where it measures faster than MD5 or BLAKE2b for whole
+        uploads, and hashlib releases the GIL while it runs. Unlike hashing
+        just the first 1KB, files that share a header (e.g. identical EXIF
+        preludes) still get distinct hashes.
+
+        Args:
+            file_content: Binary content of the file
+
+        Returns:
+            Hex digest
+        """
+        return hashlib.sha256(file_content).hexdigest()
+
+    @staticmethod
+    def _new_session_id(content_hash: str) -> str:
+        """Session ID from the current time and the upload's content hash."""
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        return f"{timestamp}_{content_hash[:8]}"
+
     # Subtask 4: Manage Temporary Storage for Uploaded Files
     async def save_to_storage(
         self,
         file_content: bytes,
         filename: str,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        content_hash: Optional[str] = None
     ) -> Tuple[str, str]:
         """
         Save uploaded file to temporary storage with unique session directory.
@@ -245,6 +432,8 @@ class FileUploadService:
             file_content: Binary content of the file
             filename: Original filename
             session_id: Optional session ID, auto-generated if not provided
+            content_hash: _content_hash() of file_content if the caller already
+                computed it; only used to name auto-generated sessions
 
         Returns:
             Tuple of (file_path, session_id)
@@ -259,9 +448,9 @@ class FileUploadService:
         try:
             # Generate session ID if not provided
             if not session_id:
-                timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-                file_hash = hashlib.md5(file_content[:1024]).hexdigest()[:8]
-                session_id = f"{timestamp}_{file_hash}"
+                if content_hash is None:
+                    content_hash = await asyncio.to_thread(self._content_hash, file_content)
+                session_id = self._new_session_id(content_hash)
 
             # Create session directory
             session_dir = self.upload_dir / session_id
@@ -299,18 +488,13 @@ class FileUploadService:
         try:
             session_dir = self.upload_dir / session_id
 
-            if session_dir.exists():
-                # Remove all files in directory
-                for file_path in session_dir.iterdir():
-                    if file_path.is_file():
-                        file_path.unlink()
-                        logger.debug(f"Deleted file: {file_path}")
+            # rmtree walks with fd-relative unlinkat on Linux; in a thread so
+            # large sessions don't block the event loop
+            await asyncio.to_thread(shutil.rmtree, session_dir)
+            logger.info(f"Cleaned up session directory: {session_id}")
 
-                # Remove directory
-                session_dir.rmdir()
-                logger.info(f"Cleaned up session directory: {session_id}")
-            else:
-                logger.warning(f"Session directory not found: {session_id}")
+        except FileNotFoundError:
+            logger.warning(f"Session directory not found: {session_id}")
 
         except Exception as e:
             logger.error(f"Failed to cleanup session {session_id}: {e}")
@@ -346,10 +530,9 @@ class FileUploadService:
         # Get just the filename, no path components
         safe_name = Path(filename).name
 
-        # Remove or replace dangerous characters
-        dangerous_chars = ['..', '/', '\\', '\0', '\n', '\r']
-        for char in dangerous_chars:
-            safe_name = safe_name.replace(char, '_')
+        # Remove or replace dangerous characters: '..' first, then every
+        # single dangerous character in one translate() pass
+        safe_name = safe_name.replace('..', '_').translate(self._SANITIZE_TABLE)
 
         # Ensure filename is not empty
         if not safe_name or safe_name == '_':
@@ -357,6 +540,114 @@ class FileUploadService:
 
         return safe_name
 
+    async def _reuse_cached_upload(
+        self,
+        content_hash: str,
+        filename: str,
+        session_id: Optional[str],
+        want_thumbnail: bool
+    ) -> Optional[Tuple[str, Optional[str], str, str]]:
+        """
+        Copy an earlier upload with the same content into a session.
+
+        Copies rather than hardlinks: later writes to either path (a new
+        upload under the same name truncates the file in place) must not
+        change the other session's files. The cached files' size and mtime
+        are checked first, so a cached path that has since been overwritten
+        is never reused.
+
+        Args:
+            content_hash: _content_hash() of the new upload
+            filename: Original filename of the new upload
+            session_id: Optional session ID, auto-generated if not provided
+            want_thumbnail: Whether the new upload needs a thumbnail
+
+        Returns:
+            Tuple of (file_path, thumbnail_path, session_id, format), or None
+            if nothing usable is cached (miss, no cached thumbnail when one
+            is wanted, or the earlier files were changed or cleaned up)
+        """
+        cached = self._content_cache.get(content_hash)
+        if cached is None or self._check_extension(filename):
+            # Misses and bad extensions take the normal path (which reports it)
+            return None
+        cached_path, cached_signature, cached_thumbnail, thumbnail_signature, img_format = cached
+        if want_thumbnail and cached_thumbnail is None:
+            return None
+
+        session_id = session_id or self._new_session_id(content_hash)
+        session_dir = self.upload_dir / session_id
+        file_path = session_dir / self._sanitize_filename(filename)
+        copies = [(Path(cached_path), cached_signature, file_path)]
+        thumbnail_path = None
+        if want_thumbnail:
+            thumbnail_path = session_dir / f"thumb_{Path(filename).stem}.jpg"
+            copies.append((Path(cached_thumbnail), thumbnail_signature, thumbnail_path))
+
+        try:
+            await asyncio.to_thread(self._copy_cached_files, session_dir, copies)
+        except OSError as e:
+            logger.info(f"Cached upload not reusable, processing again: {e}")
+            self._content_cache.pop(content_hash, None)
+            return None
+
+        self._content_cache.move_to_end(content_hash)
+        logger.info(f"Duplicate upload copied: {cached_path} -> {file_path}")
+        return (
+            str(file_path),
+            str(thumbnail_path) if thumbnail_path else None,
+            session_id,
+            img_format,
+        )
+
+    @staticmethod
+    def _file_signature(path) -> Tuple[int, int]:
+        """(size, mtime_ns) of a file, used to tell if a cached file changed."""
+        st = os.stat(path)
+        return st.st_size, st.st_mtime_ns
+
+    @classmethod
+    def _copy_cached_files(cls, session_dir: Path, copies: list) -> None:
+        """
+        Copy each (src, signature, dst), replacing any existing dst.
+
+        Raises:
+            OSError: If a src is missing or no longer matches its signature
+        """
+        # Check every source before writing anything
+        for src, signature, _ in copies:
+            if cls._file_signature(src) != signature:
+                raise OSError(f"Cached file changed since it was stored: {src}")
+
+        session_dir.mkdir(parents=True, exist_ok=True)
+        for src, _, dst in copies:
+            if src != dst:
+                # copyfile uses in-kernel copying (sendfile) on Linux
+                shutil.copyfile(src, dst)
+
+    async def _remember_upload(
+        self,
+        content_hash: str,
+        file_path: str,
+        thumbnail_path: Optional[str],
+        img_format: str
+    ) -> None:
+        """Record a processed upload for _reuse_cached_upload(), evicting the oldest."""
+        try:
+            file_signature = await asyncio.to_thread(self._file_signature, file_path)
+            thumbnail_signature = (
+                await asyncio.to_thread(self._file_signature, thumbnail_path)
+                if thumbnail_path else None
+            )
+        except OSError:
+            return
+        self._content_cache[content_hash] = (
+            file_path, file_signature, thumbnail_path, thumbnail_signature, img_format
+        )
+        self._content_cache.move_to_end(content_hash)
+        while len(self._content_cache) > self.CONTENT_CACHE_SIZE:
+            self._content_cache.popitem(last=False)
+
     async def process_upload(
         self,
         file_content: bytes,
@@ -373,6 +664,10 @@ class FileUploadService:
         3. Save to storage
         4. Generate thumbnail (optional)
 
+        Content already uploaded through this service is copied from
+        the earlier upload instead, skipping format validation and the
+        thumbnail decode/encode.
+
         Args:
             file_content: Binary content of the uploaded file
             filename: Original filename
@@ -414,11 +709,8 @@ class FileUploadService:
                     "error": size_error
                 }
 
-            # Subtask 1: Validate file format
-            format_valid, img_format, format_error = await self.validate_format(
-                file_content, filename
-            )
-            if not format_valid:
+            # Reject non-images from their signature, before hashing or decoding
+            if self.validate_magic(file_content[:12]) is None:
                 return {
                     "success": False,
                     "file_path": None,
@@ -426,26 +718,80 @@ class FileUploadService:
                     "session_id": None,
                     "format": None,
                     "size_bytes": len(file_content),
-                    "error": format_error
+                    "error": (
+                        "Invalid or corrupted image file: unrecognized file signature. "
+                        f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
+                    )
                 }
 
-            # Subtask 4: Save to temporary storage
-            file_path, session_id = await self.save_to_storage(
-                file_content, filename, session_id
+            # Identical bytes seen before: copy the earlier file and thumbnail
+            # into this session instead of decoding and re-encoding them
+            content_hash = await asyncio.to_thread(self._content_hash, file_content)
+            reused = await self._reuse_cached_upload(
+                content_hash, filename, session_id, generate_thumbnail
             )
+            if reused is not None:
+                file_path, thumbnail_path, session_id, img_format = reused
+            else:
+                # Subtask 1: Validate file format. When a thumbnail is wanted the
+                # image is decoded once here and that decode is reused for it.
+                img = None
+                if generate_thumbnail:
+                    img, img_format, format_error = await asyncio.to_thread(
+                        self._decode_once, file_content, filename, self.THUMBNAIL_SIZE
+                    )
+                    format_valid = img is not None
+                else:
+                    format_valid, img_format, format_error = await self.validate_format(
+                        file_content, filename
+                    )
+                if not format_valid:
+                    return {
+                        "success": False,
+                        "file_path": None,
+                        "thumbnail_path": None,
+                        "session_id": None,
+                        "format": None,
+                        "size_bytes": len(file_content),
+                        "error": format_error
+                    }
 
-            # Subtask 2: Generate thumbnail
-            thumbnail_path = None
-            if generate_thumbnail:
                 try:
-                    thumb_filename = f"thumb_{Path(filename).stem}.jpg"
-                    thumb_path = Path(file_path).parent / thumb_filename
-                    thumbnail_path = await self.generate_thumbnail(
-                        file_content, thumb_path
+                    # Subtask 4: Save to temporary storage. The session is
+                    # named up front so the thumbnail path is known without
+                    # waiting for the save.
+                    session_id = session_id or self._new_session_id(content_hash)
+                    saving = self.save_to_storage(
+                        file_content, filename, session_id, content_hash=content_hash
                     )
-                except Exception as e:
-                    logger.warning(f"Thumbnail generation failed (non-fatal): {e}")
-                    # Continue without thumbnail
+
+                    # Subtask 2: Generate thumbnail, concurrently with the save
+                    thumbnail_path = None
+                    if img is not None:
+                        thumb_filename = f"thumb_{Path(filename).stem}.jpg"
+                        thumb_path = self.upload_dir / session_id / thumb_filename
+                        # return_exceptions: both must finish before img is closed
+                        saved, thumbnail_path = await asyncio.gather(
+                            saving,
+                            self.generate_thumbnail_from_image(img, thumb_path),
+                            return_exceptions=True
+                        )
+                        if isinstance(thumbnail_path, BaseException):
+                            logger.warning(f"Thumbnail generation failed (non-fatal): {thumbnail_path}")
+                            # Continue without thumbnail
+                            thumbnail_path = None
+                        if isinstance(saved, BaseException):
+                            if thumbnail_path:
+                                thumb_path.unlink(missing_ok=True)
+                            raise saved
+                    else:
+                        saved = await saving
+                    file_path, session_id = saved
+                finally:
+                    if img is not None:
+                        img.close()
+
+                await self._remember_upload(content_hash, file_path, thumbnail_path, img_format)
 
             logger.info(
                 f"Upload processed successfully: {filename} - "
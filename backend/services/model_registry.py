@@ -5,9 +5,11 @@ This module provides a single source of truth for all AI model configurations,
 supporting runtime model selection and easy model switching.
 """
 
+from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Dict, Any, Optional
-from pydantic import BaseModel
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 import structlog
 
 logger = structlog.get_logger()
@@ -21,16 +23,21 @@ class ModelTask(str, Enum):
     CTA_IMAGE = "cta_image"
 
 
-class ModelConfig(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ModelConfig:
     """Configuration for a specific AI model"""
     model_id: str  # Replicate model ID (e.g., "meta/llama-2-70b-chat")
     version: Optional[str] = None  # Specific version hash (optional)
     display_name: str
     description: str
-    default_params: Dict[str, Any] = {}
+    default_params: Mapping[str, Any] = field(default_factory=dict)
     cost_per_run: float = 0.0  # Estimated cost in USD
     avg_duration: float = 0.0  # Average duration in seconds
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form (what model_dump() gave when this was a Pydantic model)."""
+        return asdict(self)
+
 
 class ModelRegistry:
     """
@@ -44,7 +51,7 @@ class ModelRegistry:
     """
 
     # Script Generation Models (Claude, Llama, etc. via Replicate)
-    SCRIPT_MODELS: Dict[str, ModelConfig] = {
+    SCRIPT_MODELS: Mapping[str, ModelConfig] = MappingProxyType({
         "claude-3.5-sonnet": ModelConfig(
             model_id="anthropic/claude-3.5-sonnet",
             display_name="Claude 3.5 Sonnet",
@@ -78,10 +85,10 @@ class ModelRegistry:
             cost_per_run=0.01,
             avg_duration=4.0
         ),
-    }
+    })
 
     # Voiceover/TTS Models (via Replicate)
-    VOICEOVER_MODELS: Dict[str, ModelConfig] = {
+    VOICEOVER_MODELS: Mapping[str, ModelConfig] = MappingProxyType({
         "xtts-v2": ModelConfig(
             model_id="cjwbw/xtts-v2",
             display_name="XTTS v2",
@@ -114,10 +121,10 @@ class ModelRegistry:
             cost_per_run=0.0002,
             avg_duration=2.5
         ),
-    }
+    })
 
     # Video Scene Generation Models (via Replicate)
-    VIDEO_MODELS: Dict[str, ModelConfig] = {
+    VIDEO_MODELS: Mapping[str, ModelConfig] = MappingProxyType({
         "minimax-video-01": ModelConfig(
             model_id="minimax",
             display_name="Minimax Video-01 (Kling)",
@@ -162,10 +169,10 @@ class ModelRegistry:
             cost_per_run=0.03,
             avg_duration=45.0
         ),
-    }
+    })
 
     # CTA Image Generation Models (via Replicate)
-    CTA_IMAGE_MODELS: Dict[str, ModelConfig] = {
+    CTA_IMAGE_MODELS: Mapping[str, ModelConfig] = MappingProxyType({
         "flux-schnell": ModelConfig(
             model_id="black-forest-labs/flux-schnell",
             display_name="FLUX.1 Schnell",
@@ -201,7 +208,15 @@ class ModelRegistry:
             cost_per_run=0.004,
             avg_duration=6.0
         ),
-    }
+    })
+
+    # Model registry for each task, built once rather than per lookup
+    _REGISTRY_MAP: Mapping[ModelTask, Mapping[str, ModelConfig]] = MappingProxyType({
+        ModelTask.SCRIPT_GENERATION: SCRIPT_MODELS,
+        ModelTask.VOICEOVER: VOICEOVER_MODELS,
+        ModelTask.VIDEO_SCENE: VIDEO_MODELS,
+        ModelTask.CTA_IMAGE: CTA_IMAGE_MODELS,
+    })
 
     # Default models for each task
     DEFAULT_MODELS: Dict[ModelTask, str] = {
@@ -226,22 +241,39 @@ class ModelRegistry:
         Raises:
             ValueError: If model not found
         """
+        # Use default if no specific model requested
+        if model_name is None:
+            model_name = cls.DEFAULT_MODELS.get(task)
+            if model_name is None:
+                raise ValueError(f"Unknown task type: {task}")
+
+        model_config = cls._resolve(task, model_name)
+
+        logger.debug(
+            "model_selected",
+            task=task.value,
+            model_name=model_name,
+            model_id=model_config.model_id,
+            cost=model_config.cost_per_run
+        )
+
+        return model_config
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _resolve(task: ModelTask, model_name: str) -> ModelConfig:
+        """
+        Look up a model config, memoized per (task, model_name).
+
+        Safe to cache because the tables are read-only and ModelConfig is
+        frozen. Failed lookups raise and so are never cached, which keeps
+        the cache bounded by the number of registered models.
+        """
         # Get the appropriate model registry
-        registry_map = {
-            ModelTask.SCRIPT_GENERATION: cls.SCRIPT_MODELS,
-            ModelTask.VOICEOVER: cls.VOICEOVER_MODELS,
-            ModelTask.VIDEO_SCENE: cls.VIDEO_MODELS,
-            ModelTask.CTA_IMAGE: cls.CTA_IMAGE_MODELS,
-        }
-
-        registry = registry_map.get(task)
+        registry = ModelRegistry._REGISTRY_MAP.get(task)
         if not registry:
             raise ValueError(f"Unknown task type: {task}")
 
-        # Use default if no specific model requested
-        if model_name is None:
-            model_name = cls.DEFAULT_MODELS[task]
-
         # Get model config
         model_config = registry.get(model_name)
         if not model_config:
@@ -251,18 +283,10 @@ class ModelRegistry:
                 f"Available models: {available}"
             )
 
-        logger.info(
-            "model_selected",
-            task=task.value,
-            model_name=model_name,
-            model_id=model_config.model_id,
-            cost=model_config.cost_per_run
-        )
-
         return model_config
 
     @classmethod
-    def list_models(cls, task: ModelTask) -> Dict[str, ModelConfig]:
+    def list_models(cls, task: ModelTask) -> Mapping[str, ModelConfig]:
         """
         List all available models for a task.
 
@@ -270,16 +294,9 @@ class ModelRegistry:
             task: The AI task type
 
         Returns:
-            Dictionary of model name -> ModelConfig
+            Read-only mapping of model name -> ModelConfig
         """
-        registry_map = {
-            ModelTask.SCRIPT_GENERATION: cls.SCRIPT_MODELS,
-            ModelTask.VOICEOVER: cls.VOICEOVER_MODELS,
-            ModelTask.VIDEO_SCENE: cls.VIDEO_MODELS,
-            ModelTask.CTA_IMAGE: cls.CTA_IMAGE_MODELS,
-        }
-
-        return registry_map.get(task, {})
+        return cls._REGISTRY_MAP.get(task, MappingProxyType({}))
 
     @classmethod
     def get_default_model_name(cls, task: ModelTask) -> str:
@@ -433,16 +433,20 @@ class ReplicateClient:
             save_path = Path(save_path)
             save_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Download file
+            # Stream the response to disk chunk by chunk; output.read() would
+            # hold the whole file in memory (twice, while httpx joins chunks)
+            size_bytes = 0
             with open(save_path, "wb") as file:
-                file.write(output.read())
+                for chunk in output:
+                    file.write(chunk)
+                    size_bytes += len(chunk)
 
             absolute_path = str(save_path.absolute())
 
             self.logger.info(
                 "output_downloaded",
                 path=absolute_path,
-                size_bytes=save_path.stat().st_size,
+                size_bytes=size_bytes,
             )
 
             return absolute_path
@@ -7,6 +7,8 @@ Uses existing Terraform-configured S3 bucket.
 
 import boto3
 import os
+import time
+from functools import lru_cache
 from botocore.exceptions import ClientError
 from typing import Optional, BinaryIO
 from pathlib import Path
@@ -15,6 +17,9 @@ from config import settings
 
 logger = structlog.get_logger()
 
+# Max distinct (key, expiry, window) entries kept in the presigned URL cache
+PRESIGNED_URL_CACHE_SIZE = 4096
+
 
 class S3StorageService:
     """
@@ -31,6 +36,10 @@ class S3StorageService:
         )
         self.bucket_name = settings.STORAGE_BUCKET
 
+        # Presigning is pure CPU and the same key is signed on every project
+        # fetch; cache per instance so repeat calls within a window are free
+        self._presign_cached = lru_cache(maxsize=PRESIGNED_URL_CACHE_SIZE)(self._presign)
+
         logger.info(
             "s3_storage_initialized",
             bucket=self.bucket_name,
@@ -124,6 +133,9 @@ class S3StorageService:
         """
         Generate presigned URL for S3 object.
 
+        URLs are cached per (key, expiry) for half of the expiry period, so a
+        returned URL always has at least expiry/2 seconds of validity left.
+
         Args:
             s3_key: S3 object key
             expiry: URL expiration in seconds (default: from settings)
@@ -137,6 +149,21 @@ class S3StorageService:
         if expiry is None:
             expiry = settings.PRESIGNED_URL_EXPIRY
 
+        window = int(time.time()) // max(expiry // 2, 1)
+        return self._presign_cached(s3_key, expiry, window)
+
+    def _presign(self, s3_key: str, expiry: int, window: int) -> str:
+        """
+        Sign a GET URL (uncached; window only partitions the cache).
+
+        Args:
+            s3_key: S3 object key
+            expiry: URL expiration in seconds
+            window: Cache window index from generate_presigned_url
+
+        Returns:
+            Presigned URL string
+        """
         try:
             url = self.s3_client.generate_presigned_url(
                 'get_object',
@@ -164,6 +191,66 @@ class S3StorageService:
             )
             raise Exception(f"Failed to generate presigned URL: {e}")
 
+    def generate_presigned_post(
+        self,
+        s3_key: str,
+        content_type: str,
+        max_size: int = None,
+        expiry: int = None
+    ) -> dict:
+        """
+        Generate presigned POST data so a client can upload directly to S3.
+
+        The upload is locked to the given key and content type, and
+        optionally to a maximum size, so the file bytes never pass through
+        the API server.
+
+        Args:
+            s3_key: S3 object key the client may upload to
+            content_type: Required Content-Type of the upload
+            max_size: Optional maximum upload size in bytes
+            expiry: Expiration in seconds (default: from settings)
+
+        Returns:
+            Dict with "url" and form "fields" to POST alongside the file
+
+        Raises:
+            Exception if generation fails
+        """
+        if expiry is None:
+            expiry = settings.PRESIGNED_URL_EXPIRY
+
+        conditions = [{"Content-Type": content_type}]
+        if max_size:
+            conditions.append(["content-length-range", 1, max_size])
+
+        try:
+            post = self.s3_client.generate_presigned_post(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                Fields={"Content-Type": content_type},
+                Conditions=conditions,
+                ExpiresIn=expiry
+            )
+
+            logger.info(
+                "s3_presigned_post_generated",
+                s3_key=s3_key,
+                content_type=content_type,
+                expiry_seconds=expiry
+            )
+
+            return post
+
+        except ClientError as e:
+            logger.error(
+                "s3_presigned_post_failed",
+                s3_key=s3_key,
+                error=str(e),
+                exc_info=True
+            )
+            raise Exception(f"Failed to generate presigned POST: {e}")
+
     def file_exists(self, s3_key: str) -> bool:
         """
         Check if file exists in S3.
@@ -12,6 +12,7 @@ Usage:
 
 import os
 import logging
+import mimetypes
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from pathlib import Path
@@ -23,6 +24,42 @@ from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+# Part size for multipart transfers of large objects (final videos)
+MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+
+# S3 DeleteObjects accepts at most this many keys per request
+S3_DELETE_BATCH_SIZE = 1000
+
+# Content types for the extensions job assets use, resolved once at import.
+# The platform mimetypes table misses some of them (e.g. .webp on older Pythons).
+_CONTENT_TYPE_FALLBACKS = {
+    ".mp4": "video/mp4",
+    ".mov": "video/quicktime",
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+    ".m4a": "audio/mp4",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".json": "application/json",
+    ".txt": "text/plain",
+    ".md": "text/markdown",
+}
+CONTENT_TYPES = {
+    ext: mimetypes.types_map.get(ext) or fallback
+    for ext, fallback in _CONTENT_TYPE_FALLBACKS.items()
+}
+
+
+def guess_content_type(path: str) -> str:
+    """Return the MIME type for a file path, defaulting to application/octet-stream."""
+    ext = os.path.splitext(path)[1].lower()
+    content_type = CONTENT_TYPES.get(ext)
+    if content_type is None:
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    return content_type
+
 
 class StorageBackend(ABC):
     """
@@ -50,6 +87,53 @@ class StorageBackend(ABC):
         """
         pass
     
+    @abstractmethod
+    async def put_file(self, local_path: str, cloud_path: str) -> None:
+        """
+        Upload file from local filesystem without building an access URL.
+        
+        Use together with get_urls() when uploading many files, so URL
+        generation can be batched instead of done once per upload.
+        
+        Args:
+            local_path: Path to local file
+            cloud_path: Destination path in cloud (e.g., "videos/job-123/final.mp4")
+            
+        Raises:
+            FileNotFoundError: If local file doesn't exist
+            Exception: If upload fails
+        """
+        pass
+    
+    async def put_large_file(self, local_path: str, cloud_path: str) -> None:
+        """
+        Upload a large file, splitting it into parts sent concurrently.
+        
+        Backends without parallel part uploads fall back to put_file().
+        
+        Args:
+            local_path: Path to local file
+            cloud_path: Destination path in cloud (e.g., "videos/job-123/final/video.mp4")
+            
+        Raises:
+            FileNotFoundError: If local file doesn't exist
+            Exception: If upload fails
+        """
+        await self.put_file(local_path, cloud_path)
+    
+    @abstractmethod
+    async def get_urls(self, cloud_paths: List[str]) -> List[str]:
+        """
+        Build access URLs for several files in one call.
+        
+        Args:
+            cloud_paths: Paths in cloud storage
+            
+        Returns:
+            URLs in the same order as cloud_paths
+        """
+        pass
+    
     @abstractmethod
     async def upload_bytes(self, data: bytes, cloud_path: str, content_type: str = "application/octet-stream") -> str:
         """
@@ -86,6 +170,42 @@ class StorageBackend(ABC):
         """
         pass
     
+    async def download_large_file(self, cloud_path: str, local_path: str) -> str:
+        """
+        Download a large file using concurrent ranged reads.
+        
+        Backends without ranged parallel downloads fall back to download_file().
+        
+        Args:
+            cloud_path: Path in cloud storage
+            local_path: Destination path on local filesystem
+            
+        Returns:
+            Local file path where file was saved
+            
+        Raises:
+            FileNotFoundError: If cloud file doesn't exist
+            Exception: If download fails
+        """
+        return await self.download_file(cloud_path, local_path)
+    
+    @abstractmethod
+    async def download_bytes(self, cloud_path: str) -> bytes:
+        """
+        Download file contents from cloud storage into memory (no temp file needed).
+        
+        Args:
+            cloud_path: Path in cloud storage
+            
+        Returns:
+            File contents
+            
+        Raises:
+            FileNotFoundError: If cloud file doesn't exist
+            Exception: If download fails
+        """
+        pass
+    
     @abstractmethod
     async def copy_file(self, src_path: str, dest_path: str) -> str:
         """
@@ -106,6 +226,19 @@ class StorageBackend(ABC):
         """
         pass
     
+    async def get_etag(self, cloud_path: str) -> Optional[str]:
+        """
+        Get the S3-style ETag of a file, used to skip re-uploading unchanged files.
+        
+        Args:
+            cloud_path: Path in cloud storage
+            
+        Returns:
+            ETag without quotes, or None if the file doesn't exist or the
+            backend doesn't provide comparable ETags
+        """
+        return None
+    
     @abstractmethod
     async def exists(self, cloud_path: str) -> bool:
         """
@@ -132,6 +265,20 @@ class StorageBackend(ABC):
         """
         pass
     
+    async def delete_files(self, cloud_paths: List[str]) -> None:
+        """
+        Delete several files from cloud storage.
+        
+        Backends without a bulk delete call issue one delete per file.
+        
+        Args:
+            cloud_paths: Paths in cloud storage
+            
+        Raises:
+            Exception: If a delete fails
+        """
+        await asyncio.gather(*(self.delete_file(p) for p in cloud_paths))
+    
     @abstractmethod
     async def list_files(self, prefix: str) -> List[str]:
         """
@@ -186,8 +333,8 @@ class FirebaseStorageBackend(StorageBackend):
         """Get public URL for a file."""
         return f"https://storage.googleapis.com/{self.bucket}/{cloud_path}"
     
-    async def upload_file(self, local_path: str, cloud_path: str) -> str:
-        """Upload file to Firebase Storage."""
+    async def put_file(self, local_path: str, cloud_path: str) -> None:
+        """Upload file to Firebase Storage without building a URL."""
         if not os.path.exists(local_path):
             raise FileNotFoundError(f"Local file not found: {local_path}")
         
@@ -200,17 +347,29 @@ class FirebaseStorageBackend(StorageBackend):
             loop = asyncio.get_event_loop()
             await loop.run_in_executor(
                 None,
-                partial(self.fs.put, local_path, full_path)
+                partial(
+                    self.fs.put,
+                    local_path,
+                    full_path,
+                    content_type=guess_content_type(local_path)
+                )
             )
-            
-            url = self._get_public_url(cloud_path)
-            logger.info(f"Upload successful: {url}")
-            return url
-            
         except Exception as e:
             logger.error(f"Upload failed: {e}")
             raise
     
+    async def get_urls(self, cloud_paths: List[str]) -> List[str]:
+        """Public URLs need no signing, so build them inline."""
+        return [self._get_public_url(p) for p in cloud_paths]
+    
+    async def upload_file(self, local_path: str, cloud_path: str) -> str:
+        """Upload file to Firebase Storage."""
+        await self.put_file(local_path, cloud_path)
+        
+        url = self._get_public_url(cloud_path)
+        logger.info(f"Upload successful: {url}")
+        return url
+    
     async def upload_bytes(self, data: bytes, cloud_path: str, content_type: str = "application/octet-stream") -> str:
         """Upload bytes directly to Firebase Storage (no temp file)."""
         from io import BytesIO
@@ -266,6 +425,18 @@ class FirebaseStorageBackend(StorageBackend):
             logger.error(f"Download failed: {e}")
             raise
     
+    async def download_bytes(self, cloud_path: str) -> bytes:
+        """Download file contents from Firebase Storage into memory."""
+        full_path = self._get_full_path(cloud_path)
+        
+        logger.info(f"Reading gs://{full_path}")
+        
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(self.fs.cat_file, full_path)
+        )
+    
     async def copy_file(self, src_path: str, dest_path: str) -> str:
         """Copy file within Firebase Storage."""
         src_full = self._get_full_path(src_path)
@@ -383,12 +554,15 @@ class S3StorageBackend(StorageBackend):
         self.aws_access_key = aws_access_key
         self.aws_secret_key = aws_secret_key
         
-        # Initialize s3fs filesystem for file operations
+        # Initialize s3fs filesystem for file operations; the connection pool
+        # is sized to match the number of concurrent transfers we allow
+        from config import settings
         self.fs = fsspec.filesystem(
             's3',
             key=aws_access_key,
             secret=aws_secret_key,
-            client_kwargs={'region_name': region}
+            client_kwargs={'region_name': region},
+            config_kwargs={'max_pool_connections': settings.S3_MAX_CONCURRENCY}
         )
         
         # Initialize boto3 client for presigned URL generation
@@ -398,6 +572,8 @@ class S3StorageBackend(StorageBackend):
             aws_secret_access_key=aws_secret_key,
             region_name=region
         )
+        # Bind the signer entry point once; it's called for every returned URL
+        self._presign = partial(self.s3_client.generate_presigned_url, 'get_object')
         
         logger.info(f"Initialized S3 storage backend with bucket: {bucket}")
     
@@ -405,6 +581,18 @@ class S3StorageBackend(StorageBackend):
         """Convert cloud path to full S3 path."""
         return f"{self.bucket}/{cloud_path}"
     
+    async def _run_fs_coroutine(self, coro):
+        """
+        Run an s3fs coroutine on fsspec's IO loop and await it from ours.
+        
+        s3fs is natively async (aiobotocore), so this avoids parking a
+        thread-pool worker per transfer: concurrency is bounded by the shared
+        connection pool instead of the default executor size.
+        """
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coro, self.fs.loop)
+        )
+    
     def _get_public_url(self, cloud_path: str) -> str:
         """Get public URL for a file."""
         return f"https://{self.bucket}.s3.{self.region}.amazonaws.com/{cloud_path}"
@@ -424,8 +612,7 @@ class S3StorageBackend(StorageBackend):
             ClientError: If URL generation fails
         """
         try:
-            url = self.s3_client.generate_presigned_url(
-                'get_object',
+            url = self._presign(
                 Params={
                     'Bucket': self.bucket,
                     'Key': cloud_path
@@ -438,8 +625,36 @@ class S3StorageBackend(StorageBackend):
             logger.error(f"Failed to generate presigned URL for {cloud_path}: {e}")
             raise
     
-    async def upload_file(self, local_path: str, cloud_path: str) -> str:
-        """Upload file to S3."""
+    def presign_many(self, cloud_paths: List[str], expiry: int = 3600) -> List[str]:
+        """
+        Generate presigned URLs for several objects.
+        
+        Blocking (one HMAC signature per path); call via get_urls() from async code.
+        
+        Args:
+            cloud_paths: Paths to files in cloud storage
+            expiry: URL expiration time in seconds
+            
+        Returns:
+            Presigned URLs in the same order as cloud_paths
+        """
+        return [self.generate_presigned_url(p, expiry=expiry) for p in cloud_paths]
+    
+    async def get_urls(self, cloud_paths: List[str]) -> List[str]:
+        """Presign a batch of URLs in a worker thread to keep the event loop free."""
+        from config import settings
+        return await asyncio.to_thread(
+            self.presign_many, cloud_paths, settings.PRESIGNED_URL_EXPIRY
+        )
+    
+    async def put_file(self, local_path: str, cloud_path: str) -> None:
+        """
+        Upload file to S3 without presigning.
+        
+        Files large enough for multipart use MULTIPART_CHUNKSIZE parts (not
+        s3fs's 50MB default) so their ETag can be recomputed locally when a
+        persist is resumed.
+        """
         if not os.path.exists(local_path):
             raise FileNotFoundError(f"Local file not found: {local_path}")
         
@@ -448,23 +663,58 @@ class S3StorageBackend(StorageBackend):
         logger.info(f"Uploading {local_path} to s3://{full_path}")
         
         try:
-            # Run blocking I/O in thread pool
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                partial(self.fs.put, local_path, full_path)
+            await self._run_fs_coroutine(
+                self.fs._put_file(
+                    local_path,
+                    full_path,
+                    chunksize=MULTIPART_CHUNKSIZE,
+                    ContentType=guess_content_type(local_path),
+                )
             )
-            
-            # Generate presigned URL for secure, time-limited access
-            from config import settings
-            url = self.generate_presigned_url(cloud_path, expiry=settings.PRESIGNED_URL_EXPIRY)
-            logger.info(f"Upload successful with presigned URL (expires in {settings.PRESIGNED_URL_EXPIRY}s)")
-            return url
-            
         except Exception as e:
             logger.error(f"Upload failed: {e}")
             raise
     
+    async def put_large_file(self, local_path: str, cloud_path: str) -> None:
+        """
+        Upload file to S3 as a multipart upload with concurrent parts.
+        
+        Files of at least two parts go through CreateMultipartUpload, with up
+        to S3_MAX_CONCURRENCY parts in flight so throughput is not capped by
+        a single TCP stream. Smaller files are sent with a single PUT.
+        """
+        if not os.path.exists(local_path):
+            raise FileNotFoundError(f"Local file not found: {local_path}")
+        
+        from config import settings
+        full_path = self._get_full_path(cloud_path)
+        
+        logger.info(f"Uploading {local_path} to s3://{full_path} (multipart)")
+        
+        try:
+            await self._run_fs_coroutine(
+                self.fs._put_file(
+                    local_path,
+                    full_path,
+                    chunksize=MULTIPART_CHUNKSIZE,
+                    max_concurrency=settings.S3_MAX_CONCURRENCY,
+                    ContentType=guess_content_type(local_path),
+                )
+            )
+        except Exception as e:
+            logger.error(f"Multipart upload failed: {e}")
+            raise
+    
+    async def upload_file(self, local_path: str, cloud_path: str) -> str:
+        """Upload file to S3."""
+        await self.put_file(local_path, cloud_path)
+        
+        # Generate presigned URL for secure, time-limited access
+        from config import settings
+        url = self.generate_presigned_url(cloud_path, expiry=settings.PRESIGNED_URL_EXPIRY)
+        logger.info(f"Upload successful with presigned URL (expires in {settings.PRESIGNED_URL_EXPIRY}s)")
+        return url
+    
     async def upload_bytes(self, data: bytes, cloud_path: str, content_type: str = "application/octet-stream") -> str:
         """Upload bytes directly to S3 (no temp file)."""
         from io import BytesIO
@@ -523,6 +773,94 @@ class S3StorageBackend(StorageBackend):
             logger.error(f"Download failed: {e}")
             raise
     
+    async def download_large_file(self, cloud_path: str, local_path: str) -> str:
+        """
+        Download file from S3 with concurrent ranged GETs.
+        
+        Objects of at least two parts are fetched as MULTIPART_CHUNKSIZE byte
+        ranges, up to S3_MAX_CONCURRENCY at a time, each written at its
+        offset in a preallocated file. Smaller objects use a single GET.
+        """
+        full_path = self._get_full_path(cloud_path)
+        
+        logger.info(f"Downloading s3://{full_path} to {local_path} (ranged)")
+        
+        try:
+            Path(local_path).parent.mkdir(parents=True, exist_ok=True)
+            await self._run_fs_coroutine(self._get_ranged(full_path, local_path))
+            
+            logger.info(f"Download successful: {local_path}")
+            return local_path
+            
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Cloud file not found: s3://{full_path}")
+        except Exception as e:
+            logger.error(f"Ranged download failed: {e}")
+            raise
+    
+    async def _get_ranged(self, full_path: str, local_path: str) -> None:
+        """
+        Fetch an object in concurrent byte ranges; runs on fsspec's loop.
+        
+        That loop is shared by every s3fs call in the process, so file I/O
+        goes through worker threads instead of blocking it.
+        """
+        from config import settings
+        size = (await self.fs._info(full_path))["size"]
+        
+        if size < 2 * MULTIPART_CHUNKSIZE:
+            await self.fs._get_file(full_path, local_path)
+            return
+        
+        sem = asyncio.Semaphore(settings.S3_MAX_CONCURRENCY)
+        fd = await asyncio.to_thread(
+            os.open, local_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+        )
+        writes: List[asyncio.Future] = []
+        
+        async def fetch(start: int) -> None:
+            # The write stays under the semaphore so at most
+            # S3_MAX_CONCURRENCY ranges are held in memory. It's shielded:
+            # a thread can't be interrupted, so cancelling only stops waiting,
+            # and the fd must outlive every write already started.
+            async with sem:
+                data = await self.fs._cat_file(
+                    full_path, start=start, end=min(start + MULTIPART_CHUNKSIZE, size)
+                )
+                write = asyncio.ensure_future(asyncio.to_thread(os.pwrite, fd, data, start))
+                writes.append(write)
+                await asyncio.shield(write)
+        
+        try:
+            await asyncio.to_thread(os.ftruncate, fd, size)
+            tasks = [
+                asyncio.ensure_future(fetch(start))
+                for start in range(0, size, MULTIPART_CHUNKSIZE)
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # Stop the remaining ranges before the file is closed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        finally:
+            await asyncio.gather(*writes, return_exceptions=True)
+            await asyncio.to_thread(os.close, fd)
+    
+    async def download_bytes(self, cloud_path: str) -> bytes:
+        """Download file contents from S3 into memory."""
+        full_path = self._get_full_path(cloud_path)
+        
+        logger.info(f"Reading s3://{full_path}")
+        
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(self.fs.cat_file, full_path)
+        )
+    
     async def copy_file(self, src_path: str, dest_path: str) -> str:
         """Copy file within S3."""
         src_full = self._get_full_path(src_path)
@@ -546,6 +884,21 @@ class S3StorageBackend(StorageBackend):
             logger.error(f"Copy failed: {e}")
             raise
     
+    async def get_etag(self, cloud_path: str) -> Optional[str]:
+        """Get an object's ETag with a HEAD request."""
+        full_path = self._get_full_path(cloud_path)
+        
+        try:
+            info = await self._run_fs_coroutine(self.fs._info(full_path))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading ETag: {e}")
+            return None
+        
+        etag = info.get("ETag")
+        return etag.strip('"') if etag else None
+    
     async def exists(self, cloud_path: str) -> bool:
         """Check if file exists in S3."""
         full_path = self._get_full_path(cloud_path)
@@ -579,6 +932,35 @@ class S3StorageBackend(StorageBackend):
             logger.error(f"Delete failed: {e}")
             raise
     
+    async def delete_files(self, cloud_paths: List[str]) -> None:
+        """Delete files from S3 with DeleteObjects, up to 1000 keys per request."""
+        if not cloud_paths:
+            return
+        
+        full_paths = [self._get_full_path(p) for p in cloud_paths]
+        
+        logger.info(f"Deleting {len(full_paths)} objects from s3://{self.bucket}")
+        
+        try:
+            batches = [
+                full_paths[i:i + S3_DELETE_BATCH_SIZE]
+                for i in range(0, len(full_paths), S3_DELETE_BATCH_SIZE)
+            ]
+            deleted = await asyncio.gather(*(
+                self._run_fs_coroutine(self.fs._bulk_delete(batch)) for batch in batches
+            ))
+            deleted_count = sum(len(d) for d in deleted)
+            if deleted_count < len(full_paths):
+                logger.warning(
+                    f"Bulk delete removed {deleted_count} of {len(full_paths)} objects"
+                )
+            else:
+                logger.info(f"Delete successful: {deleted_count} objects")
+            
+        except Exception as e:
+            logger.error(f"Bulk delete failed: {e}")
+            raise
+    
     async def list_files(self, prefix: str) -> List[str]:
         """List files with prefix in S3."""
         full_prefix = self._get_full_path(prefix)
@@ -367,16 +367,14 @@ class TestReplicateBackend:
 
     @patch("mv.video_backends.replicate_backend.replicate.run")
     @patch("mv.video_backends.replicate_backend.settings")
-    @patch("mv.video_backends.replicate_backend.tempfile.NamedTemporaryFile")
-    def test_generate_with_reference_image(self, mock_temp_file, mock_settings, mock_replicate_run):
+    @patch("mv.video_backends.replicate_backend.tempfile.mkstemp")
+    def test_generate_with_reference_image(self, mock_mkstemp, mock_settings, mock_replicate_run):
         """Test video generation with reference image."""
         mock_settings.REPLICATE_API_TOKEN = "test-token"
         mock_settings.REPLICATE_API_KEY = ""
 
         # Mock temp file
-        mock_temp = MagicMock()
-        mock_temp.name = "/tmp/test_image.png"
-        mock_temp_file.return_value = mock_temp
+        mock_mkstemp.return_value = (99, "/tmp/test_image.png")
 
         # Mock file operations
         mock_file_handle = MagicMock()
@@ -393,13 +391,14 @@ class TestReplicateBackend:
 
         with patch("builtins.open", mock_open()):
             with patch("os.path.exists", return_value=True):
-                with patch("os.unlink"):
+                with patch("os.unlink"), patch("os.write") as mock_write, patch("os.close"):
                     video_data = generate_video_replicate(
                         prompt="Test with reference",
                         reference_image_base64=test_image_base64
                     )
 
         assert video_data == b"fake_video_data"
+        mock_write.assert_called_once_with(99, b"test_image_data")
 
 
 class TestGeminiBackend:
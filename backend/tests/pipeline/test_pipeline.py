@@ -275,6 +275,24 @@ async def test_asset_manager_disk_usage():
         await am.cleanup()
 
 
+def test_asset_manager_http_session_closed_per_loop():
+    """Test the shared session can be closed at the end of each short-lived loop."""
+    async def use_session():
+        try:
+            return AssetManager._get_http_session()
+        finally:
+            await AssetManager.close_http_session()
+
+    first = asyncio.run(use_session())
+    second = asyncio.run(use_session())
+
+    assert first is not second
+    assert first.closed and second.closed
+    assert AssetManager._http_session is None
+
+    print("✓ Asset manager closes the download session per loop")
+
+
 # ============================================================================
 # Error Handler Tests
 # ============================================================================
@@ -21,7 +21,7 @@ from pipeline.video_composer import (
     VideoCompositionError,
     create_video_composer
 )
-from pipeline.asset_manager import AssetManager
+from pipeline.asset_manager import FINAL_VIDEO_NAME, AssetManager
 
 
 @pytest.fixture
@@ -418,8 +418,7 @@ class TestVideoComposer:
         )
 
         # Verify result
-        assert result is not None
-        assert "final_video" in result
+        assert result == str(asset_manager.final_dir / FINAL_VIDEO_NAME)
         assert Path(result).exists()
 
         # Verify clips were loaded
@@ -0,0 +1,389 @@
+"""
+Tests for AssetPersistenceService.
+
+Uses an in-memory StorageBackend so no cloud credentials are needed.
+"""
+
+import asyncio
+import hashlib
+import os
+import pytest
+from pathlib import Path
+
+from services.asset_persistence import (
+    AssetPersistenceService,
+    UPLOAD_MANIFEST_NAME,
+    _fast_clone,
+    _file_etag,
+    _index_character_images,
+)
+from services.storage_backend import StorageBackend
+
+
+class InMemoryStorageBackend(StorageBackend):
+    """StorageBackend that keeps objects in a dict and records calls."""
+
+    def __init__(self):
+        self.objects = {}
+        self.listed_prefixes = []
+
+    def _url(self, cloud_path: str) -> str:
+        return f"https://storage.test/{cloud_path}"
+
+    async def put_file(self, local_path: str, cloud_path: str) -> None:
+        self.objects[cloud_path] = Path(local_path).read_bytes()
+
+    async def get_urls(self, cloud_paths: list) -> list:
+        return [self._url(p) for p in cloud_paths]
+
+    async def upload_file(self, local_path: str, cloud_path: str) -> str:
+        await self.put_file(local_path, cloud_path)
+        return self._url(cloud_path)
+
+    async def upload_bytes(self, data: bytes, cloud_path: str, content_type: str = "application/octet-stream") -> str:
+        self.objects[cloud_path] = bytes(data)
+        return self._url(cloud_path)
+
+    async def download_file(self, cloud_path: str, local_path: str) -> str:
+        if cloud_path not in self.objects:
+            raise FileNotFoundError(cloud_path)
+        Path(local_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(local_path).write_bytes(self.objects[cloud_path])
+        return local_path
+
+    async def download_bytes(self, cloud_path: str) -> bytes:
+        if cloud_path not in self.objects:
+            raise FileNotFoundError(cloud_path)
+        return self.objects[cloud_path]
+
+    async def copy_file(self, src_path: str, dest_path: str) -> str:
+        self.objects[dest_path] = self.objects[src_path]
+        return self._url(dest_path)
+
+    async def exists(self, cloud_path: str) -> bool:
+        return cloud_path in self.objects
+
+    async def delete_file(self, cloud_path: str) -> None:
+        del self.objects[cloud_path]
+
+    async def list_files(self, prefix: str) -> list:
+        # Mirror fsspec's ls(): one level deep, subdirectories included
+        self.listed_prefixes.append(prefix)
+        entries = []
+        for key in self.objects:
+            if key.startswith(prefix):
+                head = key[len(prefix):].split("/", 1)[0]
+                entry = f"{prefix}{head}"
+                if entry not in entries:
+                    entries.append(entry)
+        return entries
+
+
+@pytest.fixture
+def storage():
+    return InMemoryStorageBackend()
+
+
+@pytest.fixture
+def service(storage):
+    return AssetPersistenceService(storage_backend=storage)
+
+
+@pytest.mark.asyncio
+async def test_download_job_assets_lists_subdirectories(service, storage, tmp_path):
+    """Test that each asset subdirectory is listed and directory entries are skipped."""
+    storage.objects = {
+        "videos/job-1/final/video.mp4": b"final",
+        "videos/job-1/intermediate/scenes/scene_1.mp4": b"scene",
+        "videos/job-1/intermediate/audio/voice_1.mp3": b"audio",
+        "videos/job-1/intermediate/metadata.json": b"{}",
+    }
+
+    await service.download_job_assets("job-1", str(tmp_path))
+
+    assert (tmp_path / "final" / "video.mp4").read_bytes() == b"final"
+    assert (tmp_path / "scenes" / "scene_1.mp4").read_bytes() == b"scene"
+    assert (tmp_path / "audio" / "voice_1.mp3").read_bytes() == b"audio"
+    assert (tmp_path / "metadata.json").read_bytes() == b"{}"
+    assert "videos/job-1/" not in storage.listed_prefixes
+
+
+@pytest.mark.asyncio
+async def test_download_job_assets_missing_job(service, tmp_path):
+    """Test that a job with no assets raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        await service.download_job_assets("missing", str(tmp_path))
+
+
+@pytest.mark.asyncio
+async def test_cleanup_old_backups_only_lists_final(service, storage):
+    """Test that cleanup only lists the final/ prefix and keeps the newest backup."""
+    storage.objects = {
+        "videos/job-1/final/video.mp4": b"current",
+        "videos/job-1/final/video_v1.mp4": b"old",
+        "videos/job-1/final/video_v2.mp4": b"newer",
+        "videos/job-1/intermediate/scenes/scene_1.mp4": b"scene",
+    }
+
+    await service.cleanup_old_backups("job-1")
+
+    assert storage.listed_prefixes == ["videos/job-1/final/"]
+    assert "videos/job-1/final/video_v2.mp4" in storage.objects
+    assert "videos/job-1/final/video_v1.mp4" not in storage.objects
+
+
+@pytest.mark.asyncio
+async def test_upload_directory_preserves_order_with_bounded_concurrency(service, storage, tmp_path):
+    """Test that bounded uploads return URLs in file order regardless of completion order."""
+    in_flight = 0
+    peak = 0
+    original_put = storage.put_file
+
+    async def slow_put(local_path, cloud_path):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Earlier files finish last
+        await asyncio.sleep(0.01 * (10 - int(Path(local_path).stem.split("_")[1])))
+        in_flight -= 1
+        return await original_put(local_path, cloud_path)
+
+    storage.put_file = slow_put
+    service._transfer_sem = asyncio.Semaphore(3)
+
+    scenes_dir = tmp_path / "scenes"
+    scenes_dir.mkdir()
+    for i in range(8):
+        (scenes_dir / f"scene_{i}.mp4").write_bytes(b"x")
+
+    urls = await service._upload_directory("job-1", scenes_dir, "intermediate/scenes")
+
+    files = [f.name for f in scenes_dir.iterdir()]
+    assert peak <= 3
+    assert urls == [f"https://storage.test/videos/job-1/intermediate/scenes/{name}" for name in files]
+
+
+@pytest.mark.asyncio
+async def test_upload_directory_sign_lazy_returns_paths(service, tmp_path):
+    """Test that sign_lazy skips URL generation and returns cloud paths."""
+    final_dir = tmp_path / "final"
+    final_dir.mkdir()
+    (final_dir / "video.mp4").write_bytes(b"x")
+
+    result = await service._upload_directory("job-1", final_dir, "final", single_file=True, sign_lazy=True)
+
+    assert result == "videos/job-1/final/video.mp4"
+
+
+@pytest.mark.asyncio
+async def test_persist_job_assets_returns_cloud_paths(service, storage, tmp_path):
+    """Test that persisting returns cloud paths and URLs are built on demand."""
+    (tmp_path / "final").mkdir()
+    (tmp_path / "final" / "video.mp4").write_bytes(b"final")
+    (tmp_path / "scenes").mkdir()
+    (tmp_path / "scenes" / "scene_1.mp4").write_bytes(b"scene")
+    (tmp_path / "metadata.json").write_text("{}")
+
+    result = await service.persist_job_assets("job-1", str(tmp_path))
+
+    assert result["final_video"] == "videos/job-1/final/video.mp4"
+    assert result["scenes"] == ["videos/job-1/intermediate/scenes/scene_1.mp4"]
+    assert result["metadata"] == "videos/job-1/intermediate/metadata.json"
+    assert result["script"] is None
+    assert storage.objects["videos/job-1/final/video.mp4"] == b"final"
+
+    url = await service.presign(result["final_video"])
+    assert url == "https://storage.test/videos/job-1/final/video.mp4"
+
+
+@pytest.mark.asyncio
+async def test_presign_job_assets_handles_paths_and_legacy_urls(service):
+    """Test that stored cloud paths are presigned and stored URLs pass through."""
+    presigned = await service.presign_job_assets({
+        "final_video": "videos/job-1/final/video.mp4",
+        "scenes": ["videos/job-1/intermediate/scenes/scene_1.mp4", "https://old/scene_2.mp4"],
+        "metadata": None,
+        "final_video_url": "https://signed/video.mp4",
+    })
+
+    assert presigned == {
+        "final_video": "https://storage.test/videos/job-1/final/video.mp4",
+        "scenes": ["https://storage.test/videos/job-1/intermediate/scenes/scene_1.mp4", "https://old/scene_2.mp4"],
+        "metadata": None,
+        "final_video_url": "https://signed/video.mp4",
+    }
+    assert await service.presign_job_assets(None) is None
+
+
+def test_fast_clone_copies_content_and_replaces_existing(tmp_path):
+    """Test that _fast_clone produces an identical file and overwrites the destination."""
+    src = tmp_path / "src.png"
+    src.write_bytes(b"image-bytes")
+    dst = tmp_path / "job" / "dst.png"
+    dst.parent.mkdir()
+    dst.write_bytes(b"stale")
+
+    _fast_clone(src, dst)
+
+    assert dst.read_bytes() == b"image-bytes"
+
+
+def test_index_character_images_prefers_extension_order(tmp_path):
+    """Test that one scan maps image ids to files, preferring .png over .jpg."""
+    (tmp_path / "abc.jpg").write_bytes(b"jpg")
+    (tmp_path / "abc.png").write_bytes(b"png")
+    (tmp_path / "def.webp").write_bytes(b"webp")
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    index = _index_character_images(tmp_path)
+
+    assert index == {"abc": tmp_path / "abc.png", "def": tmp_path / "def.webp"}
+    assert _index_character_images(tmp_path / "missing") == {}
+
+
+@pytest.mark.asyncio
+async def test_metadata_round_trip_in_memory(service, storage, tmp_path):
+    """Test that metadata is written and read back without temp files."""
+    local_copy = tmp_path / "metadata.json"
+
+    assert await service.get_asset_metadata("job-1") is None
+
+    await service.update_metadata("job-1", {"version": 2, "scenes": [1, 2]}, local_path=str(local_copy))
+
+    assert await service.get_asset_metadata("job-1") == {"version": 2, "scenes": [1, 2]}
+    assert local_copy.read_bytes() == storage.objects["videos/job-1/intermediate/metadata.json"]
+
+
+@pytest.mark.asyncio
+async def test_persist_job_assets_missing_directory(service, tmp_path):
+    """Test that a missing job directory raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError, match="Job directory not found"):
+        await service.persist_job_assets("job-1", str(tmp_path / "missing"))
+
+
+@pytest.mark.asyncio
+async def test_get_character_reference_url_discovers_extension(service, storage):
+    """Test that the image extension is discovered when not given."""
+    storage.objects = {
+        "character_references/abc.jpg": b"jpg",
+        "videos/job-1/intermediate/character_reference/abc.webp": b"webp",
+    }
+
+    assert await service.get_character_reference_url("abc") == "https://storage.test/character_references/abc.jpg"
+    assert await service.get_character_reference_url("abc", job_id="job-1") == (
+        "https://storage.test/videos/job-1/intermediate/character_reference/abc.webp"
+    )
+    assert await service.get_character_reference_url("abc", extension="png") is None
+
+
+@pytest.mark.asyncio
+async def test_associate_cloud_only_image_copies_server_side(service, storage):
+    """Test that an image uploaded straight to cloud storage is copied into the job."""
+    storage.objects = {"character_references/abc.webp": b"webp"}
+
+    cloud_path = await service._associate_cloud_only_image("job-1", "abc")
+
+    assert cloud_path == "videos/job-1/intermediate/character_reference/abc.webp"
+    assert storage.objects[cloud_path] == b"webp"
+    assert await service._associate_cloud_only_image("job-1", "missing") is None
+
+
+@pytest.mark.asyncio
+async def test_backup_final_video_skips_listing_for_canonical_name(service, storage):
+    """Test that video.mp4 is found with a HEAD and other names fall back to listing."""
+    storage.objects = {"videos/job-1/final/video.mp4": b"current"}
+
+    await service.backup_final_video("job-1")
+
+    assert storage.listed_prefixes == []
+    assert storage.objects["videos/job-1/final/video_v1.mp4"] == b"current"
+
+    storage.objects = {"videos/job-2/final/final_video.mp4": b"legacy"}
+
+    await service.backup_final_video("job-2")
+
+    assert storage.listed_prefixes == ["videos/job-2/final/"]
+    assert storage.objects["videos/job-2/final/final_video_v1.mp4"] == b"legacy"
+
+
+@pytest.mark.asyncio
+async def test_persist_job_assets_resumes_from_manifest(service, storage, tmp_path):
+    """Test that a retried persist only uploads files changed since the last run."""
+    (tmp_path / "scenes").mkdir()
+    for i in range(3):
+        (tmp_path / "scenes" / f"scene_{i}.mp4").write_bytes(b"scene")
+    uploaded = []
+    original_put = storage.put_file
+
+    async def recording_put(local_path, cloud_path):
+        uploaded.append(cloud_path)
+        await original_put(local_path, cloud_path)
+
+    storage.put_file = recording_put
+
+    await service.persist_job_assets("job-1", str(tmp_path))
+    assert len(uploaded) == 3
+    assert (tmp_path / UPLOAD_MANIFEST_NAME).exists()
+
+    uploaded.clear()
+    changed = tmp_path / "scenes" / "scene_1.mp4"
+    changed.write_bytes(b"new scene")
+    os.utime(changed, ns=(0, 0))
+
+    await service.persist_job_assets("job-1", str(tmp_path))
+    assert uploaded == ["videos/job-1/intermediate/scenes/scene_1.mp4"]
+
+
+@pytest.mark.asyncio
+async def test_persist_job_assets_checks_etags_only_when_resuming(service, storage, tmp_path):
+    """Test that a first run does no ETag lookups and a resumed run only for changed files."""
+    (tmp_path / "scenes").mkdir()
+    for i in range(20):
+        (tmp_path / "scenes" / f"scene_{i}.mp4").write_bytes(b"scene")
+    etag_lookups = []
+
+    async def recording_get_etag(cloud_path):
+        etag_lookups.append(cloud_path)
+        return None
+
+    storage.get_etag = recording_get_etag
+
+    await service.persist_job_assets("job-1", str(tmp_path))
+    assert etag_lookups == []
+
+    changed = tmp_path / "scenes" / "scene_3.mp4"
+    changed.write_bytes(b"new scene")
+    os.utime(changed, ns=(0, 0))
+
+    await service.persist_job_assets("job-1", str(tmp_path))
+    assert etag_lookups == ["videos/job-1/intermediate/scenes/scene_3.mp4"]
+
+
+def test_file_etag_matches_s3_format(tmp_path, monkeypatch):
+    """Test single-part and multipart ETag computation."""
+    monkeypatch.setattr("services.asset_persistence.MULTIPART_CHUNKSIZE", 4)
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"abcdefghij")
+
+    assert _file_etag(str(path), "0" * 32) == hashlib.md5(b"abcdefghij").hexdigest()
+
+    parts = b"".join(hashlib.md5(p).digest() for p in (b"abcd", b"efgh", b"ij"))
+    assert _file_etag(str(path), "x-3") == f"{hashlib.md5(parts).hexdigest()}-3"
+
+
+@pytest.mark.asyncio
+async def test_upload_directory_propagates_upload_failure(service, storage, tmp_path):
+    """Test that a failed upload stops the scan/upload pipeline and re-raises."""
+    async def failing_put(local_path, cloud_path):
+        raise RuntimeError("upload failed")
+
+    storage.put_file = failing_put
+    scenes_dir = tmp_path / "scenes"
+    scenes_dir.mkdir()
+    for i in range(100):
+        (scenes_dir / f"scene_{i}.mp4").write_bytes(b"x")
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        await asyncio.wait_for(
+            service._upload_directory("job-1", scenes_dir, "intermediate/scenes"), timeout=5
+        )
@@ -0,0 +1,354 @@
+"""
+Tests for AudioDownloader.
+
+yt-dlp extraction is patched out, so no network access is needed.
+"""
+
+import asyncio
+import threading
+import pytest
+import yt_dlp
+from unittest.mock import patch
+
+from services.audio_downloader import (
+    AudioDownloader,
+    AudioDownloadError,
+    AudioInfo,
+    _canonicalize_url,
+    _detect_aac_encoder,
+)
+
+
+@pytest.fixture
+def downloader():
+    return AudioDownloader()
+
+
+class TestCanonicalizeUrl:
+    """Test cases for _canonicalize_url()."""
+
+    @pytest.mark.parametrize("url", [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&si=abc&pp=xyz&t=42",
+        "https://m.youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ?si=abc",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+        "https://www.youtube-nocookie.com/embed/dQw4w9WgXcQ",
+    ])
+    def test_youtube_variants_normalize_to_watch_url(self, url):
+        """Test that tracker and alternate-form URLs map to one watch URL."""
+        assert _canonicalize_url(url) == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+    def test_other_urls_unchanged(self):
+        """Test that non-YouTube URLs pass through."""
+        url = "https://example.com/audio?v=dQw4w9WgXcQ"
+        assert _canonicalize_url(url) == url
+
+
+class TestDetectAacEncoder:
+    """Test cases for _detect_aac_encoder()."""
+
+    @pytest.mark.parametrize("encoders, expected", [
+        (" A..... aac   AAC\n A..... libfdk_aac   Fraunhofer FDK AAC\n", "libfdk_aac"),
+        (" A..... aac   AAC\n A..... libmp3lame   MP3\n", "aac"),
+    ])
+    def test_prefers_libfdk_aac_when_built_in(self, encoders, expected):
+        """Test that libfdk_aac is used only when FFmpeg lists it."""
+        _detect_aac_encoder.cache_clear()
+        with patch("services.audio_downloader.subprocess.run") as run:
+            run.return_value.stdout = encoders
+            assert _detect_aac_encoder("/usr/bin/ffmpeg") == expected
+        _detect_aac_encoder.cache_clear()
+
+
+class TestGetAudioInfoCache:
+    """Test cases for the get_audio_info metadata cache."""
+
+    @pytest.mark.asyncio
+    async def test_same_video_different_urls_hits_cache(self, downloader):
+        """Test that URL variants of one video share a cache entry."""
+        calls = []
+
+        def fake_extract(url):
+            calls.append(url)
+            return AudioInfo(title="Song", duration=180)
+
+        with patch.object(downloader, "_extract_info", side_effect=fake_extract):
+            first = await downloader.get_audio_info("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+            second = await downloader.get_audio_info("https://youtu.be/dQw4w9WgXcQ?si=abc")
+
+        assert first == second == AudioInfo(title="Song", duration=180)
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_extraction(self, downloader):
+        """Test that concurrent lookups of one video run a single extraction."""
+        calls = []
+
+        def fake_extract(url):
+            calls.append(url)
+            return AudioInfo(title="Song")
+
+        with patch.object(downloader, "_extract_info", side_effect=fake_extract):
+            results = await asyncio.gather(*(
+                downloader.get_audio_info("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+                for _ in range(5)
+            ))
+
+        assert all(r == AudioInfo(title="Song") for r in results)
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_first_caller_does_not_cancel_others(self, downloader):
+        """Test that cancelling the caller that started an extraction leaves other waiters unaffected."""
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        started = threading.Event()
+        release = threading.Event()
+
+        def fake_extract(url):
+            started.set()
+            release.wait(5)
+            return AudioInfo(title="Song")
+
+        with patch.object(downloader, "_extract_info", side_effect=fake_extract):
+            first = asyncio.ensure_future(downloader.get_audio_info(url))
+            await asyncio.to_thread(started.wait, 5)
+            second = asyncio.ensure_future(downloader.get_audio_info(url))
+            await asyncio.sleep(0)
+
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            release.set()
+
+            assert await second == AudioInfo(title="Song")
+
+        assert not downloader._info_inflight
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, downloader):
+        """Test that a failed extraction is retried on the next call."""
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+        with patch.object(downloader, "_extract_info", side_effect=RuntimeError("boom")):
+            with pytest.raises(AudioDownloadError):
+                await downloader.get_audio_info(url)
+
+        with patch.object(downloader, "_extract_info", return_value=AudioInfo(title="Song")):
+            assert (await downloader.get_audio_info(url)).to_dict()["title"] == "Song"
+
+
+class TestPrefetchedInfo:
+    """Test cases for reusing get_audio_info extractions in download_audio."""
+
+    @pytest.mark.asyncio
+    async def test_download_after_info_skips_extraction(self, downloader, tmp_path):
+        """Test that a download right after an info lookup processes the stored info dict."""
+        raw = {'id': 'dQw4w9WgXcQ', 'title': 'Song', 'duration': 180}
+
+        def fake_process(info, download=True):
+            assert info is raw and download
+            return {**info, 'requested_downloads': [{}]}
+
+        with patch.object(yt_dlp.YoutubeDL, "extract_info", return_value=raw) as extract, \
+                patch.object(yt_dlp.YoutubeDL, "process_ie_result", side_effect=fake_process) as process:
+            await downloader.get_audio_info("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+            with pytest.raises(AudioDownloadError):
+                # Nothing is written by the fake, so the file lookup fails
+                await downloader.download_audio(
+                    "https://youtu.be/dQw4w9WgXcQ", str(tmp_path)
+                )
+
+        assert extract.call_count == 1
+        assert process.call_count == 1
+        assert downloader._take_prefetched_info("dQw4w9WgXcQ") is None
+
+
+class TestDownloadMany:
+    """Test cases for batch downloads."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_order_and_capture_failures(self):
+        """Test that results follow URL order and failed downloads are returned."""
+        downloader = AudioDownloader(max_concurrent_downloads=2, max_concurrent_encodes=1)
+        in_flight = 0
+        peak = 0
+
+        async def fake_download(url, output_path, audio_quality):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if url == "bad":
+                raise AudioDownloadError("failed")
+            return {"url": url}
+
+        with patch.object(downloader, "download_audio", side_effect=fake_download):
+            results = await downloader.download_many(["a", "bad", "c", "d"], "/tmp/audio")
+
+        assert results[0] == {"url": "a"}
+        assert isinstance(results[1], AudioDownloadError)
+        assert results[2:] == [{"url": "c"}, {"url": "d"}]
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_encode_does_not_hold_a_download_slot(self, tmp_path):
+        """Test that the next download starts while an earlier file is encoding."""
+        downloader = AudioDownloader(max_concurrent_downloads=1, max_concurrent_encodes=1)
+        downloader.ffmpeg_available = True
+        downloader._ffmpeg_exe = "ffmpeg"
+        second_downloaded = threading.Event()
+
+        def fake_download(url, ydl_opts, on_metadata=None, prefetched=None):
+            path = ydl_opts['outtmpl'].replace('%(ext)s', 'webm')
+            with open(path, "wb") as f:
+                f.write(b"webm")
+            if url.endswith("abcdefghijk"):
+                second_downloaded.set()
+            return {'filepath': path, 'title': 'Song'}
+
+        class FakeProcess:
+            returncode = 0
+
+            async def communicate(self):
+                return None, b""
+
+        async def fake_exec(*argv, **kwargs):
+            # Blocks until the other download has run in the single download slot
+            assert await asyncio.to_thread(second_downloaded.wait, 5)
+            with open(argv[-1], "wb") as f:
+                f.write(b"mp3")
+            return FakeProcess()
+
+        with patch.object(downloader, "_download_with_ytdlp", side_effect=fake_download), \
+                patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+            results = await downloader.download_many([
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                "https://www.youtube.com/watch?v=abcdefghijk",
+            ], str(tmp_path))
+
+        assert [r.format for r in results] == ["mp3", "mp3"]
+        assert all(r.metadata.converted_to_mp3 for r in results)
+        assert not list(tmp_path.glob("*.webm"))
+
+
+class TestDownloadCache:
+    """Test cases for the on-disk download cache."""
+
+    @pytest.mark.asyncio
+    async def test_second_download_of_same_video_is_served_from_disk(self, downloader, tmp_path):
+        """Test that a repeated download returns the cached file without yt-dlp."""
+        calls = []
+
+        def fake_download(url, ydl_opts, on_metadata=None, prefetched=None):
+            calls.append(url)
+            path = ydl_opts['outtmpl'].replace('%(ext)s', 'mp3')
+            with open(path, "wb") as f:
+                f.write(b"mp3")
+            return {'filepath': path, 'title': 'Song', 'duration': 180}
+
+        with patch.object(downloader, "_download_with_ytdlp", side_effect=fake_download):
+            first = await downloader.download_audio(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ", str(tmp_path)
+            )
+            second = await downloader.download_audio(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42", str(tmp_path)
+            )
+
+        assert len(calls) == 1
+        assert first == second
+        assert first.filename == "dQw4w9WgXcQ_192.mp3"
+        assert (tmp_path / "dQw4w9WgXcQ_192.mp3").read_bytes() == b"mp3"
+
+
+    @pytest.mark.asyncio
+    async def test_m4a_source_is_kept_without_encoding(self, downloader, tmp_path):
+        """Test that M4A output prefers an AAC stream and skips FFmpeg for it."""
+        downloader.ffmpeg_available = True
+        downloader._ffmpeg_exe = "ffmpeg"
+        formats = []
+
+        def fake_download(url, ydl_opts, on_metadata=None, prefetched=None):
+            formats.append(ydl_opts['format'])
+            path = ydl_opts['outtmpl'].replace('%(ext)s', 'm4a')
+            with open(path, "wb") as f:
+                f.write(b"m4a")
+            return {'filepath': path, 'title': 'Song'}
+
+        with patch.object(downloader, "_download_with_ytdlp", side_effect=fake_download), \
+                patch("asyncio.create_subprocess_exec") as exec_mock:
+            result = await downloader.download_audio(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ", str(tmp_path), output_format="m4a"
+            )
+
+        exec_mock.assert_not_called()
+        assert formats == ["bestaudio[ext=m4a]/bestaudio/best"]
+        assert result.filename == "dQw4w9WgXcQ_192_m4a.m4a"
+        assert not result.metadata.converted_to_mp3
+
+
+class TestConvertAudio:
+    """Test cases for AudioDownloader._convert_audio()."""
+
+    @pytest.mark.asyncio
+    async def test_failed_encode_leaves_no_output(self, downloader, tmp_path):
+        """Test that a failed FFmpeg run removes its partial .tmp output."""
+        downloader._ffmpeg_exe = "ffmpeg"
+        source = tmp_path / "abc.webm"
+        source.write_bytes(b"webm")
+
+        class FakeProcess:
+            returncode = 1
+
+            async def communicate(self):
+                return None, b"Invalid data found"
+
+        async def fake_exec(*argv, **kwargs):
+            assert argv[-1].endswith("abc.mp3.tmp")
+            with open(argv[-1], "wb") as f:
+                f.write(b"partial")
+            return FakeProcess()
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+            with pytest.raises(AudioDownloadError, match="Invalid data found"):
+                await downloader._convert_audio(source, "mp3", ("-c:a", "libmp3lame"))
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["abc.webm"]
+
+
+class TestFindDownloadedFile:
+    """Test cases for AudioDownloader._find_downloaded_file()."""
+
+    def test_prefers_formats_by_rank_and_skips_partial_files(self, tmp_path):
+        """Test that the best-ranked finished file is returned with its size."""
+        for name, data in [("abc.webm", b"webm"), ("abc.m4a", b"m4a!!"), ("abc.mp3.part", b"p"), ("other.mp3", b"x")]:
+            (tmp_path / name).write_bytes(data)
+
+        path, size = AudioDownloader._find_downloaded_file(str(tmp_path), "abc")
+
+        assert path.name == "abc.m4a"
+        assert size == 5
+        assert AudioDownloader._find_downloaded_file(str(tmp_path), "missing") is None
+
+
+class TestGetPlaylistEntries:
+    """Test cases for flat playlist listing."""
+
+    @pytest.mark.asyncio
+    async def test_flat_entries_are_summarized(self, downloader):
+        """Test that flat playlist entries are returned without per-video extraction."""
+        flat = {
+            '_type': 'playlist',
+            'entries': [
+                {'id': 'dQw4w9WgXcQ', 'title': 'One', 'url': 'https://www.youtube.com/watch?v=dQw4w9WgXcQ'},
+                None,
+                {'id': 'abcdefghijk', 'title': 'Two', 'url': 'https://www.youtube.com/watch?v=abcdefghijk', 'duration': 60},
+            ],
+        }
+
+        with patch.object(yt_dlp.YoutubeDL, "extract_info", return_value=flat) as extract:
+            entries = await downloader.get_playlist_entries("https://www.youtube.com/playlist?list=PL1")
+
+        assert extract.call_count == 1
+        assert [e['id'] for e in entries] == ['dQw4w9WgXcQ', 'abcdefghijk']
+        assert entries[1]['duration'] == 60
@@ -0,0 +1,158 @@
+"""
+Tests for the audio trimming service.
+
+ffprobe/ffmpeg are patched out, so no binaries are needed.
+"""
+
+import json
+import pytest
+import subprocess
+from unittest.mock import patch
+
+from services.audio_trimmer import (
+    AudioProbe,
+    AudioTrimError,
+    _Cut,
+    _can_stream_copy,
+    _probe_audio,
+    _run_ffmpeg_trims,
+    _find_audio_file,
+    _write_metadata,
+    get_audio_file_path,
+    trim_audio_async,
+)
+
+
+def _completed(stdout="", returncode=0, stderr=""):
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr=stderr)
+
+
+class TestProbeAudio:
+    """Test cases for _probe_audio()."""
+
+    def test_reads_duration_and_stream_details(self, tmp_path):
+        """Test that ffprobe JSON output is parsed into an AudioProbe."""
+        output = json.dumps({
+            "streams": [{"codec_name": "mp3", "bit_rate": "192000", "sample_rate": "44100"}],
+            "format": {"duration": "20.040000"},
+        })
+        with patch("services.audio_trimmer.subprocess.run", return_value=_completed(output)):
+            probe = _probe_audio(tmp_path / "a.mp3")
+
+        assert probe == AudioProbe(duration=20.04, codec_name="mp3", bit_rate=192000, sample_rate=44100)
+
+    def test_ffprobe_failure_raises(self, tmp_path):
+        """Test that a failing ffprobe surfaces as AudioTrimError."""
+        with patch(
+            "services.audio_trimmer.subprocess.run",
+            return_value=_completed(returncode=1, stderr="Invalid data found")
+        ):
+            with pytest.raises(AudioTrimError, match="Invalid data found"):
+                _probe_audio(tmp_path / "a.mp3")
+
+
+class TestCanStreamCopy:
+    """Test cases for _can_stream_copy()."""
+
+    @pytest.mark.parametrize("probe, quality, expected", [
+        (AudioProbe(10.0, "mp3", 192000, 44100), "192k", True),
+        (AudioProbe(10.0, "mp3", 190000, 44100), "192k", True),
+        (AudioProbe(10.0, "mp3", 192000, 44100), "128k", False),
+        (AudioProbe(10.0, "aac", 192000, 44100), "192k", False),
+        (AudioProbe(10.0, "mp3", None, 44100), "192k", False),
+    ])
+    def test_only_matching_mp3_sources_are_copied(self, probe, quality, expected):
+        """Test that stream copy needs an MP3 within tolerance of the requested bitrate."""
+        assert _can_stream_copy(probe, quality) is expected
+
+
+class TestRunFfmpegTrims:
+    """Test cases for _run_ffmpeg_trims()."""
+
+    def test_all_cuts_share_one_seeked_input(self, tmp_path):
+        """Test that several cuts become one ffmpeg run with per-output offsets."""
+        cuts = [
+            _Cut(tmp_path / "a.mp3", 10.0, 5.0, ("-c:a", "copy")),
+            _Cut(tmp_path / "b.mp3", 4.0, 2.0, ("-c:a", "libmp3lame", "-b:a", "128k")),
+        ]
+        with patch("services.audio_trimmer.subprocess.run", return_value=_completed()) as run:
+            _run_ffmpeg_trims(tmp_path / "src.mp3", cuts)
+
+        cmd = run.call_args.args[0]
+        assert cmd.count("-i") == 1
+        assert cmd[cmd.index("-i") - 1] == "4.0"
+        first = cmd.index(str(tmp_path / "a.mp3"))
+        assert cmd[cmd.index("-ss", cmd.index("-i")):first][:2] == ["-ss", "6.0"]
+        assert cmd[first + 1:][:2] == ["-t", "2.0"]
+
+
+class TestGetAudioFilePath:
+    """Test cases for get_audio_file_path()."""
+
+    @pytest.fixture(autouse=True)
+    def audio_dir(self, tmp_path):
+        _find_audio_file.cache_clear()
+        with patch("services.audio_trimmer.AUDIO_DIR", str(tmp_path)):
+            yield tmp_path
+        _find_audio_file.cache_clear()
+
+    def test_prefers_mp3(self, audio_dir):
+        """Test that .mp3 wins over other extensions for the same id."""
+        (audio_dir / "abc.webm").write_bytes(b"")
+        (audio_dir / "abc.mp3").write_bytes(b"")
+
+        assert get_audio_file_path("abc") == audio_dir / "abc.mp3"
+
+    def test_miss_is_not_cached(self, audio_dir):
+        """Test that a file added without a directory mtime change is still found."""
+        with patch("services.audio_trimmer.os.stat") as stat:
+            stat.return_value.st_mtime_ns = 1
+            assert get_audio_file_path("abc") is None
+
+            (audio_dir / "abc.mp3").write_bytes(b"")
+            assert get_audio_file_path("abc") == audio_dir / "abc.mp3"
+
+    def test_missing_directory_returns_none(self, audio_dir):
+        """Test that a missing audio directory is a miss, not an error."""
+        with patch("services.audio_trimmer.AUDIO_DIR", str(audio_dir / "missing")):
+            assert get_audio_file_path("abc") is None
+
+
+class TestWriteMetadata:
+    """Test cases for _write_metadata()."""
+
+    def test_writes_json_and_leaves_no_temp_file(self, tmp_path):
+        """Test that metadata is published under its final name only."""
+        metadata_path = tmp_path / "abc_metadata.json"
+        _write_metadata(str(metadata_path), {"trimmed_audio_id": "abc", "duration": 1.5})
+
+        assert json.loads(metadata_path.read_text()) == {"trimmed_audio_id": "abc", "duration": 1.5}
+        assert [p.name for p in tmp_path.iterdir()] == ["abc_metadata.json"]
+
+    def test_failed_write_removes_temp_file(self, tmp_path):
+        """Test that a failed write leaves neither a temp nor a partial file."""
+        with patch("services.audio_trimmer.os.fsync", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                _write_metadata(str(tmp_path / "abc_metadata.json"), {"a": 1})
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestTrimAudioAsync:
+    """Test cases for trim_audio_async()."""
+
+    def test_runs_trim_on_worker_thread(self):
+        """Test that the returned future resolves to trim_audio()'s result."""
+        result = ("new-id", "/audio/new-id.mp3", {"duration": 5.0})
+        with patch("services.audio_trimmer.trim_audio", return_value=result) as trim:
+            future = trim_audio_async("abc-123", 0.0, 5.0)
+            assert future.result(timeout=5) == result
+
+        trim.assert_called_once_with("abc-123", 0.0, 5.0, "192k")
+
+    def test_errors_surface_through_future(self):
+        """Test that trim errors are raised from future.result()."""
+        with patch("services.audio_trimmer.trim_audio", side_effect=AudioTrimError("not found")):
+            future = trim_audio_async("missing", 0.0, 5.0)
+            with pytest.raises(AudioTrimError, match="not found"):
+                future.result(timeout=5)
@@ -16,6 +16,8 @@ import io
 import os
 import tempfile
 import shutil
+import threading
+from unittest.mock import patch
 
 from services.file_upload import FileUploadService, FileUploadError
 
@@ -125,6 +127,21 @@ async def test_validate_format_extension_mismatch(upload_service, create_test_im
     assert fmt == "PNG"
 
 
+@pytest.mark.parametrize("format", ["JPEG", "PNG", "WEBP"])
+def test_validate_magic_recognizes_supported_formats(create_test_image, format):
+    """Test that supported formats are identified from their first 12 bytes"""
+    image_bytes = create_test_image(format=format)
+
+    assert FileUploadService.validate_magic(image_bytes[:12]) == format
+
+
+def test_validate_magic_rejects_other_data(create_test_image):
+    """Test that non-image and unsupported image signatures are rejected"""
+    assert FileUploadService.validate_magic(b"Not an image") is None
+    assert FileUploadService.validate_magic(create_test_image(format="GIF")[:12]) is None
+    assert FileUploadService.validate_magic(b"") is None
+
+
 # ============================================================================
 # Subtask 2: Thumbnail Generation Tests
 # ============================================================================
@@ -200,6 +217,24 @@ async def test_generate_thumbnail_creates_parent_dir(upload_service, create_test
     assert thumb_path.parent.exists()
 
 
+@pytest.mark.asyncio
+async def test_generate_thumbnail_runs_off_event_loop(upload_service, create_test_image, temp_upload_dir):
+    """Test that Pillow work runs in a worker thread, not on the event loop"""
+    image_bytes = create_test_image(format="JPEG")
+    thumb_path = Path(temp_upload_dir) / "test_thumb.jpg"
+    threads = []
+    save_thumbnail = upload_service._save_thumbnail
+
+    def record_thread(*args):
+        threads.append(threading.current_thread())
+        return save_thumbnail(*args)
+
+    with patch.object(upload_service, "_save_thumbnail", side_effect=record_thread):
+        await upload_service.generate_thumbnail(image_bytes, thumb_path)
+
+    assert threads and threads[0] is not threading.main_thread()
+
+
 # ============================================================================
 # Subtask 3: File Size Validation Tests
 # ============================================================================
@@ -295,6 +330,18 @@ async def test_save_to_storage_filename_sanitization(upload_service, create_test
     assert os.path.exists(file_path)
 
 
+@pytest.mark.asyncio
+async def test_save_to_storage_session_id_hashes_whole_file(upload_service, create_test_image):
+    """Test that files sharing their first 1KB still get different session IDs"""
+    image_bytes = create_test_image(format="JPEG")
+    altered_bytes = image_bytes[:-10] + bytes(10)
+
+    _, session_a = await upload_service.save_to_storage(image_bytes, "a.jpg")
+    _, session_b = await upload_service.save_to_storage(altered_bytes, "b.jpg")
+
+    assert session_a.split("_")[-1] != session_b.split("_")[-1]
+
+
 @pytest.mark.asyncio
 async def test_cleanup_session_removes_files(upload_service, create_test_image):
     """Test that cleanup removes all session files"""
@@ -321,6 +368,12 @@ async def test_cleanup_session_removes_files(upload_service, create_test_image):
     assert not os.path.exists(Path(file_path1).parent)
 
 
+@pytest.mark.asyncio
+async def test_cleanup_session_missing_session(upload_service):
+    """Test that cleaning up an unknown session is a no-op"""
+    await upload_service.cleanup_session("nonexistent_session")
+
+
 @pytest.mark.asyncio
 async def test_get_session_files_lists_files(upload_service, create_test_image):
     """Test listing files in a session"""
@@ -390,6 +443,20 @@ async def test_process_upload_invalid_format(upload_service):
     assert result["error"] is not None
 
 
+@pytest.mark.asyncio
+async def test_process_upload_bad_signature_skips_decode(upload_service):
+    """Test that data without an image signature never reaches Pillow"""
+    with patch("services.file_upload.Image.open") as image_open:
+        result = await upload_service.process_upload(
+            file_content=b"GIF89a" + bytes(100),
+            filename="test.jpg"
+        )
+
+    image_open.assert_not_called()
+    assert result["success"] is False
+    assert "unrecognized file signature" in result["error"]
+
+
 @pytest.mark.asyncio
 async def test_process_upload_file_too_large(upload_service):
     """Test upload process with file exceeding size limit"""
@@ -452,6 +519,152 @@ async def test_process_upload_webp_format(upload_service, create_test_image):
     assert result["format"] == "WEBP"
 
 
+@pytest.mark.asyncio
+async def test_process_upload_decodes_image_once(upload_service, create_test_image):
+    """Test that validation and thumbnailing share a single Image.open"""
+    image_bytes = create_test_image(format="JPEG", size=(1920, 1080))
+
+    with patch("services.file_upload.Image.open", wraps=Image.open) as image_open:
+        result = await upload_service.process_upload(
+            file_content=image_bytes,
+            filename="product.jpg"
+        )
+
+    assert result["success"] is True
+    assert result["thumbnail_path"] is not None
+    assert image_open.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_process_upload_large_jpeg_decoded_at_reduced_scale(upload_service, create_test_image):
+    """Test that large JPEGs are draft-decoded but still get a full-size thumbnail"""
+    image_bytes = create_test_image(format="JPEG", size=(4800, 2700))
+
+    img, fmt, error = upload_service._decode_once(image_bytes, "big.jpg", draft_size=(300, 300))
+    with img:
+        assert fmt == "JPEG"
+        assert img.size == (600, 338)
+
+    result = await upload_service.process_upload(file_content=image_bytes, filename="big.jpg")
+
+    with Image.open(result["thumbnail_path"]) as thumb:
+        assert thumb.size == (300, 169)
+
+
+@pytest.mark.asyncio
+async def test_process_upload_duplicate_content_is_copied(upload_service, create_test_image):
+    """Test that re-uploading identical bytes copies instead of reprocessing"""
+    image_bytes = create_test_image(format="JPEG", size=(1920, 1080))
+
+    first = await upload_service.process_upload(
+        file_content=image_bytes, filename="product.jpg", session_id="first"
+    )
+    with patch("services.file_upload.Image.open") as image_open:
+        second = await upload_service.process_upload(
+            file_content=image_bytes, filename="copy.jpg", session_id="second"
+        )
+
+    image_open.assert_not_called()
+    assert second["success"] is True
+    assert second["format"] == "JPEG"
+    assert second["file_path"].endswith(os.path.join("second", "copy.jpg"))
+    assert not os.path.samefile(first["file_path"], second["file_path"])
+    assert Path(second["file_path"]).read_bytes() == image_bytes
+    assert Path(second["thumbnail_path"]).read_bytes() == Path(first["thumbnail_path"]).read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_process_upload_overwrite_does_not_touch_other_sessions(upload_service, create_test_image):
+    """Test that overwriting a reused upload leaves the earlier session and cache intact"""
+    image_a = create_test_image(format="JPEG", color=(255, 0, 0))
+    image_b = create_test_image(format="JPEG", color=(0, 0, 255))
+
+    first = await upload_service.process_upload(file_content=image_a, filename="product.jpg", session_id="s1")
+    first_thumb = Path(first["thumbnail_path"]).read_bytes()
+    await upload_service.process_upload(file_content=image_a, filename="product.jpg", session_id="s2")
+    await upload_service.process_upload(file_content=image_b, filename="product.jpg", session_id="s2")
+
+    assert Path(first["file_path"]).read_bytes() == image_a
+    assert Path(first["thumbnail_path"]).read_bytes() == first_thumb
+
+    again = await upload_service.process_upload(file_content=image_a, filename="product.jpg", session_id="s3")
+    assert Path(again["file_path"]).read_bytes() == image_a
+
+
+@pytest.mark.asyncio
+async def test_process_upload_changed_cached_file_is_not_reused(upload_service, create_test_image):
+    """Test that a cached file modified after upload is reprocessed, not copied"""
+    image_bytes = create_test_image(format="JPEG")
+
+    first = await upload_service.process_upload(file_content=image_bytes, filename="a.jpg", session_id="s1")
+    Path(first["file_path"]).write_bytes(b"tampered")
+
+    second = await upload_service.process_upload(file_content=image_bytes, filename="a.jpg", session_id="s2")
+
+    assert second["success"] is True
+    assert Path(second["file_path"]).read_bytes() == image_bytes
+
+
+@pytest.mark.asyncio
+async def test_process_upload_duplicate_after_cleanup(upload_service, create_test_image):
+    """Test that a cleaned-up earlier upload is processed again, not linked"""
+    image_bytes = create_test_image(format="JPEG")
+
+    await upload_service.process_upload(file_content=image_bytes, filename="a.jpg", session_id="gone")
+    await upload_service.cleanup_session("gone")
+
+    result = await upload_service.process_upload(
+        file_content=image_bytes, filename="a.jpg", session_id="fresh"
+    )
+
+    assert result["success"] is True
+    assert os.path.exists(result["file_path"])
+    assert os.path.exists(result["thumbnail_path"])
+
+
+@pytest.mark.asyncio
+async def test_process_upload_save_failure_removes_thumbnail(upload_service, create_test_image, temp_upload_dir):
+    """Test that a thumbnail made alongside a failed save is not left behind"""
+    image_bytes = create_test_image(format="JPEG")
+
+    with patch.object(upload_service, "save_to_storage", side_effect=FileUploadError("disk full")):
+        result = await upload_service.process_upload(
+            file_content=image_bytes, filename="product.jpg", session_id="failed"
+        )
+
+    assert result["success"] is False
+    assert "disk full" in result["error"]
+    assert not os.path.exists(Path(temp_upload_dir) / "failed" / "thumb_product.jpg")
+
+
+@pytest.mark.asyncio
+async def test_process_upload_thumbnail_failure_is_non_fatal(upload_service, create_test_image):
+    """Test that the upload still succeeds when the concurrent thumbnail fails"""
+    image_bytes = create_test_image(format="JPEG")
+
+    with patch.object(upload_service, "_save_thumbnail", side_effect=OSError("encoder error")):
+        result = await upload_service.process_upload(file_content=image_bytes, filename="product.jpg")
+
+    assert result["success"] is True
+    assert os.path.exists(result["file_path"])
+    assert result["thumbnail_path"] is None
+
+
+@pytest.mark.asyncio
+async def test_process_upload_truncated_image(upload_service, create_test_image):
+    """Test that a truncated image is rejected before anything is saved"""
+    image_bytes = create_test_image(format="PNG", size=(800, 600))
+
+    result = await upload_service.process_upload(
+        file_content=image_bytes[:len(image_bytes) // 2],
+        filename="truncated.png"
+    )
+
+    assert result["success"] is False
+    assert result["file_path"] is None
+    assert "Invalid or corrupted image file" in result["error"]
+
+
 # ============================================================================
 # Run tests
 # ============================================================================
@@ -314,8 +314,8 @@ class TestDownloadOutput:
 
     def test_download_output_success(self, replicate_client):
         """Test successful output download."""
-        mock_output = Mock(spec=FileOutput)
-        mock_output.read = Mock(return_value=b"test data")
+        mock_output = MagicMock(spec=FileOutput)
+        mock_output.__iter__.return_value = iter([b"test ", b"data"])
 
         with tempfile.TemporaryDirectory() as tmpdir:
             save_path = Path(tmpdir) / "output.webp"
@@ -327,8 +327,8 @@ class TestDownloadOutput:
 
     def test_download_output_creates_directories(self, replicate_client):
         """Test that download creates parent directories."""
-        mock_output = Mock(spec=FileOutput)
-        mock_output.read = Mock(return_value=b"test data")
+        mock_output = MagicMock(spec=FileOutput)
+        mock_output.__iter__.return_value = iter([b"test ", b"data"])
 
         with tempfile.TemporaryDirectory() as tmpdir:
             save_path = Path(tmpdir) / "subdir" / "nested" / "output.webp"
@@ -1,11 +1,14 @@
 """
 Tests for S3 storage service validation functions.
 
-Tests the validate_s3_key() function which ensures S3 keys are not URLs.
+Tests the validate_s3_key() function which ensures S3 keys are not URLs,
+presigned URL caching and presigned POST policies in S3StorageService.
 """
 
 import pytest
-from services.s3_storage import validate_s3_key
+from unittest.mock import MagicMock, patch
+from botocore.exceptions import ClientError
+from services.s3_storage import S3StorageService, validate_s3_key
 
 
 class TestValidateS3Key:
@@ -86,3 +89,95 @@ class TestValidateS3Key:
         # Should truncate to first 50 chars
         assert len(str(exc_info.value)) < len(long_url) + 100
 
+
+class TestPresignedUrlCache:
+    """Test cases for S3StorageService.generate_presigned_url() caching."""
+
+    @pytest.fixture
+    def service(self):
+        service = S3StorageService()
+        service.s3_client = MagicMock()
+        service.s3_client.generate_presigned_url.side_effect = (
+            lambda op, Params, ExpiresIn: f"https://signed/{Params['Key']}?n={service.s3_client.generate_presigned_url.call_count}"
+        )
+        return service
+
+    def test_repeat_calls_within_window_are_cached(self, service):
+        """Test that the same key is only signed once within a cache window."""
+        with patch("services.s3_storage.time.time", return_value=10_000):
+            first = service.generate_presigned_url("mv/projects/1/a.mp4", expiry=3600)
+            second = service.generate_presigned_url("mv/projects/1/a.mp4", expiry=3600)
+
+        assert first == second
+        assert service.s3_client.generate_presigned_url.call_count == 1
+
+    def test_new_window_signs_again(self, service):
+        """Test that a URL is re-signed once half its expiry has passed."""
+        with patch("services.s3_storage.time.time", return_value=10_000):
+            first = service.generate_presigned_url("mv/projects/1/a.mp4", expiry=3600)
+        with patch("services.s3_storage.time.time", return_value=10_000 + 1800):
+            second = service.generate_presigned_url("mv/projects/1/a.mp4", expiry=3600)
+
+        assert first != second
+        assert service.s3_client.generate_presigned_url.call_count == 2
+
+    def test_different_keys_are_signed_separately(self, service):
+        """Test that distinct keys get distinct URLs."""
+        a = service.generate_presigned_url("mv/projects/1/a.mp4", expiry=3600)
+        b = service.generate_presigned_url("mv/projects/1/b.mp4", expiry=3600)
+
+        assert a != b
+
+
+class TestPresignedPost:
+    """Test cases for S3StorageService.generate_presigned_post() policies."""
+
+    @pytest.fixture
+    def service(self):
+        service = S3StorageService()
+        service.s3_client = MagicMock()
+        service.s3_client.generate_presigned_post.return_value = {
+            "url": "https://bucket.s3.amazonaws.com/",
+            "fields": {"key": "character_references/a.png"}
+        }
+        return service
+
+    def test_policy_locks_content_type_and_size(self, service):
+        """Test that the POST policy pins the key, content type and size range."""
+        post = service.generate_presigned_post(
+            "character_references/a.png",
+            content_type="image/png",
+            max_size=1024,
+            expiry=600
+        )
+
+        assert post["url"] == "https://bucket.s3.amazonaws.com/"
+        service.s3_client.generate_presigned_post.assert_called_once_with(
+            Bucket=service.bucket_name,
+            Key="character_references/a.png",
+            Fields={"Content-Type": "image/png"},
+            Conditions=[
+                {"Content-Type": "image/png"},
+                ["content-length-range", 1, 1024]
+            ],
+            ExpiresIn=600
+        )
+
+    def test_no_size_condition_without_max_size(self, service):
+        """Test that only the content type is enforced when no max size is given."""
+        with patch("services.s3_storage.settings.PRESIGNED_URL_EXPIRY", 3600):
+            service.generate_presigned_post("character_references/a.webp", content_type="image/webp")
+
+        kwargs = service.s3_client.generate_presigned_post.call_args.kwargs
+        assert kwargs["Conditions"] == [{"Content-Type": "image/webp"}]
+        assert kwargs["ExpiresIn"] == 3600
+
+    def test_client_error_is_raised(self, service):
+        """Test that S3 client errors surface as a generation failure."""
+        service.s3_client.generate_presigned_post.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "denied"}},
+            "PostObject"
+        )
+
+        with pytest.raises(Exception, match="Failed to generate presigned POST"):
+            service.generate_presigned_post("character_references/a.png", content_type="image/png")
@@ -1,15 +1,24 @@
 """
-Tests for character reference image upload endpoint.
+Tests for character reference image upload endpoints.
 
 Run with: pytest test_upload_character_reference.py
-Requires the backend server to be running on port 8000
+The /upload_character_reference tests require the backend server to be
+running on port 8000; the /character_reference_upload_url tests call the
+endpoint in-process with S3 mocked.
 """
 
+import asyncio
 import requests
 import json
 import io
+import pytest
+from unittest.mock import MagicMock, patch
+from fastapi import HTTPException
 from PIL import Image
 
+from mv_schemas import CharacterReferenceUploadUrlRequest
+from routers.mv import CHARACTER_REFERENCE_MAX_SIZE, create_character_reference_upload_url
+
 
 BASE_URL = "http://localhost:8000"
 API_URL = f"{BASE_URL}/api/mv"
@@ -96,6 +105,53 @@ def test_upload_character_reference_file_too_large():
     print("✓ File too large correctly rejected")
 
 
+def test_character_reference_upload_url_success():
+    """Test that a presigned POST is returned for the S3 backend."""
+    s3_service = MagicMock()
+    s3_service.generate_presigned_post.return_value = {
+        "url": "https://bucket.s3.amazonaws.com/",
+        "fields": {"key": "character_references/x.jpg", "Content-Type": "image/jpeg"}
+    }
+
+    with patch("routers.mv.settings.STORAGE_BACKEND", "s3"), \
+            patch("routers.mv.settings.STORAGE_BUCKET", "bucket"), \
+            patch("routers.mv.get_s3_storage_service", return_value=s3_service):
+        response = asyncio.run(create_character_reference_upload_url(
+            CharacterReferenceUploadUrlRequest(content_type="image/jpeg")
+        ))
+
+    data = json.loads(response.body)
+    assert response.status_code == 200
+    assert data["s3_key"] == f"character_references/{data['image_id']}.jpg"
+    assert data["upload_url"] == "https://bucket.s3.amazonaws.com/"
+    assert data["fields"]["Content-Type"] == "image/jpeg"
+    s3_service.generate_presigned_post.assert_called_once_with(
+        data["s3_key"],
+        content_type="image/jpeg",
+        max_size=CHARACTER_REFERENCE_MAX_SIZE
+    )
+
+
+def test_character_reference_upload_url_rejects_non_s3_backend():
+    """Test that backends without presigned POST support get a 501."""
+    with patch("routers.mv.settings.STORAGE_BACKEND", "firebase"), \
+            patch("routers.mv.settings.STORAGE_BUCKET", "bucket"), \
+            patch("routers.mv.get_s3_storage_service") as get_service:
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(create_character_reference_upload_url(
+                CharacterReferenceUploadUrlRequest(content_type="image/png")
+            ))
+
+    assert exc_info.value.status_code == 501
+    get_service.assert_not_called()
+
+
+def test_character_reference_upload_url_invalid_content_type():
+    """Test that non-image content types are rejected by the request model."""
+    with pytest.raises(ValueError):
+        CharacterReferenceUploadUrlRequest(content_type="text/plain")
+
+
 if __name__ == "__main__":
     print("Character Reference Upload Endpoint Tests")
     print("=" * 60)
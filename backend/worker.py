@@ -32,6 +32,7 @@ from pipeline.error_handler import (
     get_retry_delay,
     categorize_error
 )
+from pipeline.asset_manager import AssetManager
 from pipeline.orchestrator import create_pipeline_orchestrator
 from services.asset_persistence import AssetPersistenceService
 import asyncio
@@ -316,7 +317,8 @@ class VideoGenerationWorker:
 
             # Execute the pipeline (async)
             try:
-                final_video = asyncio.run(orchestrator.execute_pipeline(
+                final_video = asyncio.run(self._execute_pipeline(
+                    orchestrator,
                     product_name=product_name,
                     style=style,
                     cta_text=cta_text,
@@ -429,6 +431,19 @@ class VideoGenerationWorker:
                 traceback=traceback.format_exc()
             )
 
+    async def _execute_pipeline(self, orchestrator, **params) -> str:
+        """
+        Run the pipeline inside this job's event loop.
+        
+        Each job gets a fresh loop from asyncio.run(), so the pooled download
+        session (bound to the loop that created it) is closed before the loop
+        ends rather than leaked when the next job replaces it.
+        """
+        try:
+            return await orchestrator.execute_pipeline(**params)
+        finally:
+            await AssetManager.close_http_session()
+
     async def _persist_job_assets(self, job_id: str, final_video_path: str) -> Dict[str, any]:
         """
         Persist all job assets to cloud storage.
@@ -438,7 +453,8 @@ class VideoGenerationWorker:
             final_video_path: Path to final video (may be relative or absolute)
             
         Returns:
-            Dict with cloud URLs for all assets
+            Dict with cloud paths for all assets, plus a presigned
+            "final_video_url" when a final video was uploaded
         """
         try:
             logger.info("persisting_job_assets", job_id=job_id)
@@ -463,10 +479,16 @@ class VideoGenerationWorker:
                 local_base_path=local_base_path
             )
             
+            # Only the final video needs a URL right away
+            if cloud_urls.get("final_video"):
+                cloud_urls["final_video_url"] = await persistence_service.presign(
+                    cloud_urls["final_video"]
+                )
+            
             logger.info(
                 "job_assets_persisted",
                 job_id=job_id,
-                final_video_url=cloud_urls.get("final_video")
+                final_video=cloud_urls.get("final_video")
             )
             
             return cloud_urls
@@ -484,25 +506,25 @@ class VideoGenerationWorker:
 
     def _update_job_with_cloud_urls(self, job_id: str, cloud_urls: Dict[str, any]):
         """
-        Update job record with cloud storage URLs.
+        Update job record with cloud storage paths and the final video URL.
         
         Args:
             job_id: Job identifier
-            cloud_urls: Dict of cloud URLs from persistence service
+            cloud_urls: Dict of cloud paths from persistence service; stored
+                as-is in Job.cloud_urls and presigned where it is read
         """
         try:
             with get_db_context() as db:
                 job = db.query(Job).filter(Job.id == job_id).first()
                 if job:
-                    # Store cloud URLs in job metadata
-                    # Note: This requires the Job model to have appropriate fields
-                    # For now, we'll store in a JSON field if available
+                    # Store cloud paths in job metadata; presigned URLs
+                    # would expire, so readers presign them on demand
                     if hasattr(job, 'cloud_urls'):
                         job.cloud_urls = cloud_urls
                     
                     # Store final video URL as primary video_url
-                    if cloud_urls.get("final_video"):
-                        job.video_url = cloud_urls["final_video"]
+                    if cloud_urls.get("final_video_url"):
+                        job.video_url = cloud_urls["final_video_url"]
                     
                     # Initialize version tracking
                     if hasattr(job, 'version') and job.version is None:
@@ -514,7 +536,7 @@ class VideoGenerationWorker:
                     logger.info(
                         "job_cloud_urls_updated",
                         job_id=job_id,
-                        video_url=cloud_urls.get("final_video")
+                        video_url=cloud_urls.get("final_video_url")
                     )
                 else:
                     logger.warning("job_not_found_for_url_update", job_id=job_id)